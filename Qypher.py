@@ -1,20 +1,42 @@
 import sys
 import os
+import gc
 import json
-import requests
+import time
+import zlib
+import struct
+import argparse
+import getpass
+import hashlib
+import threading
+import queue
+import random
+import bisect
+import traceback
+import re
 import zipfile
 import io
 import shutil
-import webbrowser
-import subprocess
+import functools
+import importlib
 from pathlib import Path
+from collections import OrderedDict
+from datetime import datetime
+from contextlib import contextmanager, nullcontext
+from urllib.parse import urlsplit, parse_qs
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Everything before this line is cheap, the rest of the import is what startup times measure
+MODULE_IMPORT_STARTED = time.time_ns() // 1000
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QHBoxLayout, QListWidget, QPushButton, QLabel, 
-                               QSystemTrayIcon, QMenu, QStyle, QMessageBox, QProgressBar,
-                               QComboBox, QCheckBox, QFrame, QStackedWidget, QSizePolicy,
-                               QListWidgetItem, QLineEdit, QDialog, QDialogButtonBox, QFormLayout)
-from PySide6.QtCore import Qt, QThread, Signal, QSize, QSettings, QStandardPaths
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont, QAction, QPalette, QGuiApplication
+                               QSystemTrayIcon, QMenu, QMessageBox, QProgressBar,
+                               QComboBox, QCheckBox, QFrame, QListWidgetItem, QLineEdit,
+                               QDialog, QDialogButtonBox, QFormLayout, QFileDialog, QSpinBox, QPlainTextEdit)
+from PySide6.QtCore import Qt, QThread, QObject, QTimer, Signal, QSize, QSettings
+from PySide6.QtNetwork import QNetworkInformation, QLocalServer, QLocalSocket
+from PySide6.QtGui import (QIcon, QImage, QPixmap, QPainter, QColor, QBrush, QFont, QAction, QPalette,
+                           QGuiApplication, QShortcut, QKeySequence)
 
 APP_NAME = "Qypher Launcher"
 ORGANIZATION = "QKing-Official"
@@ -23,29 +45,621 @@ DEFAULT_MANIFEST_URL = f"{DEFAULT_REPO_URL}/raw/refs/heads/main/manifest.json"
 LAUNCHER_REPO_URL = "https://github.com/QKing-Official/Qypher"
 DEFAULT_INSTALL_DIR = os.path.join(os.environ.get("APPDATA", ""), "Qypher", "Apps")
 ICON_CACHE = os.path.join(os.environ.get("APPDATA", ""), "Qypher", "icons")
+ARTIFACT_CACHE = os.path.join(os.environ.get("APPDATA", ""), "Qypher", "artifacts")
+MANIFEST_CACHE = os.path.join(os.environ.get("APPDATA", ""), "Qypher", "manifests")
+GITHUB_CACHE = os.path.join(os.environ.get("APPDATA", ""), "Qypher", "github")
+STALL_REPORT = os.path.join(os.environ.get("APPDATA", ""), "Qypher", "stalls.json")
+MIRROR_STATS = os.path.join(os.environ.get("APPDATA", ""), "Qypher", "mirrors.json")
+LAUNCH_STATS = os.path.join(os.environ.get("APPDATA", ""), "Qypher", "launches.json")
 LAUNCHER_VERSION = "v1.0.0"
+LOCKFILE_VERSION = 1
+BUNDLE_VERSION = 1
+BUNDLE_INDEX = "bundle.json"
+STAGING_DIR_NAME = ".staging"
+NETWORK_SLOT = "network"
+DISK_SLOT = "disk"
+DEFAULT_NETWORK_JOBS = 6
+DEFAULT_DISK_JOBS = 2
+PIPELINE_BUFFER = 2
+PRESTAGE_IDLE_SECONDS = 300
+PRESTAGE_POLL_MS = 60000
+TRAFFIC_FOREGROUND = "foreground"
+TRAFFIC_BACKGROUND = "background"
+DEFAULT_FOREGROUND_KBPS = 0
+DEFAULT_BACKGROUND_KBPS = 1024
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+DELTA_MAGIC = b"QDLT1"
+DELTA_BLOCK_SIZE = 64
+WORKER_CONSUME_BATCH = 256 * 1024
+SINGLE_INSTANCE_TIMEOUT_MS = 250
+DEFAULT_ARTIFACT_CACHE_MB = 2048
+DISK_SPACE_MARGIN = 64 * 1024 * 1024
+ICON_SIZE = 32
+ICON_MEMORY_CACHE = 256
+ICON_WORKERS = 4
+GITHUB_API_URL = os.environ.get("QYPHER_GITHUB_API_URL", "https://api.github.com")
+GITHUB_CACHE_SECONDS = 300
+GITHUB_LOW_BUDGET = 0.2
+GITHUB_RESERVED_CALLS = 10
+RELEASE_CHECK_TICK_MS = 30000
+RELEASE_TTL_MIN = 30 * 60
+RELEASE_TTL_MAX = 24 * 60 * 60
+RELEASE_TTL_JITTER = 0.2
+TRAY_TRIM_DELAY_MS = 60000
+RANGE_READ_BUFFER = 256 * 1024
+STALL_THRESHOLD_MS = 200
+STALL_HEARTBEAT_MS = 50
+STALL_BUCKETS_MS = [250, 500, 1000, 2000, 5000]
+STALL_STACK_DEPTH = 12
+STALL_TOP_STACKS = 10
+STALL_SUSPEND_SECONDS = 30
+PEER_CACHE_PORT = 47800
+PEER_CONNECT_TIMEOUT = 2
+PEER_FETCH_STALL_SECONDS = 30
+PEER_UPSTREAM_PREFIXES = ("https://github.com/",)
+MIRROR_SMOOTHING = 0.3
+MIRROR_MIN_SAMPLE = 256 * 1024
+MIRROR_MAX_FAILURES = 3
+MIRROR_FAILURE_COOLDOWN = 10 * 60
+MIRROR_PROBE_SECONDS = 5
+MIRROR_SWITCH_FACTOR = 2
+PEER_ARTIFACT_PATTERN = re.compile(r"/artifacts/([0-9a-f]{64})\.([a-z0-9]{1,8})")
+PRIORITY_USER = 0
+PRIORITY_BACKGROUND = 10
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_PAUSED = "paused"
+JOB_FINISHED = "finished"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+STARTUP_TIMES = {}
+
+def ensure_data_dirs():
+    """Create the launcher's data directories, done by the GUI and workers rather than on import"""
+    for path in (DEFAULT_INSTALL_DIR, ICON_CACHE, ARTIFACT_CACHE, MANIFEST_CACHE, GITHUB_CACHE):
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+def record_startup(name, start):
+    """Keep how long a startup step took, start is in microseconds like trace timestamps"""
+    duration = time.time_ns() // 1000 - start
+    STARTUP_TIMES[name] = (start, duration)
+    if TRACER.enabled:
+        TRACER.add_span(name, "startup", start, duration, {})
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access
+
+    Network, process and browser modules are not needed for the first paint, so
+    they load when something uses them. The import shows up in STARTUP_TIMES.
+    """
+
+    def __init__(self, module_name):
+        self.module_name = module_name
+        self.module = None
+        self.lock = threading.Lock()
+        self.callbacks = []
+
+    def load(self):
+        if self.module is None:
+            with self.lock:
+                if self.module is None:
+                    start = time.time_ns() // 1000
+                    module = importlib.import_module(self.module_name)
+                    record_startup(f"import {self.module_name}", start)
+                    for callback in self.callbacks:
+                        callback(module)
+                    self.module = module
+        return self.module
+
+    def when_loaded(self, callback):
+        """Run callback with the module now if it is loaded, otherwise right after it loads"""
+        with self.lock:
+            if self.module is None:
+                self.callbacks.append(callback)
+                return
+        callback(self.module)
+
+    def __getattr__(self, name):
+        # Only reached for names the proxy itself does not have
+        return getattr(self.load(), name)
+
+requests = LazyModule("requests")
+subprocess = LazyModule("subprocess")
+webbrowser = LazyModule("webbrowser")
+
+class Tracer:
+    """Timed spans, request counts and cache hit rates, exported as Chrome trace events
+
+    Disabled tracing costs one attribute check per span. Network spans come from
+    wrapping requests' Session.send only while tracing is on.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.events = []
+        self.hosts = {}
+        self.caches = {}
+        self.original_send = None
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        # Recording a trace should not pull requests into startup by itself
+        requests.when_loaded(self.wrap_send)
+
+    def wrap_send(self, module):
+        if not self.enabled or self.original_send is not None:
+            return
+        self.original_send = module.Session.send
+        tracer = self
 
-Path(DEFAULT_INSTALL_DIR).mkdir(parents=True, exist_ok=True)
-Path(ICON_CACHE).mkdir(parents=True, exist_ok=True)
+        def traced_send(session, request, **kwargs):
+            url = urlsplit(request.url)
+            tracer.count_request(url.netloc)
+            with tracer.record(f"{request.method} {url.path}", "network", {'url': request.url}) as args:
+                response = tracer.original_send(session, request, **kwargs)
+                args['status'] = response.status_code
+                return response
+
+        module.Session.send = traced_send
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self.original_send is not None:
+            requests.Session.send = self.original_send
+            self.original_send = None
+
+    def span(self, name, category, **args):
+        if not self.enabled:
+            return nullcontext({})
+        return self.record(name, category, args)
+
+    @contextmanager
+    def record(self, name, category, args):
+        start = time.time_ns() // 1000
+        try:
+            yield args
+        finally:
+            self.add_span(name, category, start, time.time_ns() // 1000 - start, args)
+
+    def add_span(self, name, category, start, duration, args, tid=None):
+        event = {'name': name, 'cat': category, 'ph': "X", 'ts': start, 'dur': duration,
+                 'pid': os.getpid(), 'tid': tid or threading.get_ident(), 'args': args}
+        with self.lock:
+            self.events.append(event)
+
+    def count_request(self, host):
+        with self.lock:
+            self.hosts[host] = self.hosts.get(host, 0) + 1
+
+    def count_cache(self, name, hit):
+        if not self.enabled:
+            return
+        with self.lock:
+            counts = self.caches.setdefault(name, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def clear(self):
+        with self.lock:
+            self.events, self.hosts, self.caches = [], {}, {}
+
+    def drain(self):
+        """Take everything recorded so far, used by workers to hand their spans to the GUI process"""
+        with self.lock:
+            data = {'events': self.events, 'hosts': self.hosts, 'caches': self.caches}
+            self.events, self.hosts, self.caches = [], {}, {}
+        return data
+
+    def merge(self, data):
+        with self.lock:
+            self.events.extend(data['events'])
+            for host, count in data['hosts'].items():
+                self.hosts[host] = self.hosts.get(host, 0) + count
+            for name, (hits, misses) in data['caches'].items():
+                counts = self.caches.setdefault(name, [0, 0])
+                counts[0] += hits
+                counts[1] += misses
+
+    def summary(self):
+        with self.lock:
+            return {
+                'spans': len(self.events),
+                'requests_per_host': dict(self.hosts),
+                'cache_hit_rates': {name: {'hits': hits, 'misses': misses,
+                                           'hit_rate': round(hits / (hits + misses), 3) if hits + misses else None}
+                                    for name, (hits, misses) in self.caches.items()}
+            }
+
+    def export(self, path):
+        """Write a trace that chrome://tracing and Perfetto can open"""
+        with self.lock:
+            events = list(self.events)
+        names = {pid: "Qypher" if pid == os.getpid() else "Qypher worker" for pid in {e['pid'] for e in events}}
+        metadata = [{'name': "process_name", 'ph': "M", 'pid': pid, 'tid': 0, 'args': {'name': name}}
+                    for pid, name in names.items()]
+        metadata += [{'name': "thread_name", 'ph': "M", 'pid': os.getpid(), 'tid': thread.ident,
+                      'args': {'name': thread.name}} for thread in threading.enumerate()]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': metadata + events, 'displayTimeUnit': "ms",
+                       'otherData': self.summary()}, f)
+
+TRACER = Tracer()
+
+class StallWatchdog:
+    """Detect event loop stalls and sample the main thread's stack while they happen
+
+    A timer on the GUI thread stamps a heartbeat; a watcher thread that notices the
+    heartbeat going stale past the threshold captures the main thread's Python stack.
+    Stalls are aggregated per session into STALL_REPORT.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.timer = None
+        self.thread = None
+        self.threshold = STALL_THRESHOLD_MS / 1000
+        self.main_ident = threading.main_thread().ident
+        self.beat = None
+        self.sample = None
+        self.suspended = False
+        self.dirty = False
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.count = 0
+            self.total = 0.0
+            self.longest = 0.0
+            self.histogram = [0] * (len(STALL_BUCKETS_MS) + 1)
+            self.stacks = {}
+            self.dirty = True
+
+    @property
+    def running(self):
+        return self.timer is not None and self.timer.isActive()
+
+    def start(self, threshold_ms=STALL_THRESHOLD_MS):
+        """Start watching; the time until the first heartbeat counts too, so startup stalls are caught"""
+        self.threshold = threshold_ms / 1000
+        if self.timer is None:
+            self.timer = QTimer()
+            self.timer.setTimerType(Qt.PreciseTimer)
+            self.timer.setInterval(STALL_HEARTBEAT_MS)
+            self.timer.timeout.connect(self.heartbeat)
+        if self.thread is None:
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self.watch, name="Qypher stall watchdog", daemon=True)
+            self.thread.start()
+        self.resume()
+
+    def stop(self):
+        self.pause()
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1)
+            self.thread = None
+        self.save()
+
+    def pause(self):
+        if self.timer is not None:
+            self.timer.stop()
+        with self.lock:
+            self.beat = None
+            self.sample = None
+
+    def resume(self):
+        if self.thread is None or self.timer.isActive():
+            return
+        with self.lock:
+            self.beat = time.perf_counter()
+            self.sample = None
+            self.suspended = False
+        self.timer.start()
+
+    def heartbeat(self):
+        now = time.perf_counter()
+        with self.lock:
+            if self.beat is None:
+                return
+            stalled = now - self.beat - STALL_HEARTBEAT_MS / 1000
+            sample, suspended = self.sample, self.suspended
+            self.beat = now
+            self.sample = None
+            self.suspended = False
+        if stalled >= self.threshold and not suspended:
+            self.record(stalled, sample)
+
+    def watch(self):
+        last = time.perf_counter()
+        while not self.stop_event.wait(self.threshold / 2):
+            now = time.perf_counter()
+            with self.lock:
+                # Both threads frozen for this long is a sleeping machine or a debugger, not the UI
+                if now - last > STALL_SUSPEND_SECONDS:
+                    self.suspended = True
+                if self.beat is not None and self.sample is None and now - self.beat >= self.threshold:
+                    self.sample = self.capture()
+                dirty, self.dirty = self.dirty, False
+            last = now
+            if dirty:
+                self.save()
+
+    def capture(self):
+        frame = sys._current_frames().get(self.main_ident)
+        if frame is None:
+            return None
+        return [f"{os.path.basename(entry.filename)}:{entry.lineno} in {entry.name}"
+                for entry in traceback.extract_stack(frame)[-STALL_STACK_DEPTH:]]
+
+    def record(self, duration, stack):
+        key = "\n".join(stack) if stack else "<not sampled>"
+        with self.lock:
+            self.count += 1
+            self.total += duration
+            self.longest = max(self.longest, duration)
+            self.histogram[bisect.bisect_right(STALL_BUCKETS_MS, duration * 1000)] += 1
+            entry = self.stacks.setdefault(key, {'stack': stack or [], 'count': 0, 'total': 0.0, 'longest': 0.0})
+            entry['count'] += 1
+            entry['total'] += duration
+            entry['longest'] = max(entry['longest'], duration)
+            self.dirty = True
+        if TRACER.enabled:
+            end = time.time_ns() // 1000
+            TRACER.add_span("event loop stall", "stall", end - int(duration * 1000000), int(duration * 1000000),
+                            {'stack': stack or []}, self.main_ident)
+
+    @staticmethod
+    def bucket_labels():
+        def label(ms):
+            return f"{ms}ms" if ms < 1000 else f"{ms / 1000:g}s"
+        bounds = STALL_BUCKETS_MS
+        return ([f"<{label(bounds[0])}"] + [f"{label(low)}-{label(high)}" for low, high in zip(bounds, bounds[1:])]
+                + [f">={label(bounds[-1])}"])
+
+    def report(self):
+        with self.lock:
+            stacks = sorted(self.stacks.values(), key=lambda entry: entry['total'], reverse=True)
+            return {
+                'threshold_ms': round(self.threshold * 1000),
+                'stalls': self.count,
+                'total_ms': round(self.total * 1000),
+                'longest_ms': round(self.longest * 1000),
+                'histogram': dict(zip(self.bucket_labels(), self.histogram)),
+                'top_stacks': [{'count': entry['count'], 'total_ms': round(entry['total'] * 1000),
+                                'longest_ms': round(entry['longest'] * 1000), 'stack': entry['stack']}
+                               for entry in stacks[:STALL_TOP_STACKS]]
+            }
+
+    def save(self):
+        try:
+            report = dict(self.report(), pid=os.getpid(), updated_at=datetime.now().isoformat(timespec='seconds'))
+            temp_path = f"{STALL_REPORT}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(report, f, indent=2)
+            os.replace(temp_path, STALL_REPORT)
+        except OSError:
+            pass
+
+    def summary_text(self):
+        report = self.report()
+        lines = [f"{report['stalls']} stall(s) over {report['threshold_ms']} ms, "
+                 f"{report['total_ms']} ms in total, longest {report['longest_ms']} ms", ""]
+        lines += [f"{label}: {count}" for label, count in report['histogram'].items()]
+        return "\n".join(lines)
+
+    def details_text(self):
+        blocks = []
+        for entry in self.report()['top_stacks']:
+            header = f"{entry['count']}x, {entry['total_ms']} ms total, longest {entry['longest_ms']} ms"
+            blocks.append("\n".join([header] + ["    " + frame for frame in reversed(entry['stack'])]))
+        return "\n\n".join(blocks)
+
+WATCHDOG = StallWatchdog()
+
+def traced(name, category):
+    """Record every call of the decorated function as a span"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            with TRACER.record(name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
 
 class CustomRepoDialog(QDialog):
-    def __init__(self, parent=None, current_repo=""):
+    def __init__(self, parent=None, current_repos=()):
         super().__init__(parent)
-        self.setWindowTitle("Custom Manifest Repository")
+        self.setWindowTitle("Manifest Repositories")
         self.setModal(True)
-        self.resize(400, 150)
+        self.resize(460, 240)
 
         layout = QVBoxLayout(self)
 
         form_layout = QFormLayout()
 
-        self.repo_edit = QLineEdit(current_repo)
+        self.repo_edit = QPlainTextEdit("\n".join(current_repos))
         self.repo_edit.setPlaceholderText("https://github.com/user/repo")
-        form_layout.addRow("Repository URL:", self.repo_edit)
+        form_layout.addRow("Repository URLs:", self.repo_edit)
+
+        layout.addLayout(form_layout)
+
+        info_label = QLabel("One repository per line, each with a 'manifest.json' file in the main branch. "
+                            "When several repositories list the same app, the one higher in the list wins.")
+        info_label.setStyleSheet("color: gray; font-size: 11px;")
+        info_label.setWordWrap(True)
+        layout.addWidget(info_label)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    def get_repo_urls(self):
+        repos = []
+        for line in self.repo_edit.toPlainText().splitlines():
+            repo = line.strip().rstrip('/')
+            if repo and repo not in repos:
+                repos.append(repo)
+        return repos
+
+class BandwidthDialog(QDialog):
+    def __init__(self, parent=None, foreground_kbps=0, background_kbps=0, schedule=""):
+        super().__init__(parent)
+        self.setWindowTitle("Bandwidth Limits")
+        self.setModal(True)
+        self.resize(460, 200)
+
+        layout = QVBoxLayout(self)
+
+        form_layout = QFormLayout()
+
+        self.foreground_spin = QSpinBox()
+        self.foreground_spin.setRange(0, 10000000)
+        self.foreground_spin.setSuffix(" KB/s")
+        self.foreground_spin.setSpecialValueText("Unlimited")
+        self.foreground_spin.setValue(foreground_kbps)
+        form_layout.addRow("Installs and updates:", self.foreground_spin)
+
+        self.background_spin = QSpinBox()
+        self.background_spin.setRange(0, 10000000)
+        self.background_spin.setSuffix(" KB/s")
+        self.background_spin.setSpecialValueText("Unlimited")
+        self.background_spin.setValue(background_kbps)
+        form_layout.addRow("Background transfers:", self.background_spin)
+
+        self.schedule_edit = QLineEdit(schedule)
+        self.schedule_edit.setPlaceholderText("Mon-Fri 08:00-18:00 foreground=4096 background=256")
+        form_layout.addRow("Schedule:", self.schedule_edit)
+
+        layout.addLayout(form_layout)
+
+        info_label = QLabel("Schedule rules are separated by ';' and override the limits above while they match. "
+                            "Background transfers pause while an install or update is downloading.")
+        info_label.setStyleSheet("color: gray; font-size: 11px;")
+        info_label.setWordWrap(True)
+        layout.addWidget(info_label)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.validate_and_accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    def validate_and_accept(self):
+        try:
+            parse_bandwidth_schedule(self.get_schedule())
+        except ValueError as e:
+            QMessageBox.warning(self, "Invalid Schedule", str(e))
+            return
+        self.accept()
+
+    def get_limits(self):
+        return self.foreground_spin.value(), self.background_spin.value()
+
+    def get_schedule(self):
+        return self.schedule_edit.text().strip()
+
+class GitHubTokenDialog(QDialog):
+    def __init__(self, parent=None, token="", status=""):
+        super().__init__(parent)
+        self.setWindowTitle("GitHub Token")
+        self.setModal(True)
+        self.resize(460, 160)
+
+        layout = QVBoxLayout(self)
+
+        form_layout = QFormLayout()
+
+        self.token_edit = QLineEdit(token)
+        self.token_edit.setEchoMode(QLineEdit.Password)
+        self.token_edit.setPlaceholderText("Optional personal access token")
+        form_layout.addRow("Token:", self.token_edit)
+
+        layout.addLayout(form_layout)
+
+        info_label = QLabel("A token raises the GitHub API limit from 60 to 5000 requests per hour. "
+                            "It needs no scopes for public repositories.\n" + status)
+        info_label.setStyleSheet("color: gray; font-size: 11px;")
+        info_label.setWordWrap(True)
+        layout.addWidget(info_label)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    def get_token(self):
+        return self.token_edit.text().strip()
+
+class BundleExportDialog(QDialog):
+    def __init__(self, parent=None, app_names=()):
+        super().__init__(parent)
+        self.setWindowTitle("Export Offline Bundle")
+        self.setModal(True)
+        self.resize(400, 360)
+
+        layout = QVBoxLayout(self)
+
+        self.app_list = QListWidget()
+        for name in app_names:
+            item = QListWidgetItem(name)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+            self.app_list.addItem(item)
+        layout.addWidget(self.app_list)
+
+        info_label = QLabel("The bundle holds the manifest, release information and the installed version of "
+                            "every checked app, enough to install them on a computer without internet access. "
+                            "Archives missing from the cache are downloaded first.")
+        info_label.setStyleSheet("color: gray; font-size: 11px;")
+        info_label.setWordWrap(True)
+        layout.addWidget(info_label)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    def get_selected(self):
+        return [self.app_list.item(row).text() for row in range(self.app_list.count())
+                if self.app_list.item(row).checkState() == Qt.Checked]
+
+class PeerCacheDialog(QDialog):
+    def __init__(self, parent=None, serve=False, port=PEER_CACHE_PORT, peers=(), status=""):
+        super().__init__(parent)
+        self.setWindowTitle("LAN Peer Cache")
+        self.setModal(True)
+        self.resize(460, 260)
+
+        layout = QVBoxLayout(self)
+
+        form_layout = QFormLayout()
+
+        self.serve_check = QCheckBox("Share cached downloads with other launchers")
+        self.serve_check.setChecked(serve)
+        form_layout.addRow("This computer:", self.serve_check)
+
+        self.port_spin = QSpinBox()
+        self.port_spin.setRange(1024, 65535)
+        self.port_spin.setValue(port)
+        form_layout.addRow("Port:", self.port_spin)
+
+        self.peers_edit = QPlainTextEdit("\n".join(peers))
+        self.peers_edit.setPlaceholderText(f"http://build-server:{PEER_CACHE_PORT}")
+        form_layout.addRow("Download from:", self.peers_edit)
 
         layout.addLayout(form_layout)
 
-        info_label = QLabel("The repository should contain a 'manifest.json' file in the main branch.")
+        info_label = QLabel("Peers are tried in order before GitHub, and only for downloads whose published hash "
+                            "is known, so a peer can never hand out a different file. A sharing launcher fetches "
+                            "missing releases once and serves every later request from its cache.\n" + status)
         info_label.setStyleSheet("color: gray; font-size: 11px;")
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
@@ -55,8 +669,244 @@ class CustomRepoDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
-    def get_repo_url(self):
-        return self.repo_edit.text().strip()
+    def get_serve(self):
+        return self.serve_check.isChecked(), self.port_spin.value()
+
+    def get_peer_urls(self):
+        peers = []
+        for line in self.peers_edit.toPlainText().splitlines():
+            peer = line.strip().rstrip('/')
+            if peer and "://" not in peer:
+                peer = f"http://{peer}"
+            if peer and peer not in peers:
+                peers.append(peer)
+        return peers
+
+class TokenBucket:
+    """Byte budget refilled at a fixed rate, with up to one second of burst"""
+
+    def __init__(self):
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+
+    def reserve(self, amount, rate):
+        """Take amount bytes from the bucket, returns how long the caller has to wait for them"""
+        now = time.monotonic()
+        self.tokens = min(rate, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        self.tokens -= amount
+        return -self.tokens / rate if self.tokens < 0 else 0.0
+
+class BandwidthShaper:
+    """Process-wide rate limiter shared by every transfer, split into foreground and background classes"""
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.buckets = {TRAFFIC_FOREGROUND: TokenBucket(), TRAFFIC_BACKGROUND: TokenBucket()}
+        self.active = {TRAFFIC_FOREGROUND: 0, TRAFFIC_BACKGROUND: 0}
+        self.limits = {TRAFFIC_FOREGROUND: DEFAULT_FOREGROUND_KBPS, TRAFFIC_BACKGROUND: DEFAULT_BACKGROUND_KBPS}
+        self.schedule = []
+
+    def configure(self, foreground_kbps, background_kbps, schedule=()):
+        with self.cond:
+            self.limits = {TRAFFIC_FOREGROUND: foreground_kbps, TRAFFIC_BACKGROUND: background_kbps}
+            self.schedule = list(schedule)
+            self.cond.notify_all()
+
+    def current_limit(self, traffic_class):
+        """Limit in bytes per second for a traffic class right now, 0 means unlimited"""
+        now = time.localtime()
+        minute = now.tm_hour * 60 + now.tm_min
+        for days, start, end, limits in self.schedule:
+            if start < end:
+                active = now.tm_wday in days and start <= minute < end
+            else:
+                # Overnight rules run past midnight into the day after one of their days
+                active = ((now.tm_wday in days and minute >= start) or
+                          ((now.tm_wday - 1) % 7 in days and minute < end))
+            if active and traffic_class in limits:
+                return limits[traffic_class] * 1024
+        return self.limits[traffic_class] * 1024
+
+    def start_transfer(self, traffic_class):
+        with self.cond:
+            self.active[traffic_class] += 1
+
+    def finish_transfer(self, traffic_class):
+        with self.cond:
+            self.active[traffic_class] -= 1
+            self.cond.notify_all()
+
+    @contextmanager
+    def transfer(self, traffic_class):
+        """Mark a transfer as active, running foreground transfers hold background ones back"""
+        self.start_transfer(traffic_class)
+        try:
+            yield
+        finally:
+            self.finish_transfer(traffic_class)
+
+    def consume(self, amount, traffic_class, check=None):
+        if traffic_class == TRAFFIC_BACKGROUND:
+            with self.cond:
+                while self.active[TRAFFIC_FOREGROUND]:
+                    self.cond.wait(0.25)
+                    if check:
+                        check()
+
+        rate = self.current_limit(traffic_class)
+        if not rate:
+            return
+        with self.cond:
+            delay = self.buckets[traffic_class].reserve(amount, rate)
+        # Sleep in slices so cancellation stays responsive on slow limits
+        while delay > 0:
+            time.sleep(min(delay, 0.25))
+            delay -= 0.25
+            if check:
+                check()
+
+BANDWIDTH = BandwidthShaper()
+
+def parse_bandwidth_schedule(text):
+    """Parse rules like 'Mon-Fri 08:00-18:00 foreground=4096 background=256' separated by ';'"""
+    rules = []
+    for rule in filter(None, (part.strip() for part in text.split(';'))):
+        fields = rule.split()
+        if len(fields) < 3:
+            raise ValueError(f"Expected days, hours and at least one limit in '{rule}'")
+
+        days = set()
+        for day_range in fields[0].lower().split(','):
+            first, _, last = day_range.partition('-')
+            if first not in WEEKDAYS or (last and last not in WEEKDAYS):
+                raise ValueError(f"Unknown day range '{day_range}' in '{rule}'")
+            first_index = WEEKDAYS.index(first)
+            last_index = WEEKDAYS.index(last) if last else first_index
+            days.update(range(first_index, last_index + 1) if first_index <= last_index
+                        else list(range(first_index, 7)) + list(range(0, last_index + 1)))
+
+        try:
+            times = [(int(h), int(m)) for h, m in (t.split(':') for t in fields[1].split('-'))]
+            if len(times) != 2 or not all(0 <= h <= 23 and 0 <= m <= 59 for h, m in times):
+                raise ValueError()
+        except ValueError:
+            raise ValueError(f"Expected hours like 08:00-18:00 or 22:00-06:00 in '{rule}'")
+        start, end = (h * 60 + m for h, m in times)
+        if start == end:
+            raise ValueError(f"Hours {fields[1]} cover no time in '{rule}'")
+
+        limits = {}
+        for limit in fields[2:]:
+            traffic_class, _, value = limit.partition('=')
+            if traffic_class not in (TRAFFIC_FOREGROUND, TRAFFIC_BACKGROUND) or not value.isdigit():
+                raise ValueError(f"Expected foreground=<KB/s> or background=<KB/s> in '{rule}'")
+            limits[traffic_class] = int(value)
+        rules.append((days, start, end, limits))
+    return rules
+
+def iter_download(response, traffic_class=TRAFFIC_FOREGROUND, check=None, chunk_size=65536):
+    """Yield a streamed response body through the shared bandwidth shaper"""
+    with BANDWIDTH.transfer(traffic_class):
+        for data in response.iter_content(chunk_size=chunk_size):
+            BANDWIDTH.consume(len(data), traffic_class, check)
+            yield data
+
+class HttpRangeFile(io.RawIOBase):
+    """Read-only seekable file over HTTP range requests, enough for zipfile to pick single members"""
+
+    def __init__(self, url, job=None, traffic_class=TRAFFIC_FOREGROUND):
+        super().__init__()
+        self.url = url
+        self.job = job
+        self.traffic_class = traffic_class
+        self.position = 0
+        response = requests.get(url, headers={'Range': "bytes=0-0"}, timeout=30)
+        if response.status_code != 206 or '/' not in response.headers.get('Content-Range', ''):
+            raise Exception("Server does not support range requests")
+        self.size = int(response.headers['Content-Range'].rsplit('/', 1)[1])
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self.position = max(0, offset)
+        return self.position
+
+    def readinto(self, buffer):
+        if self.position >= self.size or not len(buffer):
+            return 0
+        if self.job:
+            self.job.check()
+        end = min(self.position + len(buffer), self.size) - 1
+        response = requests.get(self.url, headers={'Range': f"bytes={self.position}-{end}"}, timeout=30)
+        if response.status_code != 206:
+            raise Exception(f"Range request failed with status code: {response.status_code}")
+        data = response.content
+        BANDWIDTH.consume(len(data), self.traffic_class, self.job.check if self.job else None)
+        buffer[:len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+class BundleMemberFile(io.RawIOBase):
+    """Read-only seekable view of a member stored uncompressed in a bundle, read in place"""
+
+    def __init__(self, path, member):
+        super().__init__()
+        self.file = open(path, 'rb')
+        try:
+            with zipfile.ZipFile(self.file) as bundle:
+                info = bundle.getinfo(member)
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{member} is compressed")
+            self.file.seek(info.header_offset)
+            name_length, extra_length = struct.unpack("<HH", self.file.read(30)[26:30])
+        except BaseException:
+            self.file.close()
+            raise
+        self.start = info.header_offset + 30 + name_length + extra_length
+        self.size = info.file_size
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self.position = max(0, offset)
+        return self.position
+
+    def readinto(self, buffer):
+        length = min(len(buffer), self.size - self.position)
+        if length <= 0:
+            return 0
+        self.file.seek(self.start + self.position)
+        read = self.file.readinto(memoryview(buffer)[:length])
+        self.position += read
+        return read
+
+    def close(self):
+        self.file.close()
+        super().close()
 
 class DownloadThread(QThread):
     progress = Signal(int)
@@ -76,7 +926,7 @@ class DownloadThread(QThread):
 
             with open(self.destination, 'wb') as f:
                 downloaded = 0
-                for data in response.iter_content(chunk_size=4096):
+                for data in iter_download(response):
                     f.write(data)
                     downloaded += len(data)
                     if total_size > 0:
@@ -89,25 +939,38 @@ class DownloadThread(QThread):
             self.finished.emit(False, str(e))
 
 class ManifestUpdateThread(QThread):
-    finished = Signal(bool, str, dict)
+    finished = Signal(bool, str)
+    source_loaded = Signal(str, dict, object, bool, list)
     info = Signal(str)
 
-    def __init__(self, manifest_url):
+    def __init__(self, manifest_repos):
         super().__init__()
-        self.manifest_url = manifest_url
+        self.manifest_repos = list(manifest_repos)
 
     def run(self):
-        try:
-            self.info.emit("Checking for manifest updates...")
-            response = requests.get(self.manifest_url, timeout=10)
-            if response.status_code == 200:
-                manifest_data = response.json()
-                self.info.emit("Manifest loaded successfully!")
-                self.finished.emit(True, "", manifest_data)
-            else:
-                self.finished.emit(False, f"HTTP {response.status_code}", {})
-        except Exception as e:
-            self.finished.emit(False, str(e), {})
+        self.info.emit("Checking for manifest updates...")
+        errors = []
+        # Every source reports as soon as it arrives, a dead one only costs its own timeout
+        with ThreadPoolExecutor(max_workers=len(self.manifest_repos) or 1) as executor:
+            futures = {executor.submit(fetch_manifest, repo): repo for repo in self.manifest_repos}
+            for future in as_completed(futures):
+                repo = futures[future]
+                try:
+                    manifest_data, changed, problems = future.result()
+                    apps, parse_problems = parse_manifest(repo, manifest_data)
+                    self.source_loaded.emit(repo, manifest_data, (apps, problems + parse_problems),
+                                            changed is None, changed or [])
+                except Exception as e:
+                    errors.append(f"{repo}: {e}")
+
+        if len(errors) == len(self.manifest_repos):
+            self.finished.emit(False, "; ".join(errors))
+            return
+        if errors:
+            self.info.emit(f"{len(errors)} manifest source(s) could not be reached")
+        else:
+            self.info.emit("Manifest loaded successfully!")
+        self.finished.emit(True, "; ".join(errors))
 
 class SelfUpdateThread(QThread):
     progress = Signal(int)
@@ -115,21 +978,54 @@ class SelfUpdateThread(QThread):
     info = Signal(str)
     update_available = Signal(str)  
     
-    def __init__(self, current_version=LAUNCHER_VERSION):
+    def __init__(self, current_version=LAUNCHER_VERSION, traffic_class=TRAFFIC_FOREGROUND):
         super().__init__()
         self.current_version = current_version
+        self.traffic_class = traffic_class
         
+    def download_asset(self, url, path, progress_start, progress_span):
+        response = requests.get(url, stream=True)
+        if response.status_code != 200:
+            raise Exception(f"Download failed with status code: {response.status_code}")
+        total_size = int(response.headers.get('content-length', 0))
+
+        with open(path, 'wb') as f:
+            downloaded = 0
+            for data in iter_download(response, self.traffic_class):
+                f.write(data)
+                downloaded += len(data)
+                if total_size > 0:
+                    progress = progress_start + int((downloaded / total_size) * progress_span)
+                    self.progress.emit(progress)
+
+    def download_delta(self, patch_asset, current_exe, temp_exe, temp_dir):
+        """Rebuild the new launcher from a patch against the running one, True on success"""
+        patch_path = os.path.join(temp_dir, patch_asset['name'])
+        try:
+            self.info.emit(f"Downloading launcher patch ({patch_asset.get('size', 0) // 1024} KB)...")
+            self.download_asset(patch_asset['browser_download_url'], patch_path, 25, 40)
+            self.info.emit("Applying launcher patch...")
+            apply_delta_file(current_exe, patch_path, temp_exe)
+            return True
+        except Exception as e:
+            self.info.emit(f"Patch could not be applied ({e}), downloading full update...")
+            return False
+        finally:
+            if os.path.exists(patch_path):
+                os.remove(patch_path)
+
     def run(self):
         try:
             self.info.emit("Checking for launcher updates...")
-            api_url = f"https://api.github.com/repos/QKing-Official/Qypher/releases/latest"
-            response = requests.get(api_url, timeout=10)
-            
-            if response.status_code != 200:
+            api_url = f"{GITHUB_API_URL}/repos/QKing-Official/Qypher/releases/latest"
+            try:
+                release_data = GITHUB.get_json(api_url, self.traffic_class == TRAFFIC_BACKGROUND)
+            except GitHubRateLimited as e:
+                self.finished.emit(False, str(e))
+                return
+            except Exception:
                 self.finished.emit(False, "Failed to check for updates")
                 return
-                
-            release_data = response.json()
             latest_version = release_data.get('tag_name', '')
             
             if not is_version_newer(latest_version, self.current_version):
@@ -149,7 +1045,7 @@ class SelfUpdateThread(QThread):
                 self.finished.emit(False, "No executable found in latest release")
                 return
                 
-            self.info.emit(f"Downloading launcher update {latest_version}...")
+            self.info.emit(f"Preparing launcher update {latest_version}...")
             self.progress.emit(25)
             
             current_exe = sys.executable
@@ -161,18 +1057,32 @@ class SelfUpdateThread(QThread):
             os.makedirs(temp_dir, exist_ok=True)
             temp_exe = os.path.join(temp_dir, "qypher_new.exe")
             
-            # Download the new exe to temp location
-            download_response = requests.get(exe_asset['browser_download_url'], stream=True)
-            total_size = int(download_response.headers.get('content-length', 0))
-            
-            with open(temp_exe, 'wb') as f:
-                downloaded = 0
-                for data in download_response.iter_content(chunk_size=4096):
-                    f.write(data)
-                    downloaded += len(data)
-                    if total_size > 0:
-                        progress = 25 + int((downloaded / total_size) * 50)
-                        self.progress.emit(progress)
+            # Prefer a small patch against the running executable, the full download is the fallback
+            expected_sha256 = published_asset_sha256(release_data, exe_asset)
+            patch_name = delta_asset_name(self.current_version, latest_version)
+            patch_asset = next((a for a in release_data.get('assets', []) if a['name'] == patch_name), None)
+
+            patched = False
+            if patch_asset and expected_sha256:
+                patched = (self.download_delta(patch_asset, current_exe, temp_exe, temp_dir) and
+                           file_sha256(temp_exe) == expected_sha256)
+
+            if not patched and expected_sha256 and peer_urls():
+                self.info.emit(f"Downloading launcher update {latest_version} from a LAN peer...")
+                patched = fetch_from_peers(expected_sha256, "exe", exe_asset['browser_download_url'], temp_exe,
+                                           progress=lambda fraction: self.progress.emit(25 + int(fraction * 50)),
+                                           info=self.info.emit)
+
+            if not patched:
+                # Download the new exe to temp location
+                self.info.emit(f"Downloading launcher update {latest_version}...")
+                self.download_asset(exe_asset['browser_download_url'], temp_exe, 25, 50)
+                if expected_sha256 and file_sha256(temp_exe) != expected_sha256:
+                    os.remove(temp_exe)
+                    self.finished.emit(False, "Downloaded launcher does not match the published hash")
+                    return
+            if expected_sha256:
+                share_artifact(temp_exe, expected_sha256, "exe")
                         
             self.progress.emit(75)
             self.info.emit("Preparing updater...")
@@ -339,154 +1249,2874 @@ rd /s /q "{temp_dir}" >nul 2>&1
         except Exception as e:
             self.finished.emit(False, str(e))
 
-class InstallThread(QThread):
-    progress = Signal(int)
-    finished = Signal(bool, str, str)  
-    info = Signal(str)
+class JobCancelled(Exception):
+    pass
+
+class Job:
+    """A unit of work executed by the JobScheduler"""
+
+    def __init__(self, scheduler, job_id, title, func, kind, app_name, priority):
+        self.scheduler = scheduler
+        self.id = job_id
+        self.title = title
+        self.func = func
+        self.kind = kind
+        self.app_name = app_name
+        self.priority = priority
+        self.state = JOB_QUEUED
+        self.progress = 0
+        self.info = ""
+        self.message = ""
+        self.result = None
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+        self.resume_event = threading.Event()
+        self.resume_event.set()
+        self.done_event = threading.Event()
+        self.control_listeners = []
+
+    @property
+    def is_active(self):
+        return self.state in (JOB_QUEUED, JOB_RUNNING, JOB_PAUSED)
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def set_progress(self, value):
+        if value != self.progress:
+            self.progress = value
+            self.scheduler.job_changed.emit(self.id)
+
+    def set_info(self, text):
+        self.info = text
+        self.scheduler.job_changed.emit(self.id)
+
+    def wait(self):
+        self.done_event.wait()
+
+    def add_control_listener(self, listener):
+        self.control_listeners.append(listener)
+
+    def remove_control_listener(self, listener):
+        self.control_listeners.remove(listener)
+
+    def notify_control(self, command):
+        """Forward cancel, pause and resume to work running outside this process"""
+        for listener in list(self.control_listeners):
+            try:
+                listener(command)
+            except OSError:
+                pass
+
+    def check(self):
+        """Cancellation and pause point, call regularly from long running work"""
+        if not self.resume_event.is_set():
+            self.resume_event.wait()
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+    @contextmanager
+    def slot(self, resource):
+        """Hold one of the scheduler's network or disk slots"""
+        slots = self.scheduler.slots[resource]
+        slots.acquire(self)
+        try:
+            yield
+        finally:
+            slots.release()
+
+class ResourceSlots:
+    """Counting semaphore that hands out free slots by job priority"""
+
+    def __init__(self, name, limit):
+        self.name = name
+        self.limit = max(1, limit)
+        self.in_use = 0
+        self.waiters = []
+        self.cond = threading.Condition()
+
+    def acquire(self, job):
+        with self.cond:
+            waiter = (job.priority, job.id)
+            self.waiters.append(waiter)
+            try:
+                while self.in_use >= self.limit or min(self.waiters) != waiter:
+                    if job.info != f"Waiting for {self.name}...":
+                        job.set_info(f"Waiting for {self.name}...")
+                    self.cond.wait(0.25)
+                    if job.cancel_event.is_set():
+                        raise JobCancelled()
+            finally:
+                self.waiters.remove(waiter)
+            self.in_use += 1
+            self.cond.notify_all()
+
+    def release(self):
+        with self.cond:
+            self.in_use -= 1
+            self.cond.notify_all()
+
+class JobScheduler(QObject):
+    """Runs queued jobs on worker threads with per-resource concurrency limits"""
+    job_added = Signal(int)
+    job_changed = Signal(int)
+    job_finished = Signal(int, bool, str)
+
+    def __init__(self, network_limit=DEFAULT_NETWORK_JOBS, disk_limit=DEFAULT_DISK_JOBS, parent=None):
+        super().__init__(parent)
+        self.jobs = {}
+        self.queue = []
+        self.cond = threading.Condition()
+        self.next_id = 1
+        self.slots = {
+            NETWORK_SLOT: ResourceSlots("network", network_limit),
+            DISK_SLOT: ResourceSlots("disk", disk_limit)
+        }
+        # Jobs spend most of their time holding or waiting for one slot,
+        # so enough workers to fill both pools keeps either from idling
+        for _ in range(network_limit + disk_limit):
+            threading.Thread(target=self.worker_loop, daemon=True).start()
+
+    def submit(self, title, func, kind="install", app_name=None, priority=PRIORITY_USER):
+        with self.cond:
+            job = Job(self, self.next_id, title, func, kind, app_name, priority)
+            self.next_id += 1
+            self.jobs[job.id] = job
+            self.queue.append(job)
+            self.cond.notify()
+        self.job_added.emit(job.id)
+        return job
+
+    def active_job_for(self, app_name):
+        for job in self.jobs.values():
+            if job.app_name == app_name and job.is_active:
+                return job
+        return None
 
-    def __init__(self, app_data, version, install_dir):
-        super().__init__()
-        self.app_data = app_data
-        self.version = version
-        self.install_dir = install_dir
-        self.actual_version = version
+    def next_job(self):
+        runnable = [job for job in self.queue if job.state == JOB_QUEUED]
+        if not runnable:
+            return None
+        job = min(runnable, key=lambda j: (j.priority, j.id))
+        self.queue.remove(job)
+        job.state = JOB_RUNNING
+        return job
+
+    def worker_loop(self):
+        while True:
+            with self.cond:
+                job = self.next_job()
+                while job is None:
+                    self.cond.wait()
+                    job = self.next_job()
+            self.run_job(job)
+
+    def run_job(self, job):
+        job.started_at = time.perf_counter()
+        self.job_changed.emit(job.id)
+        try:
+            with TRACER.span(job.title, "job", kind=job.kind):
+                job.result = job.func(job)
+            job.state = JOB_FINISHED
+        except JobCancelled:
+            job.state = JOB_CANCELLED
+            job.message = "Cancelled"
+        except Exception as e:
+            job.state = JOB_FAILED
+            job.message = str(e)
+        job.finished_at = time.perf_counter()
+        job.done_event.set()
+        self.job_changed.emit(job.id)
+        self.job_finished.emit(job.id, job.state == JOB_FINISHED, job.message)
+
+    def cancel(self, job_id):
+        with self.cond:
+            job = self.jobs.get(job_id)
+            if not job or not job.is_active:
+                return
+            if job in self.queue:
+                self.queue.remove(job)
+                job.state = JOB_CANCELLED
+                job.message = "Cancelled"
+                job.done_event.set()
+                dequeued = True
+            else:
+                dequeued = False
+                job.cancel_event.set()
+                job.resume_event.set()
+        job.notify_control("cancel")
+        if dequeued:
+            self.job_changed.emit(job.id)
+            self.job_finished.emit(job.id, False, job.message)
+
+    def pause(self, job_id):
+        with self.cond:
+            job = self.jobs.get(job_id)
+            if not job or job.state not in (JOB_QUEUED, JOB_RUNNING):
+                return
+            job.resume_event.clear()
+            job.state = JOB_PAUSED
+        job.notify_control("pause")
+        self.job_changed.emit(job.id)
+
+    def resume(self, job_id):
+        with self.cond:
+            job = self.jobs.get(job_id)
+            if not job or job.state != JOB_PAUSED:
+                return
+            job.state = JOB_QUEUED if job in self.queue else JOB_RUNNING
+            job.resume_event.set()
+            self.cond.notify_all()
+        job.notify_control("resume")
+        self.job_changed.emit(job.id)
 
-    def run(self):
+    def clear_finished(self):
+        with self.cond:
+            for job_id in [j.id for j in self.jobs.values() if not j.is_active]:
+                del self.jobs[job_id]
+
+class JobQueueWidget(QWidget):
+    """Visible queue of scheduler jobs with per-job progress, pause and cancel"""
+
+    def __init__(self, scheduler, parent=None):
+        super().__init__(parent)
+        self.scheduler = scheduler
+        self.rows = {}
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        jobs_label = QLabel("Jobs")
+        jobs_label.setStyleSheet("font-weight: bold;")
+        layout.addWidget(jobs_label)
+
+        self.job_list = QListWidget()
+        self.job_list.setMaximumHeight(160)
+        self.job_list.currentRowChanged.connect(self.update_buttons)
+        layout.addWidget(self.job_list)
+
+        button_layout = QHBoxLayout()
+        self.pause_btn = QPushButton("Pause")
+        self.pause_btn.clicked.connect(self.toggle_pause)
+        button_layout.addWidget(self.pause_btn)
+
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(self.cancel_selected)
+        button_layout.addWidget(self.cancel_btn)
+
+        self.clear_btn = QPushButton("Clear Finished")
+        self.clear_btn.clicked.connect(self.clear_finished)
+        button_layout.addWidget(self.clear_btn)
+        layout.addLayout(button_layout)
+
+        scheduler.job_added.connect(self.add_job)
+        scheduler.job_changed.connect(self.refresh_job)
+        self.update_buttons()
+
+    def add_job(self, job_id):
+        job = self.scheduler.jobs.get(job_id)
+        if not job:
+            return
+
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(4, 2, 4, 2)
+        text = QLabel()
+        row_layout.addWidget(text, 1)
+        bar = QProgressBar()
+        bar.setFixedWidth(120)
+        row_layout.addWidget(bar)
+
+        item = QListWidgetItem()
+        item.setData(Qt.UserRole, job_id)
+        item.setSizeHint(row.sizeHint())
+        self.job_list.addItem(item)
+        self.job_list.setItemWidget(item, row)
+        self.rows[job_id] = (item, text, bar)
+        self.refresh_job(job_id)
+
+    def refresh_job(self, job_id):
+        job = self.scheduler.jobs.get(job_id)
+        if not job or job_id not in self.rows:
+            return
+        item, text, bar = self.rows[job_id]
+        detail = job.message if job.state in (JOB_FAILED, JOB_CANCELLED) else job.info
+        text.setText(f"{job.title} [{job.state}]" + (f" - {detail}" if detail else ""))
+        text.setToolTip(detail)
+        bar.setValue(job.progress)
+        if self.job_list.currentItem() is item:
+            self.update_buttons()
+
+    def selected_job(self):
+        item = self.job_list.currentItem()
+        if item is None:
+            return None
+        return self.scheduler.jobs.get(item.data(Qt.UserRole))
+
+    def update_buttons(self, *args):
+        job = self.selected_job()
+        self.pause_btn.setText("Resume" if job and job.state == JOB_PAUSED else "Pause")
+        self.pause_btn.setEnabled(bool(job and job.state in (JOB_QUEUED, JOB_RUNNING, JOB_PAUSED)))
+        self.cancel_btn.setEnabled(bool(job and job.is_active))
+
+    def toggle_pause(self):
+        job = self.selected_job()
+        if not job:
+            return
+        if job.state == JOB_PAUSED:
+            self.scheduler.resume(job.id)
+        else:
+            self.scheduler.pause(job.id)
+
+    def cancel_selected(self):
+        job = self.selected_job()
+        if job:
+            self.scheduler.cancel(job.id)
+
+    def clear_finished(self):
+        self.scheduler.clear_finished()
+        for job_id in list(self.rows):
+            if job_id not in self.scheduler.jobs:
+                item, _, _ = self.rows.pop(job_id)
+                self.job_list.takeItem(self.job_list.row(item))
+        self.update_buttons()
+
+class IconLoader(QObject):
+    """Fetches app icons off the GUI thread into ICON_CACHE, keeping decoded pixmaps in a bounded LRU"""
+    icon_loaded = Signal(str)
+    image_ready = Signal(str, QImage)
+
+    def __init__(self, parent=None, capacity=ICON_MEMORY_CACHE):
+        super().__init__(parent)
+        self.capacity = capacity
+        self.pixmaps = OrderedDict()
+        self.pending = set()
+        self.revalidated = set()
+        self.executor = ThreadPoolExecutor(max_workers=ICON_WORKERS)
+        self.image_ready.connect(self.store_image)
+
+    def cached(self, url):
+        pixmap = self.pixmaps.get(url)
+        TRACER.count_cache("icon_memory", pixmap is not None)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(url)
+        return pixmap
+
+    def request(self, url):
+        """Load an icon unless it is in memory and was already revalidated this session"""
+        if url in self.pending or (url in self.revalidated and url in self.pixmaps):
+            return
+        # An icon evicted after revalidation comes back from ICON_CACHE without a request
+        if url in self.revalidated and not os.path.exists(self.cache_path(url)):
+            return
+        self.pending.add(url)
+        self.executor.submit(self.load, url, url not in self.pixmaps, url not in self.revalidated)
+
+    def cache_path(self, url):
+        return os.path.join(ICON_CACHE, hashlib.sha1(url.encode()).hexdigest())
+
+    def load(self, url, read_disk, revalidate=True):
+        path = self.cache_path(url)
+        try:
+            etag = None
+            if read_disk:
+                TRACER.count_cache("icon_disk", os.path.exists(path))
+            if os.path.exists(path):
+                if read_disk:
+                    self.image_ready.emit(url, self.decode(path))
+                if revalidate and os.path.exists(path + ".etag"):
+                    with open(path + ".etag", 'r') as f:
+                        etag = f.read().strip()
+
+            if revalidate:
+                headers = {'If-None-Match': etag} if etag else {}
+                response = requests.get(url, headers=headers, timeout=10)
+                if response.status_code == 200:
+                    BANDWIDTH.consume(len(response.content), TRAFFIC_FOREGROUND)
+                    with open(path + ".tmp", 'wb') as f:
+                        f.write(response.content)
+                    os.replace(path + ".tmp", path)
+                    with open(path + ".etag", 'w') as f:
+                        f.write(response.headers.get('ETag', ''))
+                    self.image_ready.emit(url, self.decode(path))
+        except (OSError, requests.RequestException):
+            pass
+        self.image_ready.emit(url, QImage())
+
+    def decode(self, path):
+        image = QImage(path)
+        if image.isNull():
+            return image
+        return image.scaled(ICON_SIZE, ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    def store_image(self, url, image):
+        # A null image marks the end of a load
+        if image.isNull():
+            self.pending.discard(url)
+            self.revalidated.add(url)
+            return
+        self.pixmaps[url] = QPixmap.fromImage(image)
+        self.pixmaps.move_to_end(url)
+        while len(self.pixmaps) > self.capacity:
+            self.pixmaps.popitem(last=False)
+        self.icon_loaded.emit(url)
+
+    def clear(self):
+        """Forget every icon, the next request decodes or revalidates it again"""
+        self.pixmaps.clear()
+        self.pending.clear()
+        self.revalidated.clear()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+class ReleaseWatcher(QObject):
+    """Re-checks installed apps one per tick, each on a TTL learned from its release history"""
+    release_checked = Signal(str, str)
+    check_done = Signal(str, str, float)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.apps = {}
+        self.next_check = {}
+        self.checking = False
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.check_done.connect(self.store_result)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check_due)
+        self.timer.start(RELEASE_CHECK_TICK_MS)
+
+    def watch(self, apps):
+        """Track apps by name, new ones were just resolved and are due after the shortest TTL"""
+        for name in list(self.next_check):
+            if name not in apps:
+                del self.next_check[name]
+        for name in apps:
+            if name not in self.next_check:
+                self.next_check[name] = time.time() + jittered(RELEASE_TTL_MIN)
+        self.apps = dict(apps)
+
+    def check_due(self):
+        # One request per tick at most, so a backlog of due apps drains without a burst
+        if self.checking:
+            return
+        due = [name for name, at in self.next_check.items() if at <= time.time()]
+        if not due:
+            return
+        name = min(due, key=self.next_check.get)
+        self.checking = True
+        self.executor.submit(self.check, name, self.apps[name])
+
+    def check(self, name, app_data):
+        # check_done always fires, otherwise checking stays set and no app is checked again
+        latest_version, interval = '', RELEASE_TTL_MAX
+        try:
+            releases = get_github_releases(app_data.url, background=True)
+            release = latest_release(releases)
+            latest_version = release.get('tag_name', '') if release else ''
+            interval = release_check_interval(releases)
+        except Exception as e:
+            GITHUB.last_error = f"Release check for {name} failed: {e}"
+        finally:
+            self.check_done.emit(name, latest_version, interval)
+
+    def store_result(self, name, latest_version, interval):
+        self.checking = False
+        if name in self.next_check:
+            self.next_check[name] = time.time() + jittered(interval)
+        if latest_version:
+            self.release_checked.emit(name, latest_version)
+
+    def shutdown(self):
+        self.timer.stop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+class ProcessSupervisor(QObject):
+    """Launch installed apps as child processes, track which are running and keep launch statistics"""
+    app_started = Signal(str)
+    app_exited = Signal(str, int)
+    process_ended = Signal(str, int, int)
+
+    def __init__(self, parent=None, path=LAUNCH_STATS):
+        super().__init__(parent)
+        self.path = path
+        self.running = {}
+        self.stats = self.load()
+        self.process_ended.connect(self.process_finished)
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        try:
+            with open(self.path + ".tmp", 'w') as f:
+                json.dump(self.stats, f, indent=2)
+            os.replace(self.path + ".tmp", self.path)
+        except OSError:
+            pass
+
+    def entry(self, name):
+        return self.stats.setdefault(name, {'launches': 0, 'failed_launches': 0, 'exits': 0, 'crashes': 0,
+                                            'spawn_ms': None, 'runtime_seconds': 0.0, 'last_exit_code': None})
+
+    def is_running(self, name):
+        return bool(self.running.get(name))
+
+    def launch(self, name, executable_path):
+        """Start an app detached from the launcher's lifetime, returns the time to spawn in ms"""
+        kwargs = {}
+        if sys.platform == "win32":
+            # Same console behaviour as os.startfile, and the app outlives the launcher
+            kwargs['creationflags'] = subprocess.CREATE_NEW_CONSOLE | subprocess.CREATE_NEW_PROCESS_GROUP
+        entry = self.entry(name)
+        started = time.perf_counter()
+        try:
+            process = subprocess.Popen([executable_path], cwd=os.path.dirname(executable_path), **kwargs)
+        except OSError:
+            entry['failed_launches'] += 1
+            self.save()
+            raise
+        spawn_ms = (time.perf_counter() - started) * 1000
+
+        entry['launches'] += 1
+        entry['spawn_ms'] = spawn_ms if entry['spawn_ms'] is None else 0.8 * entry['spawn_ms'] + 0.2 * spawn_ms
+        entry['last_launch'] = time.time()
+        self.save()
+        self.running.setdefault(name, {})[process.pid] = time.time()
+        threading.Thread(target=self.wait_for, args=(name, process), name=f"Qypher supervise {name}",
+                         daemon=True).start()
+        self.app_started.emit(name)
+        return spawn_ms
+
+    def wait_for(self, name, process):
+        code = process.wait()
+        # Windows exit codes are unsigned 32-bit, NTSTATUS crashes would not fit the signal
+        self.process_ended.emit(name, process.pid, code - 2 ** 32 if code >= 2 ** 31 else code)
+
+    def process_finished(self, name, pid, code):
+        started_at = self.running.get(name, {}).pop(pid, None)
+        if not self.running.get(name):
+            self.running.pop(name, None)
+        entry = self.entry(name)
+        entry['exits'] += 1
+        entry['last_exit_code'] = code
+        if code != 0:
+            entry['crashes'] += 1
+        if started_at:
+            entry['runtime_seconds'] += time.time() - started_at
+        self.save()
+        self.app_exited.emit(name, code)
+
+    def summary_lines(self):
+        lines = []
+        for name, entry in sorted(self.stats.items()):
+            spawn = f"{entry['spawn_ms']:.0f} ms to spawn" if entry['spawn_ms'] is not None else "never started"
+            line = (f"{name}: {entry['launches']} launch(es), {spawn}, {entry['crashes']} abnormal exit(s), "
+                    f"{entry['runtime_seconds'] / 3600:.1f} h run")
+            if entry['failed_launches']:
+                line += f", {entry['failed_launches']} failed to start"
+            if self.is_running(name):
+                line += " - running"
+            lines.append(line)
+        return lines
+
+def format_exit_code(code):
+    return f"0x{code & 0xFFFFFFFF:08X}" if code < 0 else str(code)
+
+class SingleInstanceServer(QObject):
+    """Local socket the first launcher listens on so later invocations can hand over their arguments"""
+    message_received = Signal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self.accept_connections)
+
+    def listen(self):
+        name = single_instance_name()
+        if self.server.listen(name):
+            return True
+        # Nobody answered on this name, so it is left over from a crashed instance
+        QLocalServer.removeServer(name)
+        return self.server.listen(name)
+
+    def accept_connections(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda socket=socket: self.read_messages(socket))
+            socket.disconnected.connect(socket.deleteLater)
+            self.read_messages(socket)
+
+    def read_messages(self, socket):
+        while socket.canReadLine():
+            try:
+                message = json.loads(bytes(socket.readLine()).decode("utf-8"))
+            except ValueError:
+                continue
+            if isinstance(message, dict):
+                self.message_received.emit(message)
+
+def single_instance_name():
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = os.path.basename(os.path.expanduser("~"))
+    return f"{ORGANIZATION}-Qypher-{user}"
+
+def send_to_running_instance(message, timeout_ms=SINGLE_INSTANCE_TIMEOUT_MS):
+    """Hand a command to an already running launcher, False when there is none"""
+    socket = QLocalSocket()
+    socket.connectToServer(single_instance_name())
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.write((json.dumps(message) + "\n").encode("utf-8"))
+    socket.waitForBytesWritten(timeout_ms)
+    socket.disconnectFromServer()
+    return True
+
+class WorkerCrashed(Exception):
+    pass
+
+class WorkerProcess:
+    """A Qypher worker process driven over JSON lines on its stdin and stdout"""
+
+    def __init__(self):
+        if getattr(sys, 'frozen', False):
+            command = [sys.executable, "--worker"]
+        else:
+            command = [sys.executable, os.path.abspath(__file__), "--worker"]
+        self.process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding="utf-8", bufsize=1,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        )
+        self.write_lock = threading.Lock()
+
+    @property
+    def alive(self):
+        return self.process.poll() is None
+
+    def send(self, message):
+        with self.write_lock:
+            self.process.stdin.write(json.dumps(message) + "\n")
+            self.process.stdin.flush()
+
+    def receive(self):
+        line = self.process.stdout.readline()
+        if not line:
+            raise WorkerCrashed()
+        return json.loads(line)
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+
+class WorkerPool:
+    """Reusable worker processes that run heavy job actions outside the GUI process"""
+
+    def __init__(self, max_idle=None):
+        self.max_idle = max_idle or max(os.cpu_count() or 1, 2)
+        self.idle = []
+        self.lock = threading.Lock()
+        self.enabled = True
+
+    def checkout(self):
+        with self.lock:
+            while self.idle:
+                worker = self.idle.pop()
+                if worker.alive:
+                    return worker
+        return WorkerProcess()
+
+    def checkin(self, worker):
+        with self.lock:
+            if worker.alive and len(self.idle) < self.max_idle:
+                self.idle.append(worker)
+                return
+        worker.close()
+
+    def shutdown(self):
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for worker in idle:
+            worker.close()
+
+    def run(self, job, action, args):
+        """Run an action in a worker, relaying its progress, slot and bandwidth requests to job"""
+        worker = self.checkout()
+        held = []
+        listener = lambda command: worker.send({'type': command})
+        job.add_control_listener(listener)
         try:
-            app_name = self.app_data['name']
-            app_dir = os.path.join(self.install_dir, app_name)
+            if isinstance(args.get('app_data'), CatalogApp):
+                args = dict(args, app_data=args['app_data'].to_dict())
+            worker.send({'type': "run", 'action': action, 'args': args, 'trace': TRACER.enabled})
+            if job.cancel_event.is_set():
+                worker.send({'type': "cancel"})
+            elif not job.resume_event.is_set():
+                worker.send({'type': "pause"})
+
+            while True:
+                message = worker.receive()
+                kind = message['type']
+                if kind == "progress":
+                    job.set_progress(message['value'])
+                elif kind == "info":
+                    job.set_info(message['text'])
+                elif kind in ("acquire", "transfer"):
+                    if kind == "acquire":
+                        context = job.slot(message['resource'])
+                    else:
+                        context = BANDWIDTH.transfer(message['traffic_class'])
+                    try:
+                        context.__enter__()
+                        held.append((message['key'], context))
+                        worker.send({'type': "reply", 'id': message['id'], 'ok': True})
+                    except JobCancelled:
+                        worker.send({'type': "reply", 'id': message['id'], 'ok': False})
+                elif kind == "release":
+                    for index, (key, context) in enumerate(held):
+                        if key == message['key']:
+                            del held[index]
+                            context.__exit__(None, None, None)
+                            break
+                elif kind == "consume":
+                    try:
+                        BANDWIDTH.consume(message['amount'], message['traffic_class'], job.check)
+                        worker.send({'type': "reply", 'id': message['id'], 'ok': True})
+                    except JobCancelled:
+                        worker.send({'type': "reply", 'id': message['id'], 'ok': False})
+                elif kind == "done":
+                    if message.get('trace'):
+                        TRACER.merge(message['trace'])
+                    return message['result']
+                elif kind == "error":
+                    if message.get('trace'):
+                        TRACER.merge(message['trace'])
+                    if message.get('cancelled'):
+                        raise JobCancelled()
+                    raise Exception(message['message'])
+        except (WorkerCrashed, OSError):
+            worker.close()
+            raise Exception("Worker process exited unexpectedly")
+        finally:
+            job.remove_control_listener(listener)
+            for _, context in reversed(held):
+                context.__exit__(None, None, None)
+            if worker.alive:
+                self.checkin(worker)
+
+WORKER_POOL = WorkerPool()
+
+class WorkerChannel:
+    """Worker side of the pipe: outgoing events plus request/reply round trips"""
 
-            Path(app_dir).mkdir(parents=True, exist_ok=True)
+    def __init__(self):
+        self.write_lock = threading.Lock()
+        self.next_id = 1
+        self.pending = {}
+        self.replies = {}
+
+    def send(self, message):
+        with self.write_lock:
+            sys.stdout.write(json.dumps(message) + "\n")
+            sys.stdout.flush()
+
+    def request(self, message):
+        with self.write_lock:
+            request_id = self.next_id
+            self.next_id += 1
+            self.pending[request_id] = threading.Event()
+        self.send(dict(message, id=request_id))
+        self.pending[request_id].wait()
+        del self.pending[request_id]
+        return self.replies.pop(request_id)
+
+    def deliver(self, message):
+        self.replies[message['id']] = message['ok']
+        self.pending[message['id']].set()
+
+class WorkerJobContext:
+    """Job interface inside a worker process, backed by the GUI process's scheduler"""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.progress = 0
+        self.info = ""
+        self.cancel_event = threading.Event()
+        self.resume_event = threading.Event()
+        self.resume_event.set()
+
+    def set_progress(self, value):
+        if value != self.progress:
+            self.progress = value
+            self.channel.send({'type': "progress", 'value': value})
+
+    def set_info(self, text):
+        self.info = text
+        self.channel.send({'type': "info", 'text': text})
+
+    def check(self):
+        if not self.resume_event.is_set():
+            self.resume_event.wait()
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+    @contextmanager
+    def slot(self, resource):
+        key = f"slot-{id(self)}-{resource}-{time.perf_counter()}"
+        if not self.channel.request({'type': "acquire", 'resource': resource, 'key': key}):
+            raise JobCancelled()
+        try:
+            yield
+        finally:
+            self.channel.send({'type': "release", 'key': key})
 
-            download_url = self.app_data['url']
+class RemoteBandwidthShaper:
+    """Stand-in for BANDWIDTH inside a worker, the GUI process owns the real token buckets"""
 
-            if self.version == "latest":
-                releases = get_github_releases(self.app_data['url'])
-                if releases and len(releases) > 0:
-                    self.actual_version = releases[0].get('tag_name', 'latest')
-                    self.info.emit(f"Latest version resolved to: {self.actual_version}")
+    def __init__(self, channel):
+        self.channel = channel
+        self.pending = {TRAFFIC_FOREGROUND: 0, TRAFFIC_BACKGROUND: 0}
 
-            if self.version != "latest":
+    @contextmanager
+    def transfer(self, traffic_class):
+        key = f"transfer-{threading.get_ident()}-{time.perf_counter()}"
+        self.channel.request({'type': "transfer", 'traffic_class': traffic_class, 'key': key})
+        try:
+            yield
+        finally:
+            self.channel.send({'type': "release", 'key': key})
+
+    def consume(self, amount, traffic_class, check=None):
+        # Batch small chunks so shaping costs one round trip per WORKER_CONSUME_BATCH bytes
+        self.pending[traffic_class] += amount
+        if self.pending[traffic_class] < WORKER_CONSUME_BATCH:
+            return
+        amount, self.pending[traffic_class] = self.pending[traffic_class], 0
+        if not self.channel.request({'type': "consume", 'amount': amount, 'traffic_class': traffic_class}):
+            raise JobCancelled()
+        if check:
+            check()
+
+class GitHubRateLimited(Exception):
+    pass
+
+class GitHubClient:
+    """GitHub API access that tracks the rate limit and answers from its cache rather than failing
+
+    Responses are kept per URL in GITHUB_CACHE and revalidated with ETags, which
+    GitHub does not count against the limit. Background callers leave the last
+    GITHUB_RESERVED_CALLS requests of a window to the user.
+    """
+
+    def __init__(self, cache_dir=GITHUB_CACHE):
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.token = None
+        self.limit = None
+        self.remaining = None
+        self.reset_at = 0
+        self.last_error = ""
+
+    def set_token(self, token):
+        self.token = token
+
+    def auth_token(self):
+        if self.token is None:
+            self.token = QSettings(ORGANIZATION, APP_NAME).value("github/token", "")
+        return self.token
+
+    def entry_path(self, api_url):
+        return os.path.join(self.cache_dir, hashlib.sha1(api_url.encode()).hexdigest() + ".json")
+
+    def cached_entry(self, api_url):
+        if api_url not in self.entries:
+            try:
+                with open(self.entry_path(api_url), 'r') as f:
+                    self.entries[api_url] = json.load(f)
+            except (OSError, ValueError):
+                self.entries[api_url] = None
+        return self.entries[api_url]
+
+    def store_entry(self, api_url, entry):
+        self.entries[api_url] = entry
+        path = self.entry_path(api_url)
+        with open(path + ".tmp", 'w') as f:
+            json.dump(entry, f)
+        os.replace(path + ".tmp", path)
+
+    def rate_limited(self):
+        return self.remaining is not None and self.remaining <= 0 and time.time() < self.reset_at
+
+    def calls_available(self):
+        if self.remaining is None or time.time() >= self.reset_at:
+            return None
+        return self.remaining
+
+    def max_age(self):
+        # Stretch the cache over the rest of the window once the budget runs low
+        remaining = self.calls_available()
+        if self.limit and remaining is not None and remaining < self.limit * GITHUB_LOW_BUDGET:
+            return max(GITHUB_CACHE_SECONDS, self.reset_at - time.time())
+        return GITHUB_CACHE_SECONDS
+
+    def update_rate_limit(self, response):
+        headers = response.headers
+        if 'X-RateLimit-Remaining' in headers:
+            self.limit = int(headers.get('X-RateLimit-Limit', 0)) or self.limit
+            self.remaining = int(headers['X-RateLimit-Remaining'])
+            self.reset_at = float(headers.get('X-RateLimit-Reset', 0))
+        if response.status_code in (403, 429) and 'Retry-After' in headers:
+            self.remaining = 0
+            self.reset_at = time.time() + int(headers['Retry-After'])
+
+    def status_text(self):
+        reset = time.strftime("%H:%M", time.localtime(self.reset_at))
+        if self.rate_limited():
+            return f"GitHub rate limit reached, using cached release data until {reset}"
+        if self.calls_available() is not None:
+            return f"GitHub API: {self.remaining} of {self.limit} requests left, resets at {reset}"
+        return self.last_error or "GitHub API: no requests made yet"
+
+    def get_json(self, api_url, background=False, cached_only=False):
+        """Fetch an API URL, returns cached data when fresh enough or when GitHub cannot answer
+
+        With cached_only nothing is requested, the cached data is returned however old, or None.
+        """
+        with self.lock:
+            entry = self.cached_entry(api_url)
+            if entry and (cached_only or time.time() - entry['fetched_at'] < self.max_age()):
+                TRACER.count_cache("github", True)
+                return entry['data']
+            if cached_only:
+                return None
+            remaining = self.calls_available()
+            if remaining is not None and remaining <= (GITHUB_RESERVED_CALLS if background else 0):
+                if entry:
+                    return entry['data']
+                raise GitHubRateLimited(self.status_text())
+
+        headers = {'Accept': "application/vnd.github+json"}
+        if self.auth_token():
+            headers['Authorization'] = f"Bearer {self.auth_token()}"
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        try:
+            response = requests.get(api_url, headers=headers, timeout=10)
+        except requests.RequestException as e:
+            self.last_error = f"GitHub API unreachable: {e}"
+            if entry:
+                return entry['data']
+            raise
+
+        with self.lock:
+            self.update_rate_limit(response)
+            if response.status_code == 304 and entry:
+                TRACER.count_cache("github", True)
+                self.store_entry(api_url, dict(entry, fetched_at=time.time()))
+                return entry['data']
+            if response.status_code == 200:
+                TRACER.count_cache("github", False)
+                data = response.json()
+                self.store_entry(api_url, {'etag': response.headers.get('ETag'), 'fetched_at': time.time(), 'data': data})
+                self.last_error = ""
+                return data
+
+            self.last_error = f"GitHub API returned HTTP {response.status_code}"
+            if entry:
+                return entry['data']
+            if self.rate_limited():
+                raise GitHubRateLimited(self.status_text())
+        raise Exception(self.last_error)
+
+GITHUB = GitHubClient()
+
+def github_repo_path(repo_url):
+    """'owner/repo' for a github.com URL, None for anything else"""
+    if "github.com/" not in repo_url:
+        return None
+    parts = repo_url.split("github.com/")[1].split("/")
+    if len(parts) < 2:
+        return None
+    return f"{parts[0]}/{parts[1]}"
 
-                filename = download_url.split('/')[-1]  
-                parts = download_url.split('/releases/latest/download/')
-                if len(parts) == 2:
-                    base_url = parts[0]
-                    download_url = f"{base_url}/releases/download/{self.version}/{filename}"
+def get_github_releases(repo_url, background=False, cached_only=False):
+    """Releases of the repository behind a github.com URL, newest first, or None"""
+    repo_path = github_repo_path(repo_url)
+    if not repo_path:
+        return None
+    try:
+        return GITHUB.get_json(f"{GITHUB_API_URL}/repos/{repo_path}/releases", background, cached_only)
+    except Exception as e:
+        # Callers fall back to 'latest', GITHUB.status_text() tells the user why
+        GITHUB.last_error = str(e)
+        return None
 
-            file_extension = download_url.split('.')[-1].lower()
-            download_filename = f"{app_name}_{self.actual_version}.{file_extension}"
-            download_path = os.path.join(app_dir, download_filename)
+def jittered(seconds):
+    return seconds * random.uniform(1 - RELEASE_TTL_JITTER, 1 + RELEASE_TTL_JITTER)
 
-            self.info.emit(f"Downloading {app_name} {self.actual_version}...")
+def release_check_interval(releases):
+    """Seconds until an app is checked again, a quarter of its usual gap between releases"""
+    dates = []
+    for release in (releases or [])[:6]:
+        try:
+            dates.append(datetime.fromisoformat(release['published_at'].replace("Z", "+00:00")).timestamp())
+        except (KeyError, TypeError, AttributeError, ValueError):
+            continue
+    if len(dates) < 2:
+        return RELEASE_TTL_MAX
 
-            response = requests.get(download_url, stream=True)
+    dates.sort()
+    gaps = sorted(later - earlier for earlier, later in zip(dates, dates[1:]))
+    return min(max(gaps[len(gaps) // 2] / 4, RELEASE_TTL_MIN), RELEASE_TTL_MAX)
 
-            if response.status_code != 200:
-                raise Exception(f"Download failed with status code: {response.status_code}")
+def is_version_newer(latest_version, current_version):
+    """Compare versions to determine if an update is available"""
+    if latest_version == "latest" or current_version == "latest":
+        return False
 
-            total_size = int(response.headers.get('content-length', 0))
+    latest = latest_version.lstrip('v')
+    current = current_version.lstrip('v')
+
+    try:
+        latest_parts = [int(x) for x in latest.split('.')]
+        current_parts = [int(x) for x in current.split('.')]
+
+        max_len = max(len(latest_parts), len(current_parts))
+        latest_parts.extend([0] * (max_len - len(latest_parts)))
+        current_parts.extend([0] * (max_len - len(current_parts)))
+
+        return latest_parts > current_parts
+    except ValueError:
+
+        return latest != current
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for data in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(data)
+    return digest.hexdigest()
+
+def delta_asset_name(from_version, to_version):
+    return f"qypher-{from_version}-to-{to_version}.qdelta"
+
+def published_asset_sha256(release_data, asset):
+    """The SHA-256 GitHub reports for an asset, or one published as '<asset>.sha256' next to it"""
+    digest = asset.get('digest') or ""
+    if digest.startswith("sha256:"):
+        return digest[len("sha256:"):].lower()
+
+    for candidate in release_data.get('assets', []):
+        if candidate['name'] == f"{asset['name']}.sha256":
+            try:
+                response = requests.get(candidate['browser_download_url'], timeout=10)
+                if response.status_code == 200:
+                    return response.text.split()[0].lower()
+            except Exception:
+                pass
+    return None
+
+def make_delta(old, new, block_size=DELTA_BLOCK_SIZE):
+    """Build a patch that turns the bytes old into the bytes new"""
+    old_view = memoryview(old)
+    new_view = memoryview(new)
+    index = {}
+    for offset in range(0, len(old) - block_size + 1, block_size):
+        index.setdefault(zlib.adler32(old_view[offset:offset + block_size]), offset)
+
+    ops = bytearray()
+    literal_start = 0
+    position = 0
+    new_size = len(new)
+    while position + block_size <= new_size:
+        block = new_view[position:position + block_size]
+        offset = index.get(zlib.adler32(block))
+        if offset is None or old_view[offset:offset + block_size] != block:
+            position += 1
+            continue
+
+        # Grow the match backwards into pending literal bytes, then forwards block by block
+        start = position
+        while start > literal_start and offset > 0 and old[offset - 1] == new[start - 1]:
+            start -= 1
+            offset -= 1
+        end = position + block_size
+        old_end = offset + (end - start)
+        while (end + block_size <= new_size and
+               old_view[old_end:old_end + block_size] == new_view[end:end + block_size]):
+            end += block_size
+            old_end += block_size
+        while end < new_size and old_end < len(old) and old[old_end] == new[end]:
+            end += 1
+            old_end += 1
+
+        if start > literal_start:
+            ops += b"D" + struct.pack("<I", start - literal_start) + new_view[literal_start:start]
+        ops += b"C" + struct.pack("<QI", offset, end - start)
+        literal_start = position = end
+
+    if new_size > literal_start:
+        ops += b"D" + struct.pack("<I", new_size - literal_start) + new_view[literal_start:]
+
+    header = (DELTA_MAGIC + hashlib.sha256(old).digest() + hashlib.sha256(new).digest() +
+              struct.pack("<Q", new_size))
+    return header + zlib.compress(bytes(ops), 9)
+
+def apply_delta(old, patch):
+    """Rebuild the new file from old and a patch made by make_delta, verifying both ends"""
+    header_size = len(DELTA_MAGIC) + 32 + 32 + 8
+    if len(patch) < header_size or not patch.startswith(DELTA_MAGIC):
+        raise ValueError("Not a Qypher delta patch")
+
+    source_digest = patch[len(DELTA_MAGIC):len(DELTA_MAGIC) + 32]
+    target_digest = patch[len(DELTA_MAGIC) + 32:len(DELTA_MAGIC) + 64]
+    target_size, = struct.unpack("<Q", patch[len(DELTA_MAGIC) + 64:header_size])
+    if hashlib.sha256(old).digest() != source_digest:
+        raise ValueError("Patch does not apply to this file")
 
-            with open(download_path, 'wb') as f:
+    try:
+        ops = zlib.decompress(patch[header_size:])
+    except zlib.error as e:
+        raise ValueError(f"Corrupt patch data ({e})")
+    output = bytearray()
+    position = 0
+    while position < len(ops):
+        op = ops[position:position + 1]
+        try:
+            if op == b"C":
+                offset, length = struct.unpack_from("<QI", ops, position + 1)
+                output += old[offset:offset + length]
+                position += 13
+            elif op == b"D":
+                length, = struct.unpack_from("<I", ops, position + 1)
+                output += ops[position + 5:position + 5 + length]
+                position += 5 + length
+            else:
+                raise ValueError(f"Corrupt patch operation at {position}")
+        except struct.error:
+            raise ValueError(f"Truncated patch operation at {position}")
+
+    if len(output) != target_size or hashlib.sha256(output).digest() != target_digest:
+        raise ValueError("Patched file does not match the patch's target hash")
+    return bytes(output)
+
+def make_delta_file(old_path, new_path, patch_path):
+    with open(old_path, 'rb') as f:
+        old = f.read()
+    with open(new_path, 'rb') as f:
+        new = f.read()
+    patch = make_delta(old, new)
+    with open(patch_path, 'wb') as f:
+        f.write(patch)
+    return len(patch)
+
+def apply_delta_file(old_path, patch_path, output_path):
+    with open(old_path, 'rb') as f:
+        old = f.read()
+    with open(patch_path, 'rb') as f:
+        patch = f.read()
+    new = apply_delta(old, patch)
+    with open(output_path, 'wb') as f:
+        f.write(new)
+
+def resolve_download_url(download_url, version):
+    """Turn a manifest's latest-download URL into the URL for a pinned version"""
+    if version != "latest":
+
+        filename = download_url.split('/')[-1]  
+        parts = download_url.split('/releases/latest/download/')
+        if len(parts) == 2:
+            base_url = parts[0]
+            download_url = f"{base_url}/releases/download/{version}/{filename}"
+    return download_url
+
+def mirror_urls(app_data, version, actual_version):
+    """Alternate download URLs from the manifest's 'mirrors', '{version}' is filled in with the release tag"""
+    urls = []
+    for mirror in app_data.mirrors:
+        if "{version}" in mirror:
+            if actual_version != "latest":
+                urls.append(mirror.replace("{version}", actual_version))
+        else:
+            urls.append(resolve_download_url(mirror, version))
+    return urls
+
+class MirrorError(Exception):
+    pass
+
+class MirrorStats:
+    """Per-host download throughput and error rates, kept across sessions to rank mirrors
+
+    Each update re-reads the file before writing it, so worker processes do not drop
+    each other's measurements.
+    """
+
+    def __init__(self, path=MIRROR_STATS):
+        self.path = path
+        self.lock = threading.Lock()
+        self.loaded_hosts = None
+
+    @property
+    def hosts(self):
+        # Read on first use rather than on import
+        if self.loaded_hosts is None:
+            self.loaded_hosts = self.load()
+        return self.loaded_hosts
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def healthy(self, host):
+        entry = self.hosts.get(host)
+        return (entry is None or entry['failures'] < MIRROR_MAX_FAILURES or
+                time.time() - entry['last_failure'] > MIRROR_FAILURE_COOLDOWN)
+
+    def throughput(self, host):
+        entry = self.hosts.get(host)
+        return entry['throughput'] if entry else None
+
+    def rank(self, urls):
+        """Order download URLs fastest healthy first; unmeasured hosts go ahead of measured ones to get a sample"""
+        def key(item):
+            index, url = item
+            host = urlsplit(url).netloc
+            if not self.healthy(host):
+                return 2, 0, index
+            entry = self.hosts.get(host)
+            if entry is None or entry['throughput'] is None:
+                return 0, 0, index
+            return 1, -entry['throughput'] * (1 - entry['error_rate']), index
+        unique = list(dict.fromkeys(urls))
+        return [url for _, url in sorted(enumerate(unique), key=key)]
+
+    def faster_than(self, url, throughput):
+        """Whether url's host has been clearly faster than the given bytes per second"""
+        host = urlsplit(url).netloc
+        recorded = self.throughput(host)
+        return recorded is not None and self.healthy(host) and recorded > throughput * MIRROR_SWITCH_FACTOR
+
+    def record(self, url, received, elapsed, ok):
+        host = urlsplit(url).netloc
+        with self.lock:
+            hosts = self.load()
+            entry = hosts.get(host) or {'throughput': None, 'error_rate': 0.0, 'failures': 0,
+                                        'last_failure': 0, 'bytes': 0}
+            if received >= MIRROR_MIN_SAMPLE and elapsed > 0:
+                sample = received / elapsed
+                entry['throughput'] = sample if entry['throughput'] is None else (
+                    (1 - MIRROR_SMOOTHING) * entry['throughput'] + MIRROR_SMOOTHING * sample)
+            entry['error_rate'] = (1 - MIRROR_SMOOTHING) * entry['error_rate'] + MIRROR_SMOOTHING * (0 if ok else 1)
+            if ok:
+                entry['failures'] = 0
+            else:
+                entry['failures'] += 1
+                entry['last_failure'] = time.time()
+            entry['bytes'] += received
+            hosts[host] = entry
+            self.loaded_hosts = hosts
+            try:
+                temp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(temp_path, 'w') as f:
+                    json.dump(hosts, f, indent=2)
+                os.replace(temp_path, self.path)
+            except OSError:
+                pass
+
+MIRRORS = MirrorStats()
+
+def staging_path(install_dir, app_name, version):
+    return os.path.join(install_dir, STAGING_DIR_NAME, f"{app_name}-{version}")
+
+def download_from_mirrors(job, urls, download_path, traffic_class, label, expected_sha256=None, expected_size=None):
+    """Stream a release asset from the best ranked mirror, returns its SHA-256
+
+    A mirror that fails, or crawls while another has been clearly faster, hands over to
+    the next one, which resumes with a range request. Bytes from different mirrors are
+    only combined when the expected hash can prove the result, otherwise the next mirror
+    starts over. A known size is allocated up front so the file is not grown piecemeal.
+    """
+    candidates = MIRRORS.rank(urls)
+    errors = []
+    digest = hashlib.sha256()
+    downloaded = 0
+    total_size = expected_size or 0
+    source = None
+
+    try:
+        with open(download_path, 'wb') as f:
+            if expected_size:
+                f.truncate(expected_size)
+            while candidates:
+                url = candidates.pop(0)
+                if downloaded and not expected_sha256 and url != source:
+                    f.seek(0)
+                    f.truncate(expected_size or 0)
+                    digest, downloaded = hashlib.sha256(), 0
+
+                job.set_info(f"Downloading {label} from {urlsplit(url).netloc}...")
+                headers = {'Range': f"bytes={downloaded}-"} if downloaded else {}
+                started, received = time.monotonic(), 0
+                response = None
+                try:
+                    response = requests.get(url, headers=headers, stream=True, timeout=(10, 30))
+                    if response.status_code == 200:
+                        if downloaded:
+                            # Range ignored, start over from this mirror
+                            f.seek(0)
+                            digest, downloaded = hashlib.sha256(), 0
+                        total_size = int(response.headers.get('content-length', 0)) or total_size
+                    elif response.status_code == 206 and downloaded:
+                        content_range = response.headers.get('Content-Range', "")
+                        if not content_range.startswith(f"bytes {downloaded}-"):
+                            raise MirrorError("mirror resumed at the wrong offset")
+                        if total_size and not content_range.endswith(f"/{total_size}"):
+                            raise MirrorError("mirror has a different file")
+                    else:
+                        raise MirrorError(f"status code {response.status_code}")
+                    source = url
+
+                    for data in iter_download(response, traffic_class, job.check):
+                        job.check()
+                        f.write(data)
+                        digest.update(data)
+                        downloaded += len(data)
+                        received += len(data)
+                        if total_size > 0:
+                            job.set_progress(int((downloaded / total_size) * 50))
+                        elapsed = time.monotonic() - started
+                        if (elapsed > MIRROR_PROBE_SECONDS and candidates and
+                                MIRRORS.faster_than(candidates[0], received / elapsed)):
+                            MIRRORS.record(url, received, elapsed, True)
+                            candidates.append(url)
+                            break
+                    else:
+                        if total_size and downloaded < total_size:
+                            raise MirrorError("connection closed early")
+                        f.truncate(downloaded)
+                        MIRRORS.record(url, received, time.monotonic() - started, True)
+                        return digest.hexdigest()
+                except (requests.RequestException, MirrorError) as e:
+                    MIRRORS.record(url, received, time.monotonic() - started, False)
+                    errors.append(f"{urlsplit(url).netloc}: {e}")
+                finally:
+                    if response is not None:
+                        response.close()
+    except BaseException:
+        os.remove(download_path)
+        raise
+
+    os.remove(download_path)
+    raise Exception(f"Download failed ({'; '.join(errors)})")
+
+def latest_release(releases):
+    """Same choice as GitHub's /releases/latest, the newest release that is neither a draft nor a prerelease"""
+    return next((r for r in releases or [] if isinstance(r, dict) and not r.get('draft') and not r.get('prerelease')),
+                None)
+
+def select_release_asset(release, url):
+    """The asset of a release that url refers to, by name or as the only one of its file type"""
+    assets = release.get('assets', [])
+    filename = url.split('/')[-1]
+    asset = next((a for a in assets if a['name'] == filename), None)
+    if asset or '.' not in filename:
+        return asset
+    # Names that carry the version, like app-1.2.zip, when the choice is unambiguous
+    extension = filename.rsplit('.', 1)[1].lower()
+    candidates = [a for a in assets if a['name'].lower().endswith(f".{extension}")]
+    return candidates[0] if len(candidates) == 1 else None
+
+def plan_install(app_data, version, download_url=None):
+    """Decide what to download from the release metadata, the only GitHub lookup an install makes
+
+    Returns the resolved version, download URL, file type and the size and hash GitHub
+    reports for the asset. Without metadata it falls back to the manifest URL.
+    """
+    plan = {'version': version, 'download_url': download_url or resolve_download_url(app_data.url, version),
+            'size': None, 'sha256': None}
+    releases = get_github_releases(app_data.url) or []
+    if version == "latest":
+        release = latest_release(releases)
+    else:
+        release = next((r for r in releases if r.get('tag_name') == version), None)
+
+    asset = None
+    if release:
+        plan['version'] = release.get('tag_name', version)
+        asset = select_release_asset(release, download_url or app_data.url)
+    if asset:
+        plan['download_url'] = download_url or asset['browser_download_url']
+        plan['size'] = asset.get('size')
+        plan['sha256'] = published_asset_sha256(release, asset)
+    plan['extension'] = (asset['name'] if asset else plan['download_url']).split('.')[-1].lower()
+    return plan
+
+def ensure_free_space(path, required):
+    free = shutil.disk_usage(path).free
+    if required + DISK_SPACE_MARGIN > free:
+        raise Exception(f"Not enough disk space: {required / (1024 * 1024):.0f} MB needed, "
+                        f"{free / (1024 * 1024):.0f} MB free")
+
+@traced("download artifact", "network")
+def download_artifact(job, app_data, version, install_dir, download_url=None, expected_sha256=None,
+                      traffic_class=TRAFFIC_FOREGROUND):
+    """Download an app release into the staging area and verify its hash"""
+    app_name = app_data.name
+    plan = plan_install(app_data, version, download_url)
+    actual_version = plan['version']
+    if version == "latest" and actual_version != "latest":
+        job.set_info(f"Latest version resolved to: {actual_version}")
+
+    download_url = plan['download_url']
+    file_extension = plan['extension']
+    staging_dir = staging_path(install_dir, app_name, actual_version)
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    Path(staging_dir).parent.mkdir(parents=True, exist_ok=True)
+    download_path = f"{staging_dir}.{file_extension}.part"
+    if plan['size']:
+        # An archive is at least its own size again once extracted
+        ensure_free_space(Path(staging_dir).parent, plan['size'] * (2 if file_extension == 'zip' else 1))
+
+    urls = [download_url] + mirror_urls(app_data, version, actual_version)
+
+    # Peers and mixing mirrors are only trusted because the hash is known up front
+    expected_sha256 = expected_sha256 or plan['sha256']
+    expected_sha256 = expected_sha256.lower() if expected_sha256 else None
+
+    sha256 = None
+    if expected_sha256 and peer_urls():
+        job.set_info(f"Downloading {app_name} {actual_version} from a LAN peer...")
+        if fetch_from_peers(expected_sha256, file_extension, download_url, download_path, job.check,
+                            lambda fraction: job.set_progress(int(fraction * 50)), job.set_info):
+            sha256 = expected_sha256
+    if sha256 is None:
+        sha256 = download_from_mirrors(job, urls, download_path, traffic_class,
+                                       f"{app_name} {actual_version}", expected_sha256, plan['size'])
+
+    if expected_sha256 and sha256 != expected_sha256:
+        os.remove(download_path)
+        raise Exception(f"Hash mismatch for {app_name}: expected {expected_sha256}, got {sha256}")
+
+    return {
+        'name': app_name,
+        'version': actual_version,
+        'path': download_path,
+        'extension': file_extension,
+        'sha256': sha256,
+        'download_url': download_url,
+        'staging_dir': staging_dir
+    }
+
+@traced("extract artifact", "disk")
+def extract_artifact(job, artifact):
+    """Unpack a downloaded artifact into its staging directory, returns the file index it records on artifact"""
+    staging_dir = artifact['staging_dir']
+    Path(staging_dir).mkdir(parents=True, exist_ok=True)
+
+    files = {}
+    if artifact['extension'] == 'zip':
+        job.set_info("Extracting files...")
+        with open_artifact(artifact) as source, zipfile.ZipFile(source, 'r') as zip_ref:
+            members = zip_ref.infolist()
+            ensure_free_space(staging_dir, sum(member.file_size for member in members))
+            for index, member in enumerate(members, 1):
+                job.check()
+                path = zip_ref.extract(member, staging_dir)
+                if not member.is_dir():
+                    files[member.filename] = [member.file_size, file_sha256(path)]
+                job.set_progress(50 + int((index / len(members)) * 40))
+        if not artifact.get('bundle'):
+            cache_artifact(artifact['path'], artifact['sha256'], artifact['extension'])
+    else:
+        download_filename = f"{artifact['name']}_{artifact['version']}.{artifact['extension']}"
+        if artifact.get('bundle'):
+            with open_artifact(artifact) as source, open(os.path.join(staging_dir, download_filename), 'wb') as f:
+                shutil.copyfileobj(source, f, RANGE_READ_BUFFER)
+        else:
+            shutil.move(artifact['path'], os.path.join(staging_dir, download_filename))
+        files[download_filename] = [os.path.getsize(os.path.join(staging_dir, download_filename)), artifact['sha256']]
+        share_artifact(os.path.join(staging_dir, download_filename), artifact['sha256'], artifact['extension'])
+    artifact['files'] = files
+    return files
+
+def resolve_executable(files, filename):
+    """Relative path of the program to launch, picked once from the installed file index"""
+    if filename in files:
+        return filename
+    programs = sorted((name for name in files if name.lower().endswith('.exe')),
+                      key=lambda name: (name.count('/'), name))
+    named = [name for name in programs if os.path.basename(name).lower() == filename.lower()]
+    if named:
+        return named[0]
+    if programs:
+        return programs[0]
+    # A single-file app is stored under its versioned download name
+    return next(iter(files)) if len(files) == 1 else None
+
+@traced("activate staged", "disk")
+def activate_staged(job, artifact, app_data, install_dir):
+    """Move a staged app into place and write its app_info.json"""
+    app_name = artifact['name']
+    staging_dir = artifact['staging_dir']
+    app_dir = os.path.join(install_dir, app_name)
+
+    if os.path.exists(staging_dir + ".json"):
+        os.remove(staging_dir + ".json")
+
+    # Moves keep modification times, so the index can be stat-ed while still in staging
+    file_index = {}
+    for name, (size, sha256) in artifact.get('files', {}).items():
+        stat = os.stat(os.path.join(staging_dir, name))
+        file_index[name] = [size, stat.st_mtime_ns, sha256]
+
+    app_info = {
+        'name': app_name,
+        'version': artifact['version'],
+        'installed_path': app_dir,
+        'executable': app_data.filename,
+        'executable_path': resolve_executable(file_index, app_data.filename),
+        'install_date': str(Path().resolve()),
+        'download_url': artifact['download_url'],
+        'sha256': artifact['sha256'],
+        'files': file_index
+    }
+
+    with open(os.path.join(staging_dir, "app_info.json"), 'w') as f:
+        json.dump(app_info, f, indent=4)
+
+    if not os.path.exists(app_dir):
+        os.replace(staging_dir, app_dir)
+        return
+
+    # Overlay onto the existing directory so files the app created itself survive updates
+    for root, dirs, files in os.walk(staging_dir):
+        target_root = os.path.join(app_dir, os.path.relpath(root, staging_dir))
+        Path(target_root).mkdir(parents=True, exist_ok=True)
+        for name in files:
+            os.replace(os.path.join(root, name), os.path.join(target_root, name))
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+def open_artifact(artifact):
+    """Binary file for a downloaded artifact, or a view of it inside an offline bundle"""
+    if artifact.get('bundle'):
+        return io.BufferedReader(BundleMemberFile(artifact['bundle'], artifact['member']), RANGE_READ_BUFFER)
+    return open(artifact['path'], 'rb')
+
+def discard_artifact(artifact):
+    for path in (artifact['path'], artifact['staging_dir'] + ".json"):
+        if path and os.path.exists(path):
+            os.remove(path)
+    shutil.rmtree(artifact['staging_dir'], ignore_errors=True)
+
+def cached_artifact_path(sha256, extension):
+    return os.path.join(ARTIFACT_CACHE, f"{sha256}.{extension}")
+
+def cache_artifact(path, sha256, extension, copy=False):
+    """Keep a downloaded archive for repairs, evicting the least recently used ones over the limit"""
+    limit = QSettings(ORGANIZATION, APP_NAME).value("artifacts/max_mb", DEFAULT_ARTIFACT_CACHE_MB, type=int) * 1024 * 1024
+    if os.path.getsize(path) > limit:
+        if not copy:
+            os.remove(path)
+        return
+    if copy:
+        shutil.copyfile(path, cached_artifact_path(sha256, extension))
+    else:
+        shutil.move(path, cached_artifact_path(sha256, extension))
+
+    entries = sorted((entry.stat().st_atime, entry.stat().st_size, entry.path)
+                     for entry in os.scandir(ARTIFACT_CACHE) if entry.is_file() and not entry.name.endswith(".part"))
+    total = sum(size for _, size, _ in entries)
+    for _, size, cached_path in entries:
+        if total <= limit:
+            break
+        try:
+            os.remove(cached_path)
+        except OSError:
+            # Still being sent to a peer, it goes on a later pass
+            continue
+        total -= size
+
+def share_artifact(path, sha256, extension):
+    """Copy a verified single-file artifact into the cache when this launcher serves LAN peers"""
+    if QSettings(ORGANIZATION, APP_NAME).value("peers/serve", False, type=bool):
+        cache_artifact(path, sha256, extension, copy=True)
+
+def peer_urls():
+    return QSettings(ORGANIZATION, APP_NAME).value("peers/urls", [], type=list)
+
+def request_from_peer(peer, sha256, extension, upstream_url, check=None, info=None):
+    """Ask a peer for an artifact, waiting while it fetches a missing one from upstream"""
+    last_fetched, last_change = None, time.monotonic()
+    while True:
+        try:
+            response = requests.get(f"{peer}/artifacts/{sha256}.{extension}", params={'url': upstream_url},
+                                    stream=True, timeout=(PEER_CONNECT_TIMEOUT, 60))
+        except requests.RequestException:
+            return None
+        if response.status_code == 200:
+            return response
+        response.close()
+        if response.status_code != 503 or 'X-Fetched-Bytes' not in response.headers:
+            return None
+
+        # The peer is downloading it for everyone, give up only if that stops moving
+        fetched = int(response.headers['X-Fetched-Bytes'])
+        if fetched != last_fetched:
+            last_fetched, last_change = fetched, time.monotonic()
+        elif time.monotonic() - last_change > PEER_FETCH_STALL_SECONDS:
+            return None
+        if info:
+            info(f"LAN peer is fetching the release ({fetched / (1024 * 1024):.1f} MB so far)...")
+        if check:
+            check()
+        time.sleep(int(response.headers.get('Retry-After', 1)))
+
+def fetch_from_peers(sha256, extension, upstream_url, path, check=None, progress=None, info=None):
+    """Download an artifact with a known hash from a LAN peer, True when path holds a verified copy
+
+    The upstream URL goes along so a sharing peer can fetch a release it does not have yet.
+    LAN transfers bypass the bandwidth shaper, its limits are for the internet link.
+    """
+    for peer in peer_urls():
+        response = request_from_peer(peer, sha256, extension, upstream_url, check, info)
+        if response is None:
+            continue
+
+        total_size = int(response.headers.get('content-length', 0))
+        digest = hashlib.sha256()
+        try:
+            # Closing the response hands its connection back to the pool before the next peer
+            with response, open(path, 'wb') as f:
                 downloaded = 0
-                for data in response.iter_content(chunk_size=4096):
+                for data in response.iter_content(chunk_size=65536):
+                    if check:
+                        check()
                     f.write(data)
+                    digest.update(data)
                     downloaded += len(data)
-                    if total_size > 0:
-                        progress = int((downloaded / total_size) * 50)
-                        self.progress.emit(progress)
+                    if progress and total_size > 0:
+                        progress(downloaded / total_size)
+        except requests.RequestException:
+            os.remove(path)
+            continue
+        except BaseException:
+            os.remove(path)
+            raise
+
+        if digest.hexdigest() == sha256:
+            TRACER.count_cache("peer", True)
+            return True
+        os.remove(path)
+    TRACER.count_cache("peer", False)
+    return False
+
+class PeerCacheServer:
+    """Serve the artifact cache to other launchers on the LAN
+
+    Requests name an artifact by hash. A miss starts one background fetch from the upstream
+    URL the client sends and is answered with 503 and the bytes fetched so far, so however
+    many clients ask at once a fleet costs one WAN download per release. Only GitHub URLs
+    are fetched on behalf of peers.
+    """
+
+    def __init__(self, port=PEER_CACHE_PORT):
+        self.port = port
+        self.httpd = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.fetches = {}
+        self.served = 0
+        self.bytes_served = 0
+        self.pulled = 0
+
+    def start(self):
+        # Only needed when sharing is switched on
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.handle(self)
+
+        self.httpd = ThreadingHTTPServer(("", self.port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="Qypher peer cache", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+            self.thread = None
+
+    def status_text(self):
+        with self.lock:
+            return (f"Sharing on port {self.port}: {self.served} download(s) served, "
+                    f"{self.bytes_served / (1024 * 1024):.1f} MB sent, {self.pulled} fetched from GitHub")
+
+    def handle(self, request):
+        url = urlsplit(request.path)
+        match = PEER_ARTIFACT_PATTERN.fullmatch(url.path)
+        if not match:
+            request.send_error(404)
+            return
+        sha256, extension = match.groups()
+        path = cached_artifact_path(sha256, extension)
+        try:
+            if os.path.exists(path):
+                self.send_file(request, path)
+                return
+            state = self.start_fetch(parse_qs(url.query).get('url', [None])[0], sha256, extension)
+            if state is None or state['failed']:
+                request.send_error(404)
+                return
+            request.send_response(503)
+            request.send_header('Retry-After', "1")
+            request.send_header('X-Fetched-Bytes', str(state['bytes']))
+            request.send_header('Content-Length', "0")
+            request.end_headers()
+        except (ConnectionError, OSError):
+            pass
+
+    def start_fetch(self, upstream_url, sha256, extension):
+        """Fetch state of a missing artifact, starting the download if nobody has yet"""
+        if not upstream_url or not upstream_url.startswith(PEER_UPSTREAM_PREFIXES):
+            return None
+        with self.lock:
+            state = self.fetches.get(sha256)
+            if state is None:
+                state = {'bytes': 0, 'failed': False}
+                self.fetches[sha256] = state
+                threading.Thread(target=self.fetch, args=(upstream_url, sha256, extension, state),
+                                 name="Qypher peer fetch", daemon=True).start()
+            elif state['failed']:
+                # Report the failure once, the next request tries again
+                del self.fetches[sha256]
+        return state
+
+    def fetch(self, upstream_url, sha256, extension, state):
+        path = cached_artifact_path(sha256, extension)
+        part_path = f"{path}.part"
+        digest = hashlib.sha256()
+        try:
+            response = requests.get(upstream_url, stream=True, timeout=30)
+            if response.status_code != 200:
+                raise Exception(f"HTTP {response.status_code}")
+            with open(part_path, 'wb') as f:
+                # Foreground, a peer is waiting for it
+                for data in iter_download(response, TRAFFIC_FOREGROUND):
+                    f.write(data)
+                    digest.update(data)
+                    state['bytes'] += len(data)
+            if digest.hexdigest() != sha256:
+                raise Exception("hash mismatch")
+            cache_artifact(part_path, sha256, extension)
+            if not os.path.exists(path):
+                raise Exception("larger than the artifact cache")
+        except Exception:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            state['failed'] = True
+            return
+        with self.lock:
+            self.pulled += 1
+            self.fetches.pop(sha256, None)
+
+    def send_file(self, request, path):
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            start, end = 0, size - 1
+            byte_range = re.fullmatch(r"bytes=(\d+)-(\d*)", request.headers.get('Range', ""))
+            if byte_range:
+                start = int(byte_range.group(1))
+                end = min(int(byte_range.group(2) or end), end)
+                if start > end:
+                    request.send_error(416)
+                    return
+                request.send_response(206)
+                request.send_header('Content-Range', f"bytes {start}-{end}/{size}")
+            else:
+                request.send_response(200)
+            request.send_header('Content-Type', "application/octet-stream")
+            request.send_header('Content-Length', str(end - start + 1))
+            request.send_header('Accept-Ranges', "bytes")
+            request.end_headers()
+            # Serving counts as a use for the LRU eviction
+            os.utime(path)
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                data = f.read(min(remaining, 1024 * 1024))
+                if not data:
+                    break
+                request.wfile.write(data)
+                remaining -= len(data)
+        with self.lock:
+            self.served += 1
+            self.bytes_served += end - start + 1 - remaining
+
+def find_staged_artifact(install_dir, app_name, version):
+    """Return the artifact of a fully pre-staged update, or None"""
+    staging_dir = staging_path(install_dir, app_name, version)
+    try:
+        with open(staging_dir + ".json", 'r') as f:
+            artifact = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not os.path.isdir(staging_dir):
+        return None
+    return artifact
+
+def clear_stale_staging(install_dir, app_name, keep_version=None):
+    """Remove pre-staged versions of an app other than keep_version"""
+    staging_root = os.path.join(install_dir, STAGING_DIR_NAME)
+    if not os.path.isdir(staging_root):
+        return
+    for entry in os.listdir(staging_root):
+        if not entry.endswith(".json") or not entry.startswith(f"{app_name}-"):
+            continue
+        version = entry[len(app_name) + 1:-len(".json")]
+        if version != keep_version:
+            staging_dir = staging_path(install_dir, app_name, version)
+            os.remove(staging_dir + ".json")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+def prestage_application(job, app_data, version, install_dir):
+    """Download and extract an update into staging so applying it later is only an activation"""
+    clear_stale_staging(install_dir, app_data.name, version)
+    with job.slot(NETWORK_SLOT):
+        artifact = download_artifact(job, app_data, version, install_dir, traffic_class=TRAFFIC_BACKGROUND)
 
-            if file_extension == 'zip':
-                self.info.emit("Extracting files...")
-                self.progress.emit(75)
-                with zipfile.ZipFile(download_path, 'r') as zip_ref:
-                    zip_ref.extractall(app_dir)
+    try:
+        with job.slot(DISK_SLOT):
+            extract_artifact(job, artifact)
+        with open(artifact['staging_dir'] + ".json", 'w') as f:
+            json.dump(artifact, f, indent=4)
+    except BaseException:
+        discard_artifact(artifact)
+        raise
+
+    job.set_progress(100)
+    job.set_info("Update staged")
+    return artifact['version']
+
+def get_idle_seconds():
+    """Seconds since the last keyboard or mouse input, None when the platform cannot tell"""
+    if sys.platform != "win32":
+        return None
+    try:
+        import ctypes
 
-                os.remove(download_path)
+        class LASTINPUTINFO(ctypes.Structure):
+            _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
 
-            self.progress.emit(90)
+        info = LASTINPUTINFO()
+        info.cbSize = ctypes.sizeof(info)
+        if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(info)):
+            return None
+        return ((ctypes.windll.kernel32.GetTickCount() - info.dwTime) & 0xFFFFFFFF) / 1000.0
+    except Exception:
+        return None
 
-            app_manifest_path = os.path.join(app_dir, "app_info.json")
-            app_info = {
-                'name': app_name,
-                'version': self.actual_version,
-                'installed_path': app_dir,
-                'executable': self.app_data.get('filename', ''),
-                'install_date': str(Path().resolve())  
-            }
+def release_process_memory():
+    """Hand freed heap pages back to the OS so a trimmed process actually shrinks"""
+    try:
+        import ctypes
+        if sys.platform == "win32":
+            ctypes.windll.psapi.EmptyWorkingSet(ctypes.windll.kernel32.GetCurrentProcess())
+        elif sys.platform.startswith("linux"):
+            ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except Exception:
+        pass
+
+def is_connection_metered():
+    """Whether the active connection is metered, False when Qt has no backend to ask"""
+    if QNetworkInformation.instance() is None:
+        if not QNetworkInformation.loadBackendByFeatures(QNetworkInformation.Feature.Metered):
+            return False
+    return QNetworkInformation.instance().isMetered()
+
+def install_application(job, app_data, version, install_dir, download_url=None, expected_sha256=None):
+    """Download, verify, extract and activate an application, returns the installed version"""
+    artifact = find_staged_artifact(install_dir, app_data.name, version)
+    if artifact and (not expected_sha256 or artifact['sha256'] == expected_sha256.lower()):
+        job.set_info(f"Applying staged update {artifact['version']}...")
+        try:
+            activate_staged(job, artifact, app_data, install_dir)
+        except BaseException:
+            discard_artifact(artifact)
+            raise
+        job.set_progress(100)
+        job.set_info("Installation completed!")
+        return artifact['version']
+
+    with job.slot(NETWORK_SLOT):
+        artifact = download_artifact(job, app_data, version, install_dir, download_url, expected_sha256)
 
-            with open(app_manifest_path, 'w') as f:
-                json.dump(app_info, f, indent=4)
+    try:
+        with job.slot(DISK_SLOT):
+            extract_artifact(job, artifact)
+            job.set_progress(90)
+            activate_staged(job, artifact, app_data, install_dir)
+    except BaseException:
+        discard_artifact(artifact)
+        raise
+
+    job.set_progress(100)
+    job.set_info("Installation completed!")
+    return artifact['version']
+
+def bundle_member_name(sha256, extension):
+    return f"artifacts/{sha256}.{extension}"
+
+def bundle_releases_name(repo_path):
+    return f"releases/{repo_path.replace('/', '__')}.json"
+
+def export_bundle(job, path, entries, manifest_sources, manifest_repos):
+    """Write an offline bundle: manifests, release metadata and the artifacts of the given lockfile entries
+
+    Members are stored uncompressed, archives gain nothing from deflate, and it lets an
+    import read every artifact in place through the zip's central directory.
+    """
+    part_path = f"{path}.part"
+    exported = []
+    try:
+        with zipfile.ZipFile(part_path, 'w', zipfile.ZIP_STORED, allowZip64=True) as bundle:
+            releases_written = set()
+            for index, entry in enumerate(entries):
+                job.check()
+                job.set_info(f"Packing {entry['name']} {entry['version']}...")
+                repo_path = github_repo_path(entry.get('url', ''))
+                if repo_path and repo_path not in releases_written:
+                    releases = get_github_releases(entry['url'])
+                    if releases is not None:
+                        bundle.writestr(bundle_releases_name(repo_path), json.dumps(releases))
+                        releases_written.add(repo_path)
+
+                extension = entry['download_url'].split('.')[-1].lower()
+                sha256 = entry.get('sha256')
+                cached = cached_artifact_path(sha256, extension) if sha256 else None
+                if cached and os.path.exists(cached):
+                    with job.slot(DISK_SLOT):
+                        bundle.write(cached, bundle_member_name(sha256, extension))
+                else:
+                    temp_path = f"{part_path}.{extension}"
+                    app_data = CatalogApp(entry['name'], entry.get('url', ''), mirrors=entry.get('mirrors', []))
+                    with job.slot(NETWORK_SLOT):
+                        downloaded = download_from_mirrors(
+                            job, [entry['download_url']] + mirror_urls(app_data, entry['version'], entry['version']),
+                            temp_path, TRAFFIC_FOREGROUND, f"{entry['name']} {entry['version']}", sha256)
+                    try:
+                        if sha256 and downloaded != sha256:
+                            raise Exception(f"Hash mismatch for {entry['name']}: expected {sha256}, got {downloaded}")
+                        sha256 = downloaded
+                        with job.slot(DISK_SLOT):
+                            bundle.write(temp_path, bundle_member_name(sha256, extension))
+                    finally:
+                        os.remove(temp_path)
+
+                exported.append(dict(entry, sha256=sha256, extension=extension,
+                                     artifact=bundle_member_name(sha256, extension),
+                                     releases=bundle_releases_name(repo_path) if repo_path in releases_written else None))
+                job.set_progress(int(((index + 1) / len(entries)) * 95))
+
+            bundle.writestr(BUNDLE_INDEX, json.dumps({
+                'bundle_version': BUNDLE_VERSION,
+                'generated_by': f"{APP_NAME} {LAUNCHER_VERSION}",
+                'created_at': time.time(),
+                'manifest_repos': list(manifest_repos),
+                'manifests': {repo: manifest_sources[repo] for repo in manifest_repos if repo in manifest_sources},
+                'applications': exported
+            }, indent=4))
+        os.replace(part_path, path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+
+    job.set_progress(100)
+    return {'applications': len(exported), 'size': os.path.getsize(path)}
+
+def load_bundle_index(path):
+    """Read and validate a bundle's index without touching its artifacts"""
+    with zipfile.ZipFile(path) as bundle:
+        index = json.loads(bundle.read(BUNDLE_INDEX))
+        if index.get('bundle_version') != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported bundle version: {index.get('bundle_version')}")
+        names = set(bundle.namelist())
+        index['releases'] = {}
+        for entry in index.get('applications', []):
+            if entry.get('artifact') not in names:
+                raise ValueError(f"{entry.get('name')} is listed but its archive is missing")
+            if entry.get('releases') in names:
+                index['releases'][entry['url']] = json.loads(bundle.read(entry['releases']))
+    return index
+
+def install_from_bundle(job, bundle_path, entry, app_data, install_dir):
+    """Verify and install one application straight out of an offline bundle"""
+    staging_dir = staging_path(install_dir, entry['name'], entry['version'])
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    Path(staging_dir).parent.mkdir(parents=True, exist_ok=True)
+    artifact = {
+        'name': entry['name'],
+        'version': entry['version'],
+        'path': None,
+        'bundle': bundle_path,
+        'member': entry['artifact'],
+        'extension': entry['extension'],
+        'sha256': entry['sha256'],
+        'download_url': entry['download_url'],
+        'staging_dir': staging_dir
+    }
 
-            self.progress.emit(100)
-            self.info.emit("Installation completed!")
-            self.finished.emit(True, "", self.actual_version)
+    try:
+        with job.slot(DISK_SLOT):
+            job.set_info(f"Verifying {entry['name']} {entry['version']}...")
+            digest = hashlib.sha256()
+            with open_artifact(artifact) as source:
+                for data in iter(lambda: source.read(1024 * 1024), b""):
+                    job.check()
+                    digest.update(data)
+            if digest.hexdigest() != entry['sha256']:
+                raise Exception(f"Hash mismatch for {entry['name']}: the bundle is damaged")
+            extract_artifact(job, artifact)
+            job.set_progress(90)
+            activate_staged(job, artifact, app_data, install_dir)
+    except BaseException:
+        discard_artifact(artifact)
+        raise
+
+    job.set_progress(100)
+    job.set_info("Installation completed!")
+    return entry['version']
+
+class PipelineTask:
+    """Per-app view of an update pipeline job, reports into the pipeline totals"""
+
+    def __init__(self, pipeline, job, name):
+        self.pipeline = pipeline
+        self.job = job
+        self.name = name
+        self.progress = 0
+        self.info = ""
+
+    def set_progress(self, value):
+        self.progress = value
+        self.pipeline.report()
+
+    def set_info(self, text):
+        self.info = text
+
+    def check(self):
+        self.job.check()
+
+    def slot(self, resource):
+        return self.job.slot(resource)
+
+    @property
+    def cancel_event(self):
+        return self.job.cancel_event
+
+    @property
+    def resume_event(self):
+        return self.job.resume_event
+
+    def add_control_listener(self, listener):
+        self.job.add_control_listener(listener)
+
+    def remove_control_listener(self, listener):
+        self.job.remove_control_listener(listener)
+
+class UpdatePipeline:
+    """Updates many apps at once, overlapping download, extract and activate across apps"""
+
+    def __init__(self, job, updates, install_dir, network_workers, disk_workers):
+        self.job = job
+        self.updates = updates
+        self.install_dir = install_dir
+        self.network_workers = network_workers
+        self.disk_workers = disk_workers
+        self.tasks = {app.name: PipelineTask(self, job, app.name) for app, _ in updates}
+        self.results = []
+        self.results_lock = threading.Lock()
+        self.counts = {'downloaded': 0, 'extracted': 0, 'activated': 0}
+        # Bounded hand-off queues give back-pressure: downloads stall when
+        # extraction falls behind instead of filling the disk with archives
+        self.download_queue = queue.Queue()
+        self.extract_queue = queue.Queue(maxsize=PIPELINE_BUFFER)
+        self.activate_queue = queue.Queue(maxsize=PIPELINE_BUFFER)
+        self.started = None
+
+    def report(self):
+        total = sum(task.progress for task in self.tasks.values()) / max(len(self.tasks), 1)
+        self.job.set_progress(int(total))
+
+        elapsed = time.perf_counter() - self.started
+        eta = ""
+        if 0 < total < 100:
+            remaining = int(elapsed * (100 - total) / total)
+            eta = f", ETA {remaining // 60}:{remaining % 60:02d}"
+        status = (f"{self.counts['downloaded']} downloaded, {self.counts['extracted']} extracted, "
+                  f"{self.counts['activated']}/{len(self.tasks)} activated{eta}")
+        if status != self.job.info:
+            self.job.set_info(status)
+
+    def advance(self, stage):
+        with self.results_lock:
+            self.counts[stage] += 1
+
+    def record(self, app_name, version, status, message=""):
+        task = self.tasks[app_name]
+        with self.results_lock:
+            self.results.append({'name': app_name, 'version': version, 'status': status, 'message': message,
+                                 'seconds': time.perf_counter() - task.started})
+        task.set_progress(100)
+
+    def download_stage(self):
+        while True:
+            try:
+                app_data, version = self.download_queue.get_nowait()
+            except queue.Empty:
+                return
+            task = self.tasks[app_data.name]
+            task.started = time.perf_counter()
+            if self.job.cancel_event.is_set():
+                self.record(app_data.name, version, "cancelled")
+                continue
+            staged = find_staged_artifact(self.install_dir, app_data.name, version)
+            if staged:
+                self.advance('downloaded')
+                self.advance('extracted')
+                task.set_progress(90)
+                self.activate_queue.put((app_data, staged))
+                continue
+            try:
+                with task.slot(NETWORK_SLOT):
+                    artifact = run_job_action(task, "download", app_data=app_data, version=version,
+                                              install_dir=self.install_dir)
+                self.advance('downloaded')
+                self.extract_queue.put((app_data, artifact))
+            except JobCancelled:
+                self.record(app_data.name, version, "cancelled")
+            except Exception as e:
+                self.record(app_data.name, version, "failed", str(e))
+
+    def extract_stage(self):
+        while True:
+            entry = self.extract_queue.get()
+            if entry is None:
+                return
+            app_data, artifact = entry
+            task = self.tasks[app_data.name]
+            try:
+                task.check()
+                with task.slot(DISK_SLOT):
+                    files = run_job_action(task, "extract", artifact=artifact)
+                # A worker process extracts into its own copy of the artifact
+                artifact['files'] = files
+                self.advance('extracted')
+                task.set_progress(90)
+                self.activate_queue.put(entry)
+            except JobCancelled:
+                discard_artifact(artifact)
+                self.record(app_data.name, artifact['version'], "cancelled")
+            except Exception as e:
+                discard_artifact(artifact)
+                self.record(app_data.name, artifact['version'], "failed", str(e))
+
+    def activate_stage(self):
+        while True:
+            entry = self.activate_queue.get()
+            if entry is None:
+                return
+            app_data, artifact = entry
+            task = self.tasks[app_data.name]
+            try:
+                task.check()
+                run_job_action(task, "activate", artifact=artifact, app_data=app_data,
+                               install_dir=self.install_dir)
+                self.advance('activated')
+                self.record(app_data.name, artifact['version'], "updated")
+            except JobCancelled:
+                discard_artifact(artifact)
+                self.record(app_data.name, artifact['version'], "cancelled")
+            except Exception as e:
+                discard_artifact(artifact)
+                self.record(app_data.name, artifact['version'], "failed", str(e))
 
+    def run(self):
+        self.started = time.perf_counter()
+        for app_data, version in self.updates:
+            self.download_queue.put((app_data, version))
+
+        downloaders = [threading.Thread(target=self.download_stage, daemon=True)
+                       for _ in range(min(self.network_workers, len(self.updates)))]
+        extractors = [threading.Thread(target=self.extract_stage, daemon=True)
+                      for _ in range(self.disk_workers)]
+        activator = threading.Thread(target=self.activate_stage, daemon=True)
+        for thread in downloaders + extractors + [activator]:
+            thread.start()
+
+        # Every stage drains its input until a sentinel arrives, so a cancelled
+        # or failing app never leaves an upstream stage blocked on a full queue
+        for thread in downloaders:
+            thread.join()
+        for _ in extractors:
+            self.extract_queue.put(None)
+        for thread in extractors:
+            thread.join()
+        self.activate_queue.put(None)
+        activator.join()
+
+        self.job.check()
+        return self.results
+
+def update_all_applications(job, updates, install_dir):
+    """Run the update pipeline for a list of (app_data, version) pairs, returns per-app results"""
+    scheduler = job.scheduler
+    pipeline = UpdatePipeline(job, updates, install_dir,
+                              scheduler.slots[NETWORK_SLOT].limit, scheduler.slots[DISK_SLOT].limit)
+    return pipeline.run()
+
+@traced("uninstall", "disk")
+def uninstall_application(job, app_info):
+    with job.slot(DISK_SLOT):
+        job.set_info(f"Removing {app_info['name']}...")
+        shutil.rmtree(app_info['installed_path'])
+    job.set_progress(100)
+
+@traced("verify", "disk")
+def verify_application(job, app_info, deep=False):
+    """Check an installed app against its file index, returns a report listing damaged files"""
+    problems = []
+    damaged = []
+    app_dir = app_info['installed_path']
+    app_info_path = os.path.join(app_dir, "app_info.json")
+    with job.slot(DISK_SLOT):
+        job.set_info(f"Verifying {app_info['name']}...")
+        try:
+            with open(app_info_path, 'r') as f:
+                recorded = json.load(f)
+            if recorded.get('version') != app_info['version']:
+                problems.append("app_info.json does not match the installed version")
+        except (OSError, ValueError) as e:
+            problems.append(f"app_info.json is unreadable: {e}")
+            recorded = {}
+
+        executable = recorded.get('executable_path') or app_info.get('executable', '')
+        if executable and executable != "-" and not os.path.isfile(os.path.join(app_dir, executable)):
+            problems.append(f"Executable {executable} is missing")
+
+        # An empty index records nothing to check against, so it counts as unindexed
+        files = recorded.get('files')
+        if not files:
+            job.set_progress(100)
+            return {'name': app_info['name'], 'ok': not problems, 'problems': problems,
+                    'damaged': [], 'indexed': False}
+
+        # Size and mtime unchanged means untouched, only the rest needs hashing
+        suspects = []
+        for name, (size, mtime_ns, sha256) in files.items():
+            try:
+                stat = os.stat(os.path.join(app_dir, name))
+            except OSError:
+                damaged.append(name)
+                continue
+            if stat.st_size != size:
+                damaged.append(name)
+            elif deep or stat.st_mtime_ns != mtime_ns:
+                suspects.append(name)
+
+        refreshed = False
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 2) as executor:
+            hashes = executor.map(lambda name: file_sha256(os.path.join(app_dir, name)), suspects)
+            for index, (name, sha256) in enumerate(zip(suspects, hashes), 1):
+                job.check()
+                if sha256 != files[name][2]:
+                    damaged.append(name)
+                else:
+                    files[name][1] = os.stat(os.path.join(app_dir, name)).st_mtime_ns
+                    refreshed = True
+                job.set_progress(int((index / len(suspects)) * 100))
+
+        if refreshed:
+            with open(app_info_path, 'w') as f:
+                json.dump(recorded, f, indent=4)
+
+    if damaged:
+        problems.append(f"{len(damaged)} damaged or missing file(s): {', '.join(sorted(damaged)[:5])}"
+                        + ("..." if len(damaged) > 5 else ""))
+    job.set_progress(100)
+    return {'name': app_info['name'], 'ok': not problems, 'problems': problems,
+            'damaged': sorted(damaged), 'indexed': True}
+
+@traced("repair", "disk")
+def repair_application(job, app_info, damaged):
+    """Restore damaged files from the cached artifact, or from the release by range requests"""
+    app_dir = app_info['installed_path']
+    app_info_path = os.path.join(app_dir, "app_info.json")
+    with open(app_info_path, 'r') as f:
+        recorded = json.load(f)
+    files = recorded['files']
+    download_url = recorded.get('download_url', '')
+    extension = download_url.split('.')[-1].lower()
+    repaired = []
+    failed = []
+
+    def restore(name, source):
+        target = os.path.join(app_dir, name)
+        Path(target).parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target + ".repair"
+        digest = hashlib.sha256()
+        with open(temp_path, 'wb') as f:
+            for data in iter(lambda: source.read(1024 * 1024), b""):
+                job.check()
+                f.write(data)
+                digest.update(data)
+        if digest.hexdigest() != files[name][2]:
+            os.remove(temp_path)
+            raise Exception("hash mismatch")
+        os.replace(temp_path, target)
+        files[name][1] = os.stat(target).st_mtime_ns
+        repaired.append(name)
+
+    cached = cached_artifact_path(recorded.get('sha256'), extension)
+    if extension == 'zip':
+        TRACER.count_cache("artifact", os.path.exists(cached))
+        if os.path.exists(cached):
+            job.set_info("Repairing from the cached archive...")
+            archive_file = open(cached, 'rb')
+            resource = DISK_SLOT
+        else:
+            job.set_info("Repairing from the release archive...")
+            archive_file = io.BufferedReader(HttpRangeFile(download_url, job), RANGE_READ_BUFFER)
+            resource = NETWORK_SLOT
+        with job.slot(resource), archive_file, zipfile.ZipFile(archive_file) as archive:
+            for index, name in enumerate(damaged, 1):
+                try:
+                    with archive.open(name) as source:
+                        restore(name, source)
+                except JobCancelled:
+                    raise
+                except Exception as e:
+                    failed.append(f"{name}: {e}")
+                job.set_progress(int((index / len(damaged)) * 100))
+    else:
+        # A single-file app is its own artifact, so repairing it is a fresh download
+        with job.slot(NETWORK_SLOT):
+            for name in damaged:
+                job.set_info(f"Downloading {name}...")
+                response = requests.get(download_url, stream=True, timeout=30)
+                if response.status_code != 200:
+                    failed.append(f"{name}: download failed with status code {response.status_code}")
+                    continue
+                try:
+                    restore(name, io.BufferedReader(response.raw))
+                except JobCancelled:
+                    raise
+                except Exception as e:
+                    failed.append(f"{name}: {e}")
+
+    with open(app_info_path, 'w') as f:
+        json.dump(recorded, f, indent=4)
+    job.set_progress(100)
+    return {'name': app_info['name'], 'repaired': repaired, 'failed': failed}
+
+def perform_action(job, action, args):
+    """Dispatch a job action by name, shared by worker processes and the in-process fallback"""
+    if isinstance(args.get('app_data'), dict):
+        # Catalog records cross to worker processes as JSON
+        args = dict(args, app_data=CatalogApp.from_dict(args['app_data']))
+    if action == "install":
+        return install_application(job, args['app_data'], args['version'], args['install_dir'],
+                                   args.get('download_url'), args.get('expected_sha256'))
+    if action == "install_bundle":
+        return install_from_bundle(job, args['bundle_path'], args['entry'], args['app_data'], args['install_dir'])
+    if action == "export_bundle":
+        return export_bundle(job, args['path'], args['entries'], args['manifest_sources'], args['manifest_repos'])
+    if action == "prestage":
+        return prestage_application(job, args['app_data'], args['version'], args['install_dir'])
+    if action == "download":
+        return download_artifact(job, args['app_data'], args['version'], args['install_dir'])
+    if action == "extract":
+        return extract_artifact(job, args['artifact'])
+    if action == "activate":
+        return activate_staged(job, args['artifact'], args['app_data'], args['install_dir'])
+    if action == "uninstall":
+        return uninstall_application(job, args['app_info'])
+    if action == "verify":
+        return verify_application(job, args['app_info'], args.get('deep', False))
+    if action == "repair":
+        return repair_application(job, args['app_info'], args['damaged'])
+    raise ValueError(f"Unknown job action: {action}")
+
+def run_job_action(job, action, **args):
+    """Run a job action in a worker process, or in this process when workers are disabled"""
+    if WORKER_POOL.enabled:
+        return WORKER_POOL.run(job, action, args)
+    return perform_action(job, action, args)
+
+def run_worker():
+    """Entry point of a worker process: run actions sent by the GUI process one at a time"""
+    global BANDWIDTH
+    ensure_data_dirs()
+    channel = WorkerChannel()
+    BANDWIDTH = RemoteBandwidthShaper(channel)
+    context = None
+
+    def execute(job, action, args):
+        try:
+            result = perform_action(job, action, args)
+            channel.send({'type': "done", 'result': result, 'trace': trace_data()})
+        except JobCancelled:
+            channel.send({'type': "error", 'cancelled': True, 'message': "Cancelled", 'trace': trace_data()})
         except Exception as e:
-            self.finished.emit(False, str(e), self.actual_version)
+            channel.send({'type': "error", 'message': str(e), 'trace': trace_data()})
 
-def get_github_releases(repo_url):
-    try:
+    def trace_data():
+        return TRACER.drain() if TRACER.enabled else None
 
-        if "github.com" in repo_url:
-            parts = repo_url.split("github.com/")[1].split("/")
-            if len(parts) >= 2:
-                owner, repo = parts[0], parts[1]
-                api_url = f"https://api.github.com/repos/{owner}/{repo}/releases"
-                response = requests.get(api_url, timeout=10)
-                if response.status_code == 200:
-                    releases = response.json()
-                    return releases
+    for line in sys.stdin:
+        message = json.loads(line)
+        kind = message['type']
+        if kind == "run":
+            if message.get('trace'):
+                TRACER.enable()
+            else:
+                TRACER.disable()
+            context = WorkerJobContext(channel)
+            threading.Thread(target=execute, args=(context, message['action'], message['args']),
+                             daemon=True).start()
+        elif kind == "reply":
+            channel.deliver(message)
+        elif context is not None:
+            # Control messages always refer to the most recent run
+            if kind == "cancel":
+                context.cancel_event.set()
+                context.resume_event.set()
+            elif kind == "pause":
+                context.resume_event.clear()
+            elif kind == "resume":
+                context.resume_event.set()
+    return 0
+
+def manifest_url_for(repo):
+    return f"{repo}/raw/refs/heads/main/manifest.json"
+
+def manifest_cache_path(repo):
+    return os.path.join(MANIFEST_CACHE, hashlib.sha1(repo.encode()).hexdigest() + ".json")
+
+def load_manifest_cache(repo):
+    try:
+        with open(manifest_cache_path(repo), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def load_cached_manifest(repo):
+    return load_manifest_cache(repo).get('manifest')
+
+def save_manifest_cache(repo, cache):
+    cache_path = manifest_cache_path(repo)
+    with open(cache_path + ".tmp", 'w') as f:
+        json.dump(cache, f)
+    os.replace(cache_path + ".tmp", cache_path)
+
+def entry_name(entry):
+    """Name of a raw manifest entry, None for entries parse_manifest will reject anyway"""
+    name = entry.get('name') if isinstance(entry, dict) else None
+    return name if isinstance(name, str) else None
+
+def changed_manifest_entries(old_manifest, new_manifest):
+    """Names whose revision differs, None when the manifests are not versioned"""
+    if 'sequence' not in old_manifest or 'sequence' not in new_manifest:
         return None
-    except:
+    old_revisions = {entry_name(app): app.get('revision') for app in old_manifest.get('applications', [])
+                     if entry_name(app)}
+    new_revisions = {entry_name(app): app.get('revision') for app in new_manifest.get('applications', [])
+                     if entry_name(app)}
+    return [name for name in old_revisions.keys() | new_revisions.keys()
+            if old_revisions.get(name) != new_revisions.get(name)]
+
+@traced("apply manifest delta", "manifest")
+def apply_manifest_delta(manifest_data, delta, problems=None):
+    """Apply a delta feed to a versioned manifest in place, returns the changed names
+
+    The feed lists every change after its 'since' sequence:
+    {"sequence": 42, "since": 30, "changes": [{"sequence": 31, "name": "App", "entry": {...}},
+                                              {"sequence": 35, "name": "Old", "removed": true}]}
+    Returns None when the feed does not reach back to the manifest's sequence. Changes
+    without a name are skipped and described in problems.
+    """
+    sequence = manifest_data['sequence']
+    if delta['sequence'] <= sequence:
+        return []
+    if delta['since'] > sequence:
         return None
 
-def is_version_newer(latest_version, current_version):
-    """Compare versions to determine if an update is available"""
-    if latest_version == "latest" or current_version == "latest":
+    applications = manifest_data.setdefault('applications', [])
+    positions = {entry_name(app): index for index, app in enumerate(applications)}
+    removed = set()
+    changed = []
+    changes = []
+    for index, change in enumerate(delta['changes']):
+        if entry_name(change) is None:
+            if problems is not None:
+                problems.append(f"delta change {index + 1} skipped, missing name")
+            continue
+        changes.append(change)
+    for change in sorted(changes, key=lambda change: change['sequence']):
+        if change['sequence'] <= sequence:
+            continue
+        name = change['name']
+        if change.get('removed'):
+            removed.add(name)
+        elif name in positions:
+            applications[positions[name]] = change['entry']
+            removed.discard(name)
+        else:
+            positions[name] = len(applications)
+            applications.append(change['entry'])
+            removed.discard(name)
+        changed.append(name)
+
+    if removed:
+        applications[:] = [app for app in applications if entry_name(app) not in removed]
+    manifest_data['sequence'] = delta['sequence']
+    return list(dict.fromkeys(changed))
+
+@traced("fetch manifest", "manifest")
+def fetch_manifest(repo):
+    """Bring a repository's cached manifest up to date, returns it with the changed names and any problems
+
+    Versioned manifests are patched from the delta feed, anything else is downloaded
+    again unless the server reports it unchanged. The names are None when only a
+    full comparison could tell what changed.
+    """
+    cache = load_manifest_cache(repo)
+    manifest_data = cache.get('manifest')
+
+    if manifest_data and 'sequence' in manifest_data:
+        feed_url = manifest_url_for(repo).rsplit('/', 1)[0] + "/" + manifest_data.get('delta_feed', "manifest-delta.json")
+        headers = {'If-None-Match': cache['delta_etag']} if cache.get('delta_etag') else {}
+        try:
+            response = requests.get(feed_url, headers=headers, timeout=10)
+            if response.status_code == 304:
+                TRACER.count_cache("manifest", True)
+                return manifest_data, [], []
+            if response.status_code == 200:
+                problems = []
+                changed = apply_manifest_delta(manifest_data, response.json(), problems)
+                if changed is not None:
+                    TRACER.count_cache("manifest", True)
+                    cache['delta_etag'] = response.headers.get('ETag')
+                    if changed:
+                        cache['etag'] = None
+                    save_manifest_cache(repo, cache)
+                    return manifest_data, changed, [f"{repo}: {problem}" for problem in problems]
+        except (requests.RequestException, ValueError, KeyError, TypeError):
+            pass
+
+    headers = {'If-None-Match': cache['etag']} if manifest_data and cache.get('etag') else {}
+    response = requests.get(manifest_url_for(repo), headers=headers, timeout=10)
+    if response.status_code == 304:
+        TRACER.count_cache("manifest", True)
+        return manifest_data, [], []
+    if response.status_code != 200:
+        raise Exception(f"HTTP {response.status_code}")
+    TRACER.count_cache("manifest", False)
+    new_manifest_data = response.json()
+
+    changed = changed_manifest_entries(manifest_data, new_manifest_data) if manifest_data else None
+    save_manifest_cache(repo, {'manifest': new_manifest_data, 'etag': response.headers.get('ETag')})
+    return new_manifest_data, changed, []
+
+class CatalogApp:
+    """One application of the catalog, validated and normalized when its manifest is parsed
+
+    Records are immutable and shared by the catalog, pending updates, the release
+    watcher and jobs, so fields are read as attributes and never need checking.
+    """
+    __slots__ = ('name', 'url', 'description', 'filename', 'icon', 'mirrors', 'source')
+
+    def __init__(self, name, url, description="", filename="", icon=None, mirrors=(), source=None):
+        for slot, value in zip(self.__slots__, (name, url, description, filename, icon, tuple(mirrors), source)):
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"CatalogApp.{name} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"CatalogApp.{name} is read-only")
+
+    def fields(self):
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __eq__(self, other):
+        return isinstance(other, CatalogApp) and self.fields() == other.fields()
+
+    def __hash__(self):
+        return hash(self.fields())
+
+    def __repr__(self):
+        return f"CatalogApp({self.name!r}, {self.url!r})"
+
+    def replace(self, **changes):
+        values = dict(zip(self.__slots__, self.fields()))
+        values.update(changes)
+        return CatalogApp(**values)
+
+    def to_dict(self):
+        return dict(zip(self.__slots__, self.fields()), mirrors=list(self.mirrors))
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{slot: data[slot] for slot in cls.__slots__ if slot in data})
+
+    @classmethod
+    def from_manifest(cls, entry, source):
+        """Validate a manifest entry, raises ValueError saying what is wrong with it"""
+        if not isinstance(entry, dict):
+            raise ValueError("not an object")
+        name = entry.get('name')
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("missing name")
+        url = entry.get('url')
+        if not isinstance(url, str) or not url.strip().startswith(("http://", "https://")):
+            raise ValueError(f"{name} has no http(s) url")
+        text = {}
+        for key in ('description', 'filename', 'icon'):
+            value = entry.get(key)
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"{name} has a non-text {key}")
+            text[key] = value.strip() if value else ""
+        mirrors = entry.get('mirrors') or []
+        if not isinstance(mirrors, list) or not all(isinstance(mirror, str) and mirror for mirror in mirrors):
+            raise ValueError(f"{name} has mirrors that are not a list of urls")
+        return cls(name, url.strip(), text['description'], text['filename'], text['icon'] or None, mirrors, source)
+
+class Catalog:
+    """The merged applications in display order, indexed by name, with the entries that were skipped"""
+    __slots__ = ('applications', 'rows', 'offline', 'problems')
+
+    def __init__(self, applications=(), offline=False, problems=()):
+        applications = tuple(applications)
+        for slot, value in zip(self.__slots__, (applications, {app.name: row for row, app in enumerate(applications)},
+                                                offline, tuple(problems))):
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Catalog.{name} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Catalog.{name} is read-only")
+
+    def __iter__(self):
+        return iter(self.applications)
+
+    def __len__(self):
+        return len(self.applications)
+
+    def __eq__(self, other):
+        return (isinstance(other, Catalog) and self.applications == other.applications and
+                self.offline == other.offline and self.problems == other.problems)
+
+    def row(self, name):
+        return self.rows.get(name)
+
+    def get(self, name):
+        row = self.rows.get(name)
+        return None if row is None else self.applications[row]
+
+    def find(self, name):
+        """Look an app up the way a user would type it, ignoring case"""
+        return self.get(name) or next((app for app in self.applications if app.name.lower() == name.lower()), None)
+
+def parse_manifest(repo, manifest_data):
+    """Records by name for a manifest's applications, and a message for every entry that was skipped"""
+    apps = {}
+    problems = []
+    entries = manifest_data.get('applications') if isinstance(manifest_data, dict) else None
+    if not isinstance(entries, list):
+        return apps, [f"{repo}: no applications list"]
+    for index, entry in enumerate(entries):
+        try:
+            app = CatalogApp.from_manifest(entry, repo)
+        except ValueError as e:
+            problems.append(f"{repo}: entry {index + 1} skipped, {e}")
+            continue
+        if app.name in apps:
+            problems.append(f"{repo}: entry {index + 1} skipped, {app.name} is listed twice")
+            continue
+        apps[app.name] = app
+    return apps, problems
+
+def app_icon_url(app_data):
+    """Icons may be given relative to the manifest repository"""
+    icon = app_data.icon
+    if not icon or icon.startswith(("http://", "https://")):
+        return icon
+    return manifest_url_for(app_data.source).rsplit('/', 1)[0] + "/" + icon.lstrip('/')
+
+@traced("merge manifests", "manifest")
+def merge_manifests(manifest_repos, sources):
+    """Overlay the parsed manifests, an app from an earlier repository replaces the same app from a later one"""
+    merged = {}
+    for repo in reversed(manifest_repos):
+        merged.update(sources.get(repo, ({}, []))[0])
+    problems = [problem for repo in manifest_repos for problem in sources.get(repo, ({}, []))[1]]
+    return Catalog(merged.values(), problems=problems)
+
+def build_lockfile(installed_apps, manifest_apps, manifest_repos):
+    """Describe the installed apps as a lockfile with pinned versions and hashes"""
+    manifest_by_name = {app.name: app for app in manifest_apps}
+    entries = []
+    for name in sorted(installed_apps):
+        app_info = installed_apps[name]
+        app_data = manifest_by_name.get(name)
+        entry = {
+            'name': name,
+            'version': app_info['version'],
+            'url': app_data.url if app_data else '',
+            'download_url': app_info.get('download_url') or (
+                resolve_download_url(app_data.url, app_info['version']) if app_data else ''),
+            'filename': app_info.get('executable', ''),
+            'sha256': app_info.get('sha256')
+        }
+        entries.append(entry)
+
+    return {
+        'lockfile_version': LOCKFILE_VERSION,
+        'generated_by': f"{APP_NAME} {LAUNCHER_VERSION}",
+        'manifest_repos': list(manifest_repos),
+        'applications': entries
+    }
+
+def lockfile_entry_satisfied(entry, installed_apps):
+    installed = installed_apps.get(entry['name'])
+    if not installed or installed.get('version') != entry['version']:
         return False
-
-    latest = latest_version.lstrip('v')
-    current = current_version.lstrip('v')
-
-    try:
-        latest_parts = [int(x) for x in latest.split('.')]
-        current_parts = [int(x) for x in current.split('.')]
-
-        max_len = max(len(latest_parts), len(current_parts))
-        latest_parts.extend([0] * (max_len - len(latest_parts)))
-        current_parts.extend([0] * (max_len - len(current_parts)))
-
-        return latest_parts > current_parts
-    except:
-
-        return latest != current
+    if entry.get('sha256') and installed.get('sha256'):
+        return entry['sha256'] == installed['sha256']
+    return True
+
+def load_lockfile(path):
+    """Read and validate a lockfile, returns its application entries"""
+    with open(path, 'r') as f:
+        lockfile = json.load(f)
+
+    if lockfile.get('lockfile_version') != LOCKFILE_VERSION:
+        raise ValueError(f"Unsupported lockfile version: {lockfile.get('lockfile_version')}")
+
+    entries = lockfile.get('applications', [])
+    for entry in entries:
+        if not entry.get('name') or not entry.get('version'):
+            raise ValueError("Every lockfile entry needs a name and a version")
+        if entry['version'] == "latest":
+            raise ValueError(f"{entry['name']} is not pinned to a version")
+        if not entry.get('url') and not entry.get('download_url'):
+            raise ValueError(f"{entry['name']} has no download location")
+    return entries
 
 class QypherLauncher(QMainWindow):
     def __init__(self):
         super().__init__()
+        ensure_data_dirs()
         self.settings = QSettings(ORGANIZATION, APP_NAME)
         self.install_dir = self.settings.value("install_dir", DEFAULT_INSTALL_DIR)
+        self.first_painted = False
 
-        self.manifest_repo_url = self.settings.value("manifest_repo", DEFAULT_REPO_URL)
-        self.manifest_url = f"{self.manifest_repo_url}/raw/refs/heads/main/manifest.json"
+        self.manifest_repos = self.settings.value("manifest_repos", [], type=list) or \
+            [self.settings.value("manifest_repo", DEFAULT_REPO_URL)]
+        self.manifest_sources = {}
+        self.parsed_sources = {}
 
         self.dark_mode = self.is_system_dark_theme()
         self.settings.setValue("dark_mode", self.dark_mode)
 
-        self.manifest_data = None
+        self.catalog = None
+        self.manifest_changed_during_check = False
         self.installed_apps = {}
         self.download_thread = None
-        self.install_thread = None
         self.manifest_update_thread = None
         self.self_update_thread = None
+        self.provision_batch = None
+        self.verify_pending = set()
+        self.verify_reports = []
+        self.repair_pending = set()
+        self.repair_reports = []
+
+        self.job_scheduler = JobScheduler(
+            self.settings.value("jobs/network_limit", DEFAULT_NETWORK_JOBS, type=int),
+            self.settings.value("jobs/disk_limit", DEFAULT_DISK_JOBS, type=int),
+            self
+        )
+        self.job_scheduler.job_finished.connect(self.job_finished)
+        WORKER_POOL.enabled = self.settings.value("jobs/use_worker_process", True, type=bool)
+
+        self.apply_bandwidth_settings()
+
+        self.prestage_enabled = self.settings.value("prestage/enabled", False, type=bool)
+        self.prestage_timer = QTimer(self)
+        self.prestage_timer.timeout.connect(self.schedule_prestaging)
+        self.prestage_timer.start(PRESTAGE_POLL_MS)
 
         self.has_app_updates = False
         self.has_launcher_update = False
+        self.pending_updates = []
 
-        self.app_icon = self.create_icon()
+        self.badge_icons = {}
+        self.tray_icon_type = None
+        self.app_icon = self.badge_icon("default")
         self.setWindowIcon(self.app_icon)
 
+        self.icon_loader = IconLoader(self)
+        self.icon_loader.icon_loaded.connect(self.app_icon_loaded)
+        self.icon_request_timer = QTimer(self)
+        self.icon_request_timer.setSingleShot(True)
+        self.icon_request_timer.setInterval(50)
+        self.icon_request_timer.timeout.connect(self.request_visible_icons)
+
+        self.release_watcher = ReleaseWatcher(self)
+        self.release_watcher.release_checked.connect(self.app_release_checked)
+
+        self.process_supervisor = ProcessSupervisor(self)
+        self.process_supervisor.app_started.connect(self.app_process_changed)
+        self.process_supervisor.app_exited.connect(self.app_process_exited)
+
+        self.peer_server = None
+        peer_error = self.apply_peer_settings()
+        if peer_error:
+            QTimer.singleShot(0, lambda: QMessageBox.warning(self, "LAN Peer Cache", peer_error))
+
+        self.tray_resident = False
+        self.catalog_from_cache = False
+        self.tray_trim_timer = QTimer(self)
+        self.tray_trim_timer.setSingleShot(True)
+        self.tray_trim_timer.setInterval(TRAY_TRIM_DELAY_MS)
+        self.tray_trim_timer.timeout.connect(self.enter_tray_mode)
+
         self.setup_ui()
         self.load_manifest()
         self.scan_installed_apps()
@@ -494,8 +4124,15 @@ class QypherLauncher(QMainWindow):
 
         self.apply_theme()
 
-        self.check_self_update()
-        self.check_manifest_updates()
+        # The cached catalog is enough for the first paint, network checks start right after it
+        QTimer.singleShot(0, lambda: self.check_self_update(TRAFFIC_BACKGROUND))
+        QTimer.singleShot(0, self.check_manifest_updates)
+
+    def paintEvent(self, event):
+        if not self.first_painted:
+            self.first_painted = True
+            record_startup("time to window", MODULE_IMPORT_STARTED)
+        super().paintEvent(event)
 
     def is_system_dark_theme(self):
 
@@ -505,7 +4142,7 @@ class QypherLauncher(QMainWindow):
             key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
             value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
             return value == 0
-        except:
+        except (ImportError, OSError):
 
             palette = QGuiApplication.palette()
             return palette.window().color().lightness() < 128
@@ -549,6 +4186,12 @@ class QypherLauncher(QMainWindow):
         painter.end()
         return QIcon(pixmap)
 
+    def badge_icon(self, icon_type):
+        """Paint each badge variant once and reuse it"""
+        if icon_type not in self.badge_icons:
+            self.badge_icons[icon_type] = self.create_icon(icon_type)
+        return self.badge_icons[icon_type]
+
     def update_tray_icon(self):
         """Update the tray icon based on current update state"""
         if self.has_launcher_update and self.has_app_updates:
@@ -560,9 +4203,9 @@ class QypherLauncher(QMainWindow):
         else:
             icon_type = "default"
 
-        new_icon = self.create_icon(icon_type)
-        if hasattr(self, 'tray_icon'):
-            self.tray_icon.setIcon(new_icon)
+        if hasattr(self, 'tray_icon') and icon_type != self.tray_icon_type:
+            self.tray_icon_type = icon_type
+            self.tray_icon.setIcon(self.badge_icon(icon_type))
 
     def notify_updates(self):
         messages = []
@@ -600,20 +4243,39 @@ class QypherLauncher(QMainWindow):
 
         self.custom_repo_btn = QPushButton("Custom Repo")
         self.custom_repo_btn.clicked.connect(self.set_custom_repo)
-        self.custom_repo_btn.setToolTip("Set custom manifest repository")
+        self.custom_repo_btn.setToolTip("Set manifest repositories")
 
         self.self_update_btn = QPushButton("Update Launcher")
-        self.self_update_btn.clicked.connect(self.check_self_update)
+        self.self_update_btn.clicked.connect(lambda: self.check_self_update())
         self.self_update_btn.setToolTip("Check for launcher updates")
 
+        self.update_all_btn = QPushButton("Update All")
+        self.update_all_btn.clicked.connect(self.update_all_apps)
+        self.update_all_btn.setToolTip("Update every installed application with a newer release")
+        self.update_all_btn.setVisible(False)
+
+        self.tools_btn = QPushButton("Tools")
+        # Filled in the first time it opens, none of it is needed for the first paint
+        self.tools_menu = QMenu(self.tools_btn)
+        self.tools_menu.aboutToShow.connect(self.populate_tools_menu)
+        self.diagnostics_menu = None
+        # Hidden until Ctrl+Shift+D or --trace, support asks for it when something is slow
+        self.diagnostics_visible = TRACER.enabled
+        diagnostics_shortcut = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+        diagnostics_shortcut.activated.connect(self.show_diagnostics_menu)
+        self.tools_btn.setMenu(self.tools_menu)
+        self.tools_btn.setToolTip("Bulk provisioning and maintenance tools")
+
         self.theme_toggle = QPushButton("Toggle Theme")
         self.theme_toggle.clicked.connect(self.toggle_theme)
 
         header.addWidget(title)
         header.addStretch()
+        header.addWidget(self.update_all_btn)
         header.addWidget(self.refresh_btn)
         header.addWidget(self.custom_repo_btn)
         header.addWidget(self.self_update_btn)
+        header.addWidget(self.tools_btn)
         header.addWidget(self.theme_toggle)
         layout.addLayout(header)
 
@@ -632,8 +4294,11 @@ class QypherLauncher(QMainWindow):
         left_panel.addWidget(available_label)
 
         self.available_list = QListWidget()
+        self.available_list.setIconSize(QSize(ICON_SIZE, ICON_SIZE))
         self.available_list.currentRowChanged.connect(self.on_app_selected)
         self.available_list.itemDoubleClicked.connect(self.on_app_double_clicked)
+        self.available_list.verticalScrollBar().valueChanged.connect(self.icon_request_timer.start)
+        self.available_list.verticalScrollBar().rangeChanged.connect(self.icon_request_timer.start)
         left_panel.addWidget(self.available_list)
 
         content.addLayout(left_panel, 2)
@@ -694,6 +4359,9 @@ class QypherLauncher(QMainWindow):
         self.status_label.setVisible(False)
         right_panel.addWidget(self.status_label)
 
+        self.job_queue_widget = JobQueueWidget(self.job_scheduler)
+        right_panel.addWidget(self.job_queue_widget)
+
         right_panel.addStretch()
         content.addLayout(right_panel, 3)
 
@@ -707,6 +4375,91 @@ class QypherLauncher(QMainWindow):
         self.installed_list.currentRowChanged.connect(self.on_installed_app_selected)
         layout.addWidget(self.installed_list)
 
+    def populate_tools_menu(self):
+        if not self.tools_menu.isEmpty():
+            return
+        export_lockfile_action = QAction("Export Lockfile...", self)
+        export_lockfile_action.triggered.connect(self.export_lockfile)
+        self.tools_menu.addAction(export_lockfile_action)
+        import_lockfile_action = QAction("Import Lockfile...", self)
+        import_lockfile_action.triggered.connect(self.import_lockfile)
+        self.tools_menu.addAction(import_lockfile_action)
+        export_bundle_action = QAction("Export Offline Bundle...", self)
+        export_bundle_action.triggered.connect(self.export_bundle)
+        self.tools_menu.addAction(export_bundle_action)
+        import_bundle_action = QAction("Import Offline Bundle...", self)
+        import_bundle_action.triggered.connect(self.import_bundle)
+        self.tools_menu.addAction(import_bundle_action)
+        self.tools_menu.addSeparator()
+        verify_action = QAction("Verify Installed Apps", self)
+        verify_action.triggered.connect(self.verify_installed_apps)
+        self.tools_menu.addAction(verify_action)
+        deep_verify_action = QAction("Deep Verify Installed Apps", self)
+        deep_verify_action.triggered.connect(lambda: self.verify_installed_apps(deep=True))
+        self.tools_menu.addAction(deep_verify_action)
+        self.tools_menu.addSeparator()
+        bandwidth_action = QAction("Bandwidth Limits...", self)
+        bandwidth_action.triggered.connect(self.set_bandwidth_limits)
+        self.tools_menu.addAction(bandwidth_action)
+        github_token_action = QAction("GitHub Token...", self)
+        github_token_action.triggered.connect(self.set_github_token)
+        self.tools_menu.addAction(github_token_action)
+        peer_cache_action = QAction("LAN Peer Cache...", self)
+        peer_cache_action.triggered.connect(self.set_peer_cache)
+        self.tools_menu.addAction(peer_cache_action)
+        self.prestage_action = QAction("Pre-stage Updates When Idle", self)
+        self.prestage_action.setCheckable(True)
+        self.prestage_action.setChecked(self.prestage_enabled)
+        self.prestage_action.toggled.connect(self.set_prestage_enabled)
+        self.tools_menu.addAction(self.prestage_action)
+        self.low_memory_action = QAction("Low Memory Tray Mode", self)
+        self.low_memory_action.setCheckable(True)
+        self.low_memory_action.setChecked(self.settings.value("tray/low_memory", True, type=bool))
+        self.low_memory_action.toggled.connect(lambda enabled: self.settings.setValue("tray/low_memory", enabled))
+        self.tools_menu.addAction(self.low_memory_action)
+        launch_stats_action = QAction("Launch Statistics...", self)
+        launch_stats_action.triggered.connect(self.show_launch_statistics)
+        self.tools_menu.addAction(launch_stats_action)
+
+        self.diagnostics_menu = self.tools_menu.addMenu("Diagnostics")
+        self.trace_action = QAction("Record Trace", self)
+        self.trace_action.setCheckable(True)
+        self.trace_action.setChecked(TRACER.enabled)
+        self.trace_action.toggled.connect(self.set_tracing_enabled)
+        self.diagnostics_menu.addAction(self.trace_action)
+        export_trace_action = QAction("Export Trace...", self)
+        export_trace_action.triggered.connect(self.export_trace)
+        self.diagnostics_menu.addAction(export_trace_action)
+        clear_trace_action = QAction("Clear Trace", self)
+        clear_trace_action.triggered.connect(TRACER.clear)
+        self.diagnostics_menu.addAction(clear_trace_action)
+        self.diagnostics_menu.addSeparator()
+        self.watchdog_action = QAction("Watch for UI Stalls", self)
+        self.watchdog_action.setCheckable(True)
+        self.watchdog_action.setChecked(self.settings.value("diagnostics/stall_watchdog", True, type=bool))
+        self.watchdog_action.toggled.connect(self.set_watchdog_enabled)
+        self.diagnostics_menu.addAction(self.watchdog_action)
+        stall_report_action = QAction("Show Stall Report...", self)
+        stall_report_action.triggered.connect(self.show_stall_report)
+        self.diagnostics_menu.addAction(stall_report_action)
+        clear_stalls_action = QAction("Clear Stall Report", self)
+        clear_stalls_action.triggered.connect(WATCHDOG.reset)
+        self.diagnostics_menu.addAction(clear_stalls_action)
+        self.diagnostics_menu.addSeparator()
+        startup_times_action = QAction("Show Startup Times...", self)
+        startup_times_action.triggered.connect(self.show_startup_times)
+        self.diagnostics_menu.addAction(startup_times_action)
+        self.diagnostics_menu.menuAction().setVisible(self.diagnostics_visible)
+
+    def show_diagnostics_menu(self):
+        self.diagnostics_visible = True
+        if self.diagnostics_menu:
+            self.diagnostics_menu.menuAction().setVisible(True)
+
+    def show_startup_times(self):
+        lines = [f"{name}: {duration / 1000:.0f} ms" for name, (start, duration) in STARTUP_TIMES.items()]
+        QMessageBox.information(self, "Startup Times", "\n".join(lines) or "Nothing recorded yet.")
+
     def setup_tray_icon(self):
 
         self.tray_icon = QSystemTrayIcon(self)
@@ -744,8 +4497,12 @@ class QypherLauncher(QMainWindow):
         update_action.triggered.connect(self.check_manifest_updates)
         tray_menu.addAction(update_action)
 
+        update_all_action = QAction("Update All Apps", self)
+        update_all_action.triggered.connect(self.update_all_apps)
+        tray_menu.addAction(update_all_action)
+
         self_update_action = QAction("Update Launcher", self)
-        self_update_action.triggered.connect(self.check_self_update)
+        self_update_action.triggered.connect(lambda: self.check_self_update())
         tray_menu.addAction(self_update_action)
 
         tray_menu.addSeparator()
@@ -760,6 +4517,87 @@ class QypherLauncher(QMainWindow):
 
         self.update_tray_icon()
 
+    def enter_tray_mode(self):
+        """Drop the catalog, caches and idle workers while only the tray icon is showing"""
+        if self.isVisible() or self.tray_resident:
+            return
+        busy = any(job.is_active for job in self.job_scheduler.jobs.values()) or any(
+            thread is not None and thread.isRunning()
+            for thread in (self.manifest_update_thread, self.self_update_thread))
+        if busy:
+            self.tray_trim_timer.start()
+            return
+
+        # Update state, installed apps and the release watcher stay, they drive the tray
+        self.tray_resident = True
+        self.available_list.clear()
+        self.installed_list.clear()
+        self.version_combo.clear()
+        self.details_frame.setVisible(False)
+        self.job_queue_widget.clear_finished()
+        self.catalog = None
+        self.manifest_sources = {}
+        self.parsed_sources = {}
+        self.manifest_update_thread = None
+        self.self_update_thread = None
+        self.icon_loader.clear()
+        GITHUB.entries.clear()
+        WORKER_POOL.shutdown()
+        WATCHDOG.pause()
+        gc.collect()
+        release_process_memory()
+
+    def ensure_catalog(self):
+        """Rebuild the trimmed window state from the on-disk caches"""
+        if not self.tray_resident:
+            return
+        self.tray_resident = False
+        WATCHDOG.resume()
+        self.catalog_from_cache = True
+        try:
+            self.load_manifest()
+            self.scan_installed_apps()
+        finally:
+            self.catalog_from_cache = False
+        if not self.isVisible():
+            self.schedule_tray_trim()
+
+    def schedule_tray_trim(self):
+        if self.settings.value("tray/low_memory", True, type=bool):
+            self.tray_trim_timer.start()
+
+    def showEvent(self, event):
+        self.tray_trim_timer.stop()
+        self.ensure_catalog()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if not self.isMinimized():
+            self.schedule_tray_trim()
+
+    def show_window(self):
+        self.show()
+        self.setWindowState(self.windowState() & ~Qt.WindowMinimized)
+        self.raise_()
+        self.activateWindow()
+
+    def handle_instance_message(self, message):
+        """Act on a command forwarded by another invocation of the launcher"""
+        self.ensure_catalog()
+        command = message.get('command')
+        if command == "show":
+            self.show_window()
+        elif command == "install":
+            self.show_window()
+            app_name = message.get('app', '')
+            app_data = self.catalog.find(app_name) if self.catalog else None
+            if not app_data:
+                QMessageBox.warning(self, "Not Found", f"No application named '{app_name}' in the manifest.")
+                return
+            self.available_list.setCurrentRow(self.catalog.row(app_data.name))
+            self.queue_install(app_data, message.get('version') or "latest")
+
     def tray_icon_activated(self, reason):
         if reason == QSystemTrayIcon.DoubleClick:
             if self.isVisible():
@@ -769,19 +4607,21 @@ class QypherLauncher(QMainWindow):
                 self.activateWindow()
 
     def set_custom_repo(self):
-        """Set custom manifest repository"""
-        dialog = CustomRepoDialog(self, self.manifest_repo_url)
+        """Set the ordered list of manifest repositories"""
+        dialog = CustomRepoDialog(self, self.manifest_repos)
         if dialog.exec() == QDialog.Accepted:
-            new_repo = dialog.get_repo_url()
-            if new_repo:
-                self.manifest_repo_url = new_repo
-                self.manifest_url = f"{new_repo}/raw/refs/heads/main/manifest.json"
-                self.settings.setValue("manifest_repo", new_repo)
+            new_repos = dialog.get_repo_urls()
+            if new_repos:
+                self.manifest_repos = new_repos
+                self.settings.setValue("manifest_repos", new_repos)
+                self.settings.setValue("manifest_repo", new_repos[0])
 
                 self.load_manifest()
-                QMessageBox.information(self, "Repository Updated", f"Manifest repository updated to:\n{new_repo}")
+                self.check_manifest_updates()
+                QMessageBox.information(self, "Repository Updated",
+                                        "Manifest repositories updated to:\n" + "\n".join(new_repos))
 
-    def check_self_update(self):
+    def check_self_update(self, traffic_class=TRAFFIC_FOREGROUND):
         """Check for launcher updates"""
         if self.self_update_thread and self.self_update_thread.isRunning():
             return
@@ -792,7 +4632,7 @@ class QypherLauncher(QMainWindow):
         self.progress_bar.setValue(0)
         self.status_label.setText("Checking for launcher updates...")
 
-        self.self_update_thread = SelfUpdateThread()
+        self.self_update_thread = SelfUpdateThread(traffic_class=traffic_class)
 
         self.self_update_thread.progress.connect(self.progress_bar.setValue)
         self.self_update_thread.info.connect(self.status_label.setText)
@@ -835,6 +4675,7 @@ class QypherLauncher(QMainWindow):
 
     def check_manifest_updates(self):
         """Manually check for manifest updates"""
+        self.ensure_catalog()
         if self.manifest_update_thread and self.manifest_update_thread.isRunning():
             return
 
@@ -843,38 +4684,106 @@ class QypherLauncher(QMainWindow):
         self.update_status_label.setVisible(True)
         self.update_status_label.setText("Checking for updates...")
 
-        self.manifest_update_thread = ManifestUpdateThread(self.manifest_url)
+        self.manifest_changed_during_check = False
+        self.manifest_update_thread = ManifestUpdateThread(self.manifest_repos)
         self.manifest_update_thread.info.connect(self.update_status_label.setText)
+        self.manifest_update_thread.source_loaded.connect(self.manifest_source_loaded)
         self.manifest_update_thread.finished.connect(self.manifest_update_finished)
         self.manifest_update_thread.start()
 
-    def manifest_update_finished(self, success, error_message, new_manifest_data):
+    def manifest_source_loaded(self, repo, manifest_data, parsed, full_refresh, changed):
+        """Show a source's apps as soon as it arrives instead of waiting for the slowest one"""
+        if repo not in self.manifest_repos:
+            return
+        known_source = repo in self.manifest_sources
+        self.manifest_sources[repo] = manifest_data
+        self.parsed_sources[repo] = parsed
+        if not full_refresh and known_source and not self.catalog.offline:
+            if changed:
+                self.apply_manifest_changes(changed)
+            return
+
+        merged = merge_manifests(self.manifest_repos, self.parsed_sources)
+        if merged != self.catalog:
+            self.catalog = merged
+            self.manifest_changed_during_check = True
+            self.refresh_available_apps()
+
+    @traced("update catalog rows", "ui")
+    def apply_manifest_changes(self, names):
+        """Update only the catalog rows of the changed apps"""
+        applications = list(self.catalog)
+        removed = False
+        for name in names:
+            winner = next((self.parsed_sources[repo][0][name] for repo in self.manifest_repos
+                           if name in self.parsed_sources.get(repo, ({}, []))[0]), None)
+            row = self.catalog.row(name)
+            if winner and row is not None:
+                applications[row] = winner
+            elif winner:
+                applications.append(winner)
+            elif row is not None:
+                applications[row] = None
+                removed = True
+        problems = merge_manifests(self.manifest_repos, self.parsed_sources).problems
+        self.catalog = Catalog([app for app in applications if app is not None], problems=problems)
+        self.manifest_changed_during_check = True
+
+        if removed:
+            self.refresh_available_apps()
+            return
+        # New apps were appended in the order of names, so they line up with the added rows
+        for name in names:
+            row = self.catalog.row(name)
+            if row is None:
+                continue
+            if row < self.available_list.count():
+                self.set_available_item(self.available_list.item(row), self.catalog.applications[row])
+                if row == self.available_list.currentRow():
+                    self.on_app_selected(row)
+            else:
+                item = QListWidgetItem()
+                self.set_available_item(item, self.catalog.applications[row])
+                self.available_list.addItem(item)
+
+    @traced("refresh installed rows", "ui")
+    def refresh_installed_rows(self):
+        """Release checks only change the update marker of installed apps"""
+        if self.catalog is None:
+            return
+        for name in self.installed_apps:
+            row = self.catalog.row(name)
+            if row is not None:
+                self.set_available_item(self.available_list.item(row), self.catalog.applications[row])
+
+    def refresh_available_apps(self):
+        current_row = self.available_list.currentRow()
+        self.populate_available_apps()
+        if 0 <= current_row < self.available_list.count():
+            self.available_list.setCurrentRow(current_row)
+            self.on_app_selected(current_row)
+
+    def manifest_update_finished(self, success, error_message):
         """Handle completion of manifest update check"""
         self.refresh_btn.setEnabled(True)
         self.refresh_btn.setText("Check for Updates")
+        tooltip = f"Check for manifest and application updates\n{GITHUB.status_text()}"
+        if self.catalog.problems:
+            tooltip += "\n\nSkipped manifest entries:\n" + "\n".join(self.catalog.problems)
+        self.refresh_btn.setToolTip(tooltip)
         self.notify_updates()
 
-        if success and new_manifest_data:
+        if success:
 
-            manifest_changed = False
-            if self.manifest_data != new_manifest_data:
-                manifest_changed = True
-                self.manifest_data = new_manifest_data
+            manifest_changed = self.manifest_changed_during_check
 
-            self.populate_available_apps()
-            current_row = self.available_list.currentRow()
-            if current_row >= 0:
-                self.on_app_selected(current_row)
+            self.refresh_installed_rows()
 
-            update_count = 0
-            if self.manifest_data and 'applications' in self.manifest_data:
-                for app in self.manifest_data['applications']:
-                    app_name = app['name']
-                    if app_name in self.installed_apps:
-                        latest_version = self.get_latest_version(app)
-                        installed_version = self.installed_apps[app_name]['version']
-                        if latest_version and is_version_newer(latest_version, installed_version):
-                            update_count += 1
+            self.pending_updates = self.find_app_updates()
+            update_count = len(self.pending_updates)
+            self.update_all_btn.setVisible(update_count > 0)
+            self.schedule_prestaging()
+            self.watch_installed_releases()
 
             previous_app_updates = self.has_app_updates
             self.has_app_updates = update_count > 0
@@ -894,12 +4803,18 @@ class QypherLauncher(QMainWindow):
                             QSystemTrayIcon.Information,
                             5000
                         )
+            elif GITHUB.rate_limited():
+                self.update_status_label.setText(GITHUB.status_text())
+                self.update_status_label.setStyleSheet("color: #e67e22; font-weight: bold;")
             else:
                 if manifest_changed:
                     self.update_status_label.setText("Manifest updated, no app updates available")
                 else:
                     self.update_status_label.setText("Everything is up to date!")
                 self.update_status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+            if self.catalog.problems:
+                self.update_status_label.setText(f"{self.update_status_label.text()} "
+                                                 f"({len(self.catalog.problems)} invalid manifest entries skipped)")
 
             self.hide_update_status_timer = self.startTimer(5000)
 
@@ -915,76 +4830,102 @@ class QypherLauncher(QMainWindow):
             self.update_status_label.setVisible(False)
             delattr(self, 'hide_update_status_timer')
 
+    @traced("load cached manifests", "manifest")
     def load_manifest(self):
-        try:
-            response = requests.get(self.manifest_url, timeout=10)
-            if response.status_code == 200:
-                self.manifest_data = response.json()
-                self.populate_available_apps()
-            else:
-
-                self.manifest_data = {
-                    "applications": [
-                        {
-                            "name": "No application found",
-                            "description": "It seems like you don't have an active internet connection or the manifest failed to load",
-                            "url": "https://github.com/QKing-Official",
-                            "filename": "-"
-                        }
-                    ]
-                }
-                self.populate_available_apps()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load manifest: {str(e)}")
-
-            self.manifest_data = {
-                "applications": [
-                        {
-                            "name": "No application found",
-                            "description": "It seems like you don't have an active internet connection or the manifest failed to load",
-                            "url": "https://github.com/QKing-Official",
-                            "filename": "-"
-                        }
-                ]
-            }
-            self.populate_available_apps()
-
+        """Show the cached manifests right away, the update check replaces them with fresh copies"""
+        self.manifest_sources = {}
+        self.parsed_sources = {}
+        for repo in self.manifest_repos:
+            manifest_data = load_cached_manifest(repo)
+            if manifest_data:
+                self.manifest_sources[repo] = manifest_data
+                self.parsed_sources[repo] = parse_manifest(repo, manifest_data)
+
+        self.catalog = merge_manifests(self.manifest_repos, self.parsed_sources)
+        if not self.catalog.applications:
+
+            self.catalog = Catalog([CatalogApp(
+                "No application found", "https://github.com/QKing-Official",
+                description="It seems like you don't have an active internet connection or the manifest failed to load",
+                filename="-"
+            )], offline=True, problems=self.catalog.problems)
+        self.populate_available_apps()
+
+    @traced("populate catalog", "ui")
     def populate_available_apps(self):
         self.available_list.clear()
-        if self.manifest_data and 'applications' in self.manifest_data:
-            for app in self.manifest_data['applications']:
+        if self.catalog is not None:
+            for app in self.catalog:
                 item = QListWidgetItem()
-                app_name = app['name']
-
-                if app_name in self.installed_apps:
-                    latest_version = self.get_latest_version(app)
-                    installed_version = self.installed_apps[app_name]['version']
+                self.set_available_item(item, app)
+                self.available_list.addItem(item)
+        self.icon_request_timer.start()
 
-                    if latest_version and is_version_newer(latest_version, installed_version):
+    def set_available_item(self, item, app):
+        app_name = app.name
 
-                        display_text = f"{app_name} *"
-                        item.setForeground(QColor(42, 130, 218))  
-                        item.setData(Qt.UserRole, "update_available")
-                    else:
-                        display_text = app_name
-                        item.setData(Qt.UserRole, "up_to_date")
-                else:
-                    display_text = app_name
-                    item.setData(Qt.UserRole, "not_installed")
+        if app_name in self.installed_apps:
+            latest_version = self.get_latest_version(app)
+            installed_version = self.installed_apps[app_name]['version']
 
-                item.setText(display_text)
-                self.available_list.addItem(item)
+            if latest_version and is_version_newer(latest_version, installed_version):
 
-    def get_latest_version(self, app_data):
+                display_text = f"{app_name} *"
+                item.setForeground(QColor(42, 130, 218))  
+                item.setData(Qt.UserRole, "update_available")
+            else:
+                display_text = app_name
+                item.setForeground(QBrush())
+                item.setData(Qt.UserRole, "up_to_date")
+        else:
+            display_text = app_name
+            item.setForeground(QBrush())
+            item.setData(Qt.UserRole, "not_installed")
+
+        running = self.process_supervisor.is_running(app_name)
+        font = QFont()
+        font.setBold(running)
+        item.setFont(font)
+        item.setToolTip("Running" if running else "")
+        item.setText(display_text)
+        icon_url = app_icon_url(app)
+        pixmap = self.icon_loader.cached(icon_url) if icon_url else None
+        item.setIcon(QIcon(pixmap) if pixmap else QIcon())
+
+    def visible_rows(self):
+        if not self.available_list.count():
+            return range(0)
+        viewport = self.available_list.viewport()
+        first = self.available_list.itemAt(0, 0)
+        last = self.available_list.itemAt(0, viewport.height() - 1)
+        first_row = self.available_list.row(first) if first else 0
+        last_row = self.available_list.row(last) if last else self.available_list.count() - 1
+        return range(first_row, last_row + 1)
+
+    def request_visible_icons(self):
+        """Only rows on screen fetch their icons"""
+        applications = self.catalog.applications if self.catalog is not None else ()
+        for row in self.visible_rows():
+            if row < len(applications):
+                icon_url = app_icon_url(applications[row])
+                if icon_url:
+                    self.icon_loader.request(icon_url)
+
+    def app_icon_loaded(self, url):
+        applications = self.catalog.applications if self.catalog is not None else ()
+        for row in self.visible_rows():
+            if row < len(applications) and app_icon_url(applications[row]) == url:
+                self.available_list.item(row).setIcon(QIcon(self.icon_loader.cached(url)))
+
+    def get_latest_version(self, app_data, background=True):
         """Get the latest version of an app from GitHub releases"""
-        try:
-            releases = get_github_releases(app_data['url'])
-            if releases and len(releases) > 0:
-                return releases[0].get('tag_name', 'latest')
-            return 'latest'
-        except:
-            return 'latest'
+        releases = get_github_releases(app_data.url, background, cached_only=self.catalog_from_cache)
+        release = latest_release(releases)
+        if release:
+            return release.get('tag_name', 'latest')
+        return 'latest'
 
+    @traced("scan installed apps", "disk")
     def scan_installed_apps(self):
         self.installed_apps = {}
         self.installed_list.clear()
@@ -1000,55 +4941,50 @@ class QypherLauncher(QMainWindow):
                                 app_info = json.load(f)
                                 self.installed_apps[app_info['name']] = app_info
                                 self.installed_list.addItem(f"{app_info['name']} (v{app_info['version']})")
-                        except:
+                        except (OSError, ValueError, KeyError):
                             pass
 
     def on_app_selected(self, index):
-        if index < 0 or not self.manifest_data:
+        if index < 0 or self.catalog is None or index >= len(self.catalog):
             self.details_frame.setVisible(False)
             return
 
-        item = self.available_list.item(index)
-        app_name = item.text().rstrip(' *')  
-        app_data = None
-
-        for app in self.manifest_data['applications']:
-            if app['name'] == app_name:
-                app_data = app
-                break
-
-        if app_data:
-            self.details_frame.setVisible(True)
-            self.app_name.setText(app_data['name'])
-            self.app_desc.setText(app_data.get('description', 'No description available'))
+        app_data = self.catalog.applications[index]
+        app_name = app_data.name
+        self.details_frame.setVisible(True)
+        self.app_name.setText(app_name)
+        self.app_desc.setText(app_data.description or "No description available")
 
-            self.version_combo.clear()
-            self.version_combo.addItem("latest")
+        self.version_combo.clear()
+        self.version_combo.addItem("latest")
 
-            releases = get_github_releases(app_data['url'])
-            if releases:
-                for release in releases:
-                    if release.get('tag_name'):
-                        self.version_combo.addItem(release['tag_name'])
+        releases = get_github_releases(app_data.url)
+        if releases:
+            for release in releases:
+                if release.get('tag_name'):
+                    self.version_combo.addItem(release['tag_name'])
 
-            if app_name in self.installed_apps:
-                installed_version = self.installed_apps[app_name]['version']
-                latest_version = self.get_latest_version(app_data)
+        if app_name in self.installed_apps:
+            installed_version = self.installed_apps[app_name]['version']
+            latest_version = self.get_latest_version(app_data, background=False)
 
-                if latest_version and is_version_newer(latest_version, installed_version):
-                    self.app_version.setText(f"Installed: v{installed_version} (Update available: v{latest_version})")
-                    self.install_btn.setText("Update to Latest")
-                    self.install_btn.setStyleSheet("background-color: #2a82da; color: white; font-weight: bold;")
+            if latest_version and is_version_newer(latest_version, installed_version):
+                staged = " - ready to apply" if find_staged_artifact(self.install_dir, app_name, latest_version) else ""
+                self.app_version.setText(f"Installed: v{installed_version} (Update available: v{latest_version}{staged})")
+                self.install_btn.setText("Update to Latest")
+                self.install_btn.setStyleSheet("background-color: #2a82da; color: white; font-weight: bold;")
 
-                    self.version_combo.setCurrentText("latest")
-                else:
-                    self.app_version.setText(f"Installed: v{installed_version} (Up to date)")
-                    self.install_btn.setText("Reinstall")
-                    self.install_btn.setStyleSheet("")  
+                self.version_combo.setCurrentText("latest")
             else:
-                self.app_version.setText("Not installed")
-                self.install_btn.setText("Install")
+                self.app_version.setText(f"Installed: v{installed_version} (Up to date)")
+                self.install_btn.setText("Reinstall")
                 self.install_btn.setStyleSheet("")  
+            if self.process_supervisor.is_running(app_name):
+                self.app_version.setText(self.app_version.text() + " - Running")
+        else:
+            self.app_version.setText("Not installed")
+            self.install_btn.setText("Install")
+            self.install_btn.setStyleSheet("")  
 
     def on_installed_app_selected(self, index):
         if index < 0:
@@ -1057,11 +4993,9 @@ class QypherLauncher(QMainWindow):
         item_text = self.installed_list.item(index).text()
         app_name = item_text.split(" (v")[0]
 
-        for i in range(self.available_list.count()):
-            item = self.available_list.item(i)
-            if item.text().rstrip(' *') == app_name:
-                self.available_list.setCurrentRow(i)
-                break
+        row = self.catalog.row(app_name) if self.catalog is not None else None
+        if row is not None:
+            self.available_list.setCurrentRow(row)
 
     def on_app_double_clicked(self, item):
         """Handle double-clicking on an app item"""
@@ -1084,61 +5018,148 @@ class QypherLauncher(QMainWindow):
         if current_row < 0:
             return
 
-        item = self.available_list.item(current_row)
-        app_name = item.text().rstrip(' *')  
-        version = self.version_combo.currentText()
+        if self.catalog is None or current_row >= len(self.catalog):
+            return
+        self.queue_install(self.catalog.applications[current_row], self.version_combo.currentText())
+
+    def blocked_by_running(self, app_name, action):
+        """Refuse to change the files of an app while it runs, True when it does"""
+        if not self.process_supervisor.is_running(app_name):
+            return False
+        QMessageBox.information(self, "Application Running", f"Close {app_name} before you {action} it.")
+        return True
+
+    def queue_install(self, app_data, version):
+        """Submit an install or update job for an app"""
+        app_name = app_data.name
+        if app_name in self.installed_apps and self.blocked_by_running(app_name, "update"):
+            return
+        active_job = self.job_scheduler.active_job_for(app_name)
+        if active_job and active_job.kind == "prestage":
+            self.job_scheduler.cancel(active_job.id)
+            prestage_job = active_job
+        elif active_job:
+            QMessageBox.information(self, "Busy", f"{app_name} already has a queued or running job.")
+            return
+        else:
+            prestage_job = None
 
-        app_data = None
-        for app in self.manifest_data['applications']:
-            if app['name'] == app_name:
-                app_data = app
-                break
+        if version == "latest":
+            # A known pending update pins the tag, which also lets a staged copy be applied
+            version = next((v for app, v in self.pending_updates if app.name == app_name), version)
 
-        if not app_data:
-            return
+        install_dir = self.install_dir
+        action = "Update" if app_name in self.installed_apps else "Install"
 
-        self.set_buttons_enabled(False)
-        self.progress_bar.setVisible(True)
-        self.status_label.setVisible(True)
-        self.progress_bar.setValue(0)
-        self.status_label.setText("Preparing installation...")
+        def run_install(job):
+            # A cancelled pre-stage job still owns the staging directory until it has cleaned up
+            if prestage_job:
+                prestage_job.wait()
+            return run_job_action(job, "install", app_data=app_data, version=version, install_dir=install_dir)
 
-        self.install_thread = InstallThread(app_data, version, self.install_dir)
-        self.install_thread.progress.connect(self.progress_bar.setValue)
-        self.install_thread.info.connect(self.status_label.setText)
-        self.install_thread.finished.connect(self.installation_finished)
-        self.install_thread.start()
+        self.job_scheduler.submit(f"{action} {app_name} ({version})", run_install,
+                                  kind="install", app_name=app_name)
 
-    def installation_finished(self, success, message, actual_version):
-        self.set_buttons_enabled(True)
-        self.progress_bar.setVisible(False)
-        self.status_label.setVisible(False)
+    def job_finished(self, job_id, success, message):
+        """Route a finished scheduler job to the handler for its kind"""
+        self.ensure_catalog()
+        job = self.job_scheduler.jobs.get(job_id)
+        if not job:
+            return
 
-        if success:
-            self.scan_installed_apps()
-            self.populate_available_apps()  
+        if job.kind == "install":
+            self.installation_finished(success, message, job.result or "")
+        elif job.kind == "provision":
+            self.provision_job_finished(job)
+        elif job.kind == "uninstall":
+            self.uninstall_finished(success, message)
+        elif job.kind == "update_all":
+            self.update_all_finished(job)
+        elif job.kind == "verify":
+            self.verify_job_finished(job)
+        elif job.kind == "repair":
+            self.repair_job_finished(job)
+        elif job.kind == "export_bundle":
+            self.export_bundle_finished(job, success, message)
+
+    def refresh_installed_state(self):
+        # Jobs finish while the user keeps browsing, so keep their selection
+        current_row = self.available_list.currentRow()
+        self.scan_installed_apps()
+        self.populate_available_apps()  
 
-            current_row = self.available_list.currentRow()
-            if current_row >= 0:
-                self.on_app_selected(current_row)
+        if current_row >= 0:
+            self.available_list.setCurrentRow(current_row)
 
-            self.check_app_updates_state()
+        self.check_app_updates_state()
+
+    def installation_finished(self, success, message, actual_version):
+        if success:
+            self.refresh_installed_state()
 
             QMessageBox.information(self, "Success", f"Application installed successfully!\nVersion: {actual_version}")
-        else:
+        elif message != "Cancelled":
             QMessageBox.critical(self, "Error", f"Installation failed: {message}")
 
-    def check_app_updates_state(self):
-        """Check if there are any app updates available and update the state"""
-        update_count = 0
-        if self.manifest_data and 'applications' in self.manifest_data:
-            for app in self.manifest_data['applications']:
-                app_name = app['name']
+    @traced("find app updates", "network")
+    def find_app_updates(self):
+        """Return (app_data, latest_version) for every installed app with a newer release"""
+        updates = []
+        if self.catalog is not None:
+            for app in self.catalog:
+                app_name = app.name
                 if app_name in self.installed_apps:
                     latest_version = self.get_latest_version(app)
                     installed_version = self.installed_apps[app_name]['version']
                     if latest_version and is_version_newer(latest_version, installed_version):
-                        update_count += 1
+                        updates.append((app, latest_version))
+        return updates
+
+    def watch_installed_releases(self):
+        applications = self.catalog.applications if self.catalog is not None else ()
+        self.release_watcher.watch({app.name: app for app in applications if app.name in self.installed_apps})
+
+    def app_release_checked(self, app_name, latest_version):
+        """Fold one app's periodic release check into the update state and tray badge"""
+        # Works from the watcher's copy so it keeps running while the catalog is trimmed
+        app_info = self.installed_apps.get(app_name)
+        app = self.release_watcher.apps.get(app_name)
+        if not app_info or not app:
+            return
+        row = self.catalog.row(app_name) if self.catalog is not None else None
+
+        was_pending = any(pending.name == app_name for pending, _ in self.pending_updates)
+        has_update = is_version_newer(latest_version, app_info['version'])
+        self.pending_updates = [(pending, version) for pending, version in self.pending_updates
+                                if pending.name != app_name]
+        if has_update:
+            self.pending_updates.append((app, latest_version))
+        self.update_all_btn.setVisible(bool(self.pending_updates))
+
+        previous_state = self.has_app_updates
+        self.has_app_updates = bool(self.pending_updates)
+        if previous_state != self.has_app_updates:
+            self.update_tray_icon()
+        if was_pending != has_update and row is not None:
+            self.set_available_item(self.available_list.item(row), app)
+
+        if has_update and not was_pending:
+            self.schedule_prestaging()
+            if hasattr(self, 'tray_icon') and self.tray_icon.isVisible():
+                self.tray_icon.showMessage(
+                    "App Update Available",
+                    f"{app_name} {latest_version} is available",
+                    QSystemTrayIcon.Information,
+                    5000
+                )
+
+    def check_app_updates_state(self):
+        """Check if there are any app updates available and update the state"""
+        self.pending_updates = self.find_app_updates()
+        self.watch_installed_releases()
+        update_count = len(self.pending_updates)
+        self.update_all_btn.setVisible(update_count > 0)
+        self.schedule_prestaging()
 
         previous_state = self.has_app_updates
         self.has_app_updates = update_count > 0
@@ -1146,6 +5167,503 @@ class QypherLauncher(QMainWindow):
         if previous_state != self.has_app_updates:
             self.update_tray_icon()
 
+    def apply_bandwidth_settings(self):
+        try:
+            schedule = parse_bandwidth_schedule(self.settings.value("bandwidth/schedule", ""))
+        except ValueError:
+            schedule = []
+        BANDWIDTH.configure(
+            self.settings.value("bandwidth/foreground_kbps", DEFAULT_FOREGROUND_KBPS, type=int),
+            self.settings.value("bandwidth/background_kbps", DEFAULT_BACKGROUND_KBPS, type=int),
+            schedule
+        )
+
+    def set_bandwidth_limits(self):
+        """Configure the shared foreground and background transfer limits"""
+        dialog = BandwidthDialog(
+            self,
+            self.settings.value("bandwidth/foreground_kbps", DEFAULT_FOREGROUND_KBPS, type=int),
+            self.settings.value("bandwidth/background_kbps", DEFAULT_BACKGROUND_KBPS, type=int),
+            self.settings.value("bandwidth/schedule", "")
+        )
+        if dialog.exec() == QDialog.Accepted:
+            foreground_kbps, background_kbps = dialog.get_limits()
+            self.settings.setValue("bandwidth/foreground_kbps", foreground_kbps)
+            self.settings.setValue("bandwidth/background_kbps", background_kbps)
+            self.settings.setValue("bandwidth/schedule", dialog.get_schedule())
+            self.apply_bandwidth_settings()
+
+    def set_github_token(self):
+        """Configure the optional token used for GitHub API requests"""
+        dialog = GitHubTokenDialog(self, self.settings.value("github/token", ""), GITHUB.status_text())
+        if dialog.exec() == QDialog.Accepted:
+            token = dialog.get_token()
+            self.settings.setValue("github/token", token)
+            GITHUB.set_token(token)
+            # Workers read the token once, idle ones are restarted to pick up the new one
+            WORKER_POOL.shutdown()
+
+    def apply_peer_settings(self):
+        """Start or stop serving the artifact cache to LAN peers, returns an error message on failure"""
+        if self.peer_server is not None:
+            self.peer_server.stop()
+            self.peer_server = None
+        if not self.settings.value("peers/serve", False, type=bool):
+            return None
+        server = PeerCacheServer(self.settings.value("peers/port", PEER_CACHE_PORT, type=int))
+        try:
+            server.start()
+        except OSError as e:
+            return f"Could not share on port {server.port}: {e}"
+        self.peer_server = server
+        return None
+
+    def set_peer_cache(self):
+        """Configure LAN peers to download from and whether this launcher serves its cache"""
+        status = self.peer_server.status_text() if self.peer_server else "Not sharing."
+        dialog = PeerCacheDialog(
+            self,
+            self.settings.value("peers/serve", False, type=bool),
+            self.settings.value("peers/port", PEER_CACHE_PORT, type=int),
+            peer_urls(),
+            status
+        )
+        if dialog.exec() == QDialog.Accepted:
+            serve, port = dialog.get_serve()
+            self.settings.setValue("peers/serve", serve)
+            self.settings.setValue("peers/port", port)
+            self.settings.setValue("peers/urls", dialog.get_peer_urls())
+            error = self.apply_peer_settings()
+            if error:
+                QMessageBox.warning(self, "LAN Peer Cache", error)
+
+    def set_tracing_enabled(self, enabled):
+        if enabled:
+            TRACER.enable()
+        else:
+            TRACER.disable()
+
+    def set_watchdog_enabled(self, enabled):
+        self.settings.setValue("diagnostics/stall_watchdog", enabled)
+        if enabled:
+            WATCHDOG.start(self.settings.value("diagnostics/stall_threshold_ms", STALL_THRESHOLD_MS, type=int))
+        else:
+            WATCHDOG.stop()
+
+    def show_stall_report(self):
+        box = QMessageBox(QMessageBox.Information, "UI Stalls",
+                          f"{WATCHDOG.summary_text()}\n\nThe report is also saved to:\n{STALL_REPORT}",
+                          QMessageBox.Ok, self)
+        details = WATCHDOG.details_text()
+        if details:
+            box.setDetailedText(details)
+        box.exec()
+
+    def export_trace(self):
+        """Save the recorded spans as a Chrome trace"""
+        path, _ = QFileDialog.getSaveFileName(self, "Export Trace", "qypher-trace.json", "Trace files (*.json)")
+        if not path:
+            return
+        try:
+            TRACER.export(path)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Failed to write trace: {str(e)}")
+            return
+
+        summary = TRACER.summary()
+        lines = [f"{host}: {count} request(s)" for host, count in sorted(summary['requests_per_host'].items())]
+        lines += [f"{name} cache: {counts['hit_rate']:.0%} hits of {counts['hits'] + counts['misses']}"
+                  for name, counts in sorted(summary['cache_hit_rates'].items()) if counts['hit_rate'] is not None]
+        box = QMessageBox(QMessageBox.Information, "Export Trace",
+                          f"Wrote {summary['spans']} span(s) to:\n{path}\n\nOpen it in chrome://tracing or ui.perfetto.dev.",
+                          QMessageBox.Ok, self)
+        box.setDetailedText("\n".join(lines))
+        box.exec()
+
+    def set_prestage_enabled(self, enabled):
+        self.prestage_enabled = enabled
+        self.settings.setValue("prestage/enabled", enabled)
+        if enabled:
+            self.schedule_prestaging()
+        else:
+            for job in self.job_scheduler.jobs.values():
+                if job.kind == "prestage" and job.is_active:
+                    self.job_scheduler.cancel(job.id)
+
+    def schedule_prestaging(self):
+        """Stage pending updates in the background while the machine is idle on an unmetered link"""
+        if not self.prestage_enabled:
+            return
+
+        prestage_jobs = [job for job in self.job_scheduler.jobs.values()
+                         if job.kind == "prestage" and job.is_active]
+        idle_seconds = get_idle_seconds()
+        idle_threshold = self.settings.value("prestage/idle_seconds", PRESTAGE_IDLE_SECONDS, type=int)
+        allowed = (idle_seconds is None or idle_seconds >= idle_threshold) and not is_connection_metered()
+
+        # Step out of the user's way as soon as they are back or the link becomes metered
+        for job in prestage_jobs:
+            if not allowed and job.state != JOB_PAUSED:
+                self.job_scheduler.pause(job.id)
+            elif allowed and job.state == JOB_PAUSED:
+                self.job_scheduler.resume(job.id)
+        if not allowed:
+            return
+
+        install_dir = self.install_dir
+        for app, version in self.pending_updates:
+            if self.job_scheduler.active_job_for(app.name):
+                continue
+            if find_staged_artifact(install_dir, app.name, version):
+                continue
+            self.job_scheduler.submit(
+                f"Pre-stage {app.name} ({version})",
+                lambda job, app=app, version=version: run_job_action(
+                    job, "prestage", app_data=app, version=version, install_dir=install_dir),
+                kind="prestage", app_name=app.name, priority=PRIORITY_BACKGROUND
+            )
+
+    def update_all_apps(self):
+        """Update every app with a pending update in one pipelined job"""
+        self.ensure_catalog()
+        if not self.pending_updates:
+            self.check_app_updates_state()
+
+        updates = []
+        prestage_jobs = []
+        running = []
+        for app, version in self.pending_updates:
+            if self.process_supervisor.is_running(app.name):
+                running.append(app.name)
+                continue
+            active_job = self.job_scheduler.active_job_for(app.name)
+            if active_job and active_job.kind == "prestage":
+                self.job_scheduler.cancel(active_job.id)
+                prestage_jobs.append(active_job)
+            elif active_job:
+                continue
+            updates.append((app, version))
+        if running:
+            self.update_status_label.setVisible(True)
+            self.update_status_label.setText(f"Skipped while running: {', '.join(running)}")
+        if not updates:
+            if not running:
+                QMessageBox.information(self, "Update All", "All applications are up to date.")
+            return
+
+        install_dir = self.install_dir
+
+        def run_update_all(job):
+            for prestage_job in prestage_jobs:
+                prestage_job.wait()
+            return update_all_applications(job, updates, install_dir)
+
+        self.job_scheduler.submit(f"Update {len(updates)} app(s)", run_update_all, kind="update_all")
+
+    def update_all_finished(self, job):
+        self.refresh_installed_state()
+
+        if job.state == JOB_FAILED:
+            QMessageBox.critical(self, "Error", f"Update failed: {job.message}")
+            return
+        results = job.result or []
+        if job.state == JOB_CANCELLED or not results:
+            return
+
+        updated = [r for r in results if r['status'] == "updated"]
+        lines = [f"{r['name']} {r['version']}: {r['status']} ({r['seconds']:.1f}s)" +
+                 (f" - {r['message']}" if r['message'] else "") for r in results]
+        box = QMessageBox(QMessageBox.Information if len(updated) == len(results) else QMessageBox.Warning,
+                          "Update All", f"Updated {len(updated)}/{len(results)} app(s) in {job.elapsed:.1f}s",
+                          QMessageBox.Ok, self)
+        box.setDetailedText("\n".join(lines))
+        box.exec()
+
+    def verify_installed_apps(self, deep=False):
+        """Check every installed app for missing or damaged files, deep hashes every file"""
+        if not self.installed_apps:
+            QMessageBox.information(self, "Verify", "No applications are installed.")
+            return
+
+        self.verify_reports = []
+        self.verify_pending = set()
+        for app_name, app_info in self.installed_apps.items():
+            if self.job_scheduler.active_job_for(app_name):
+                continue
+            job = self.job_scheduler.submit(
+                f"Verify {app_name}",
+                lambda job, app_info=app_info: run_job_action(job, "verify", app_info=app_info, deep=deep),
+                kind="verify", app_name=app_name
+            )
+            self.verify_pending.add(job.id)
+
+    def verify_job_finished(self, job):
+        if job.id not in self.verify_pending:
+            return
+        self.verify_pending.discard(job.id)
+        if job.result:
+            self.verify_reports.append(job.result)
+        elif job.state == JOB_FAILED:
+            self.verify_reports.append({'name': job.app_name, 'ok': False, 'problems': [job.message],
+                                        'damaged': [], 'indexed': False})
+        if self.verify_pending:
+            return
+
+        damaged = [r for r in self.verify_reports if not r['ok']]
+        repairable = [r for r in damaged if r['damaged']]
+        lines = []
+        for report in sorted(self.verify_reports, key=lambda r: r['name']):
+            line = f"{report['name']}: " + ("OK" if report['ok'] else "; ".join(report['problems']))
+            if not report['indexed']:
+                line += " (no file index, reinstall to enable full verification)"
+            lines.append(line)
+        box = QMessageBox(QMessageBox.Warning if damaged else QMessageBox.Information, "Verify",
+                          f"{len(damaged)} of {len(self.verify_reports)} app(s) have problems",
+                          QMessageBox.Ok, self)
+        box.setDetailedText("\n".join(lines))
+        repair_button = box.addButton("Repair", QMessageBox.AcceptRole) if repairable else None
+        box.exec()
+
+        if repair_button and box.clickedButton() is repair_button:
+            self.repair_apps(repairable)
+
+    def repair_apps(self, reports):
+        """Re-fetch only the damaged files of each app"""
+        self.repair_reports = []
+        for report in reports:
+            app_info = self.installed_apps.get(report['name'])
+            if (not app_info or self.job_scheduler.active_job_for(report['name']) or
+                    self.process_supervisor.is_running(report['name'])):
+                continue
+            job = self.job_scheduler.submit(
+                f"Repair {report['name']}",
+                lambda job, app_info=app_info, damaged=report['damaged']: run_job_action(
+                    job, "repair", app_info=app_info, damaged=damaged),
+                kind="repair", app_name=report['name']
+            )
+            self.repair_pending.add(job.id)
+
+    def repair_job_finished(self, job):
+        if job.id not in self.repair_pending:
+            return
+        self.repair_pending.discard(job.id)
+        if job.result:
+            self.repair_reports.append(job.result)
+        elif job.state == JOB_FAILED:
+            self.repair_reports.append({'name': job.app_name, 'repaired': [], 'failed': [job.message]})
+        if self.repair_pending:
+            return
+
+        failed = [r for r in self.repair_reports if r['failed']]
+        lines = [f"{r['name']}: {len(r['repaired'])} file(s) repaired" +
+                 (f", failed: {'; '.join(r['failed'])}" if r['failed'] else "")
+                 for r in self.repair_reports]
+        box = QMessageBox(QMessageBox.Warning if failed else QMessageBox.Information, "Repair",
+                          f"Repaired {len(self.repair_reports) - len(failed)} of {len(self.repair_reports)} app(s)",
+                          QMessageBox.Ok, self)
+        box.setDetailedText("\n".join(lines))
+        box.exec()
+
+    def export_lockfile(self):
+        """Write the installed apps with pinned versions and hashes to a lockfile"""
+        if not self.installed_apps:
+            QMessageBox.information(self, "Export Lockfile", "No applications are installed.")
+            return
+
+        path, _ = QFileDialog.getSaveFileName(self, "Export Lockfile", "qypher.lock.json", "Lockfiles (*.json)")
+        if not path:
+            return
+
+        manifest_apps = self.catalog.applications if self.catalog is not None else ()
+        lockfile = build_lockfile(self.installed_apps, manifest_apps, self.manifest_repos)
+        try:
+            with open(path, 'w') as f:
+                json.dump(lockfile, f, indent=4)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to write lockfile: {str(e)}")
+            return
+
+        unhashed = [entry['name'] for entry in lockfile['applications'] if not entry['sha256']]
+        message = f"Exported {len(lockfile['applications'])} application(s) to:\n{path}"
+        if unhashed:
+            message += f"\n\nNo hash recorded for: {', '.join(unhashed)} (reinstall to record one)"
+        QMessageBox.information(self, "Export Lockfile", message)
+
+    def import_lockfile(self):
+        """Install every application listed in a lockfile"""
+        if self.provision_batch:
+            QMessageBox.information(self, "Busy", "A lockfile is already being provisioned.")
+            return
+
+        path, _ = QFileDialog.getOpenFileName(self, "Import Lockfile", "", "Lockfiles (*.json)")
+        if not path:
+            return
+
+        try:
+            entries = load_lockfile(path)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Invalid lockfile: {str(e)}")
+            return
+
+        self.provision(entries)
+
+    def provision(self, entries, bundle_path=None):
+        """Install lockfile entries as a batch, from an offline bundle when one is given"""
+        install_dir = self.install_dir
+        self.provision_batch = {'pending': set(), 'report': [], 'started': time.perf_counter()}
+
+        for entry in entries:
+            if lockfile_entry_satisfied(entry, self.installed_apps):
+                self.provision_batch['report'].append({'name': entry['name'], 'version': entry['version'],
+                                                       'status': "skipped", 'seconds': 0.0,
+                                                       'message': "Already installed"})
+                continue
+            if self.job_scheduler.active_job_for(entry['name']):
+                self.provision_batch['report'].append({'name': entry['name'], 'version': entry['version'],
+                                                       'status': "failed", 'seconds': 0.0,
+                                                       'message': "Another job is running for this app"})
+                continue
+            if self.process_supervisor.is_running(entry['name']):
+                self.provision_batch['report'].append({'name': entry['name'], 'version': entry['version'],
+                                                       'status': "failed", 'seconds': 0.0,
+                                                       'message': "The application is running"})
+                continue
+
+            app_data = self.catalog.get(entry['name']) if self.catalog is not None else None
+            if app_data is None:
+                app_data = CatalogApp(entry['name'], entry.get('url', ''), filename=entry.get('filename', ''))
+            elif not app_data.filename:
+                app_data = app_data.replace(filename=entry.get('filename', ''))
+            if bundle_path:
+                func = lambda job, app_data=app_data, entry=entry: run_job_action(
+                    job, "install_bundle", bundle_path=bundle_path, entry=entry, app_data=app_data,
+                    install_dir=install_dir)
+            else:
+                func = lambda job, app_data=app_data, entry=entry: run_job_action(
+                    job, "install", app_data=app_data, version=entry['version'], install_dir=install_dir,
+                    download_url=entry.get('download_url'), expected_sha256=entry.get('sha256'))
+            job = self.job_scheduler.submit(f"Provision {entry['name']} ({entry['version']})", func,
+                                            kind="provision", app_name=entry['name'])
+            job.entry = entry
+            self.provision_batch['pending'].add(job.id)
+
+        self.update_provision_status()
+
+    def export_bundle(self):
+        """Pack installed apps with the manifest and release data for an air-gapped install"""
+        if not self.installed_apps:
+            QMessageBox.information(self, "Export Offline Bundle", "No applications are installed.")
+            return
+
+        dialog = BundleExportDialog(self, sorted(self.installed_apps))
+        if dialog.exec() != QDialog.Accepted or not dialog.get_selected():
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export Offline Bundle", "qypher-bundle.qbundle",
+                                              "Qypher bundles (*.qbundle)")
+        if not path:
+            return
+
+        selected = set(dialog.get_selected())
+        manifest_apps = self.catalog.applications if self.catalog is not None else ()
+        mirrors = {app.name: list(app.mirrors) for app in manifest_apps}
+        entries = [dict(entry, mirrors=mirrors.get(entry['name'], []))
+                   for entry in build_lockfile(self.installed_apps, manifest_apps, self.manifest_repos)['applications']
+                   if entry['name'] in selected and entry['download_url']]
+        manifest_sources = {repo: manifest for repo, manifest in self.manifest_sources.items() if manifest}
+        manifest_repos = list(self.manifest_repos)
+        self.job_scheduler.submit(
+            f"Export bundle ({len(entries)} apps)",
+            lambda job: run_job_action(job, "export_bundle", path=path, entries=entries,
+                                       manifest_sources=manifest_sources, manifest_repos=manifest_repos),
+            kind="export_bundle"
+        )
+
+    def export_bundle_finished(self, job, success, message):
+        if success:
+            QMessageBox.information(self, "Export Offline Bundle",
+                                    f"Exported {job.result['applications']} application(s), "
+                                    f"{job.result['size'] / (1024 * 1024):.1f} MB.")
+        elif message != "Cancelled":
+            QMessageBox.critical(self, "Error", f"Bundle export failed: {message}")
+
+    def import_bundle(self):
+        """Load a bundle's manifest and release data, then install its apps from it"""
+        if self.provision_batch:
+            QMessageBox.information(self, "Busy", "A lockfile is already being provisioned.")
+            return
+
+        path, _ = QFileDialog.getOpenFileName(self, "Import Offline Bundle", "", "Qypher bundles (*.qbundle)")
+        if not path:
+            return
+
+        try:
+            index = load_bundle_index(path)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Invalid bundle: {str(e)}")
+            return
+
+        # Seed the caches, never over newer data this launcher already has
+        for repo, manifest in index.get('manifests', {}).items():
+            if load_cached_manifest(repo) is None:
+                save_manifest_cache(repo, {'manifest': manifest})
+            if repo not in self.manifest_repos:
+                self.manifest_repos.append(repo)
+        self.settings.setValue("manifest_repos", self.manifest_repos)
+        for url, releases in index.get('releases', {}).items():
+            api_url = f"{GITHUB_API_URL}/repos/{github_repo_path(url)}/releases"
+            if GITHUB.cached_entry(api_url) is None:
+                GITHUB.store_entry(api_url, {'etag': None, 'fetched_at': index['created_at'], 'data': releases})
+        # Idle workers may have looked those entries up already
+        WORKER_POOL.shutdown()
+        self.load_manifest()
+
+        self.provision(index['applications'], path)
+
+    def update_provision_status(self):
+        batch = self.provision_batch
+        if batch['pending']:
+            done = sum(1 for result in batch['report'] if result['status'] != "skipped")
+            total = done + len(batch['pending'])
+            self.update_status_label.setVisible(True)
+            self.update_status_label.setText(f"Provisioning: {done}/{total} done")
+        else:
+            self.provision_finished()
+
+    def provision_job_finished(self, job):
+        batch = self.provision_batch
+        if not batch or job.id not in batch['pending']:
+            return
+
+        batch['pending'].discard(job.id)
+        status = {JOB_FINISHED: "installed", JOB_CANCELLED: "cancelled"}.get(job.state, "failed")
+        batch['report'].append({'name': job.app_name, 'version': job.result or job.entry['version'],
+                                'status': status, 'seconds': job.elapsed, 'message': job.message})
+        self.update_provision_status()
+
+    def provision_finished(self):
+        report = self.provision_batch['report']
+        elapsed = time.perf_counter() - self.provision_batch['started']
+        self.provision_batch = None
+
+        self.update_status_label.setVisible(False)
+        self.refresh_installed_state()
+
+        attempted = [r for r in report if r['status'] != "skipped"]
+        failed = [r for r in attempted if r['status'] != "installed"]
+        summary = f"Provisioned {len(attempted) - len(failed)}/{len(attempted)} app(s) in {elapsed:.1f}s"
+
+        lines = []
+        for result in sorted(report, key=lambda r: r['seconds'], reverse=True):
+            line = f"{result['name']} {result['version']}: {result['status']} ({result['seconds']:.1f}s)"
+            if result['message'] and result['status'] != "installed":
+                line += f" - {result['message']}"
+            lines.append(line)
+
+        box = QMessageBox(QMessageBox.Warning if failed else QMessageBox.Information,
+                          "Provisioning Report", summary, QMessageBox.Ok, self)
+        box.setDetailedText("\n".join(lines))
+        box.exec()
+
     def launch_app(self):
         current_row = self.available_list.currentRow()
         if current_row < 0:
@@ -1158,25 +5676,64 @@ class QypherLauncher(QMainWindow):
             QMessageBox.warning(self, "Not Installed", "This application is not installed.")
             return
 
-        app_info = self.installed_apps[app_name]
-        executable_path = os.path.join(app_info['installed_path'], app_info.get('executable', ''))
-
-        if not os.path.exists(executable_path):
-
-            for file in os.listdir(app_info['installed_path']):
-                if file.endswith('.exe'):
-                    executable_path = os.path.join(app_info['installed_path'], file)
-                    break
-
-        if not os.path.exists(executable_path):
+        executable_path = self.installed_executable(self.installed_apps[app_name])
+        if not executable_path:
             QMessageBox.critical(self, "Error", "Executable not found.")
             return
 
         try:
-            os.startfile(executable_path)
-        except Exception as e:
+            self.process_supervisor.launch(app_name, executable_path)
+        except OSError as e:
             QMessageBox.critical(self, "Error", f"Failed to launch application: {str(e)}")
 
+    def installed_executable(self, app_info):
+        """Absolute path of an app's program from its install index, None when it is gone"""
+        relative_path = app_info.get('executable_path')
+        if relative_path is None:
+            # Installed before the index existed, resolve once and remember it
+            installed_path = app_info['installed_path']
+            files = app_info.get('files') or {
+                name: None for name in os.listdir(installed_path)
+                if os.path.isfile(os.path.join(installed_path, name)) and name != "app_info.json"}
+            relative_path = resolve_executable(files, app_info.get('executable', ''))
+            if relative_path:
+                app_info['executable_path'] = relative_path
+                try:
+                    with open(os.path.join(installed_path, "app_info.json"), 'w') as f:
+                        json.dump(app_info, f, indent=4)
+                except OSError:
+                    pass
+        if not relative_path:
+            return None
+        executable_path = os.path.join(app_info['installed_path'], relative_path)
+        return executable_path if os.path.exists(executable_path) else None
+
+    def app_process_changed(self, app_name):
+        row = self.catalog.row(app_name) if self.catalog is not None else None
+        if row is not None:
+            self.set_available_item(self.available_list.item(row), self.catalog.applications[row])
+            if row == self.available_list.currentRow():
+                self.on_app_selected(row)
+
+    def app_process_exited(self, app_name, code):
+        self.app_process_changed(app_name)
+        if code != 0 and self.tray_icon.isVisible():
+            self.tray_icon.showMessage(
+                "Application Exited",
+                f"{app_name} exited with code {format_exit_code(code)}",
+                QSystemTrayIcon.Warning,
+                5000
+            )
+
+    def show_launch_statistics(self):
+        lines = self.process_supervisor.summary_lines()
+        box = QMessageBox(QMessageBox.Information, "Launch Statistics",
+                          f"{len(lines)} app(s) launched from {APP_NAME}." if lines else "No apps launched yet.",
+                          QMessageBox.Ok, self)
+        if lines:
+            box.setDetailedText("\n".join(lines))
+        box.exec()
+
     def uninstall_app(self):
         current_row = self.available_list.currentRow()
         if current_row < 0:
@@ -1197,20 +5754,30 @@ class QypherLauncher(QMainWindow):
         )
 
         if reply == QMessageBox.Yes:
+            if self.job_scheduler.active_job_for(app_name):
+                QMessageBox.information(self, "Busy", f"{app_name} already has a queued or running job.")
+                return
+            if self.blocked_by_running(app_name, "uninstall"):
+                return
+
             app_info = self.installed_apps[app_name]
-            app_dir = app_info['installed_path']
+            self.job_scheduler.submit(
+                f"Uninstall {app_name}",
+                lambda job: run_job_action(job, "uninstall", app_info=app_info),
+                kind="uninstall", app_name=app_name
+            )
 
-            try:
-                shutil.rmtree(app_dir)
-                self.scan_installed_apps()
-                self.populate_available_apps()  
-                self.on_app_selected(-1)  
+    def uninstall_finished(self, success, message):
+        if success:
+            self.scan_installed_apps()
+            self.populate_available_apps()  
+            self.on_app_selected(-1)  
 
-                self.check_app_updates_state()
+            self.check_app_updates_state()
 
-                QMessageBox.information(self, "Success", "Application uninstalled successfully!")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Uninstall failed: {str(e)}")
+            QMessageBox.information(self, "Success", "Application uninstalled successfully!")
+        elif message != "Cancelled":
+            QMessageBox.critical(self, "Error", f"Uninstall failed: {message}")
 
     def set_buttons_enabled(self, enabled):
         self.install_btn.setEnabled(enabled)
@@ -1219,6 +5786,7 @@ class QypherLauncher(QMainWindow):
         self.refresh_btn.setEnabled(enabled)
         self.custom_repo_btn.setEnabled(enabled)
         self.self_update_btn.setEnabled(enabled)
+        self.tools_btn.setEnabled(enabled)
 
     def toggle_theme(self):
         self.dark_mode = not self.dark_mode
@@ -1249,17 +5817,90 @@ class QypherLauncher(QMainWindow):
 
     def quit_application(self):
         self.tray_icon.hide()
+        WORKER_POOL.shutdown()
+        self.icon_loader.shutdown()
+        self.release_watcher.shutdown()
+        if self.peer_server is not None:
+            self.peer_server.stop()
+        WATCHDOG.stop()
         QApplication.quit()
 
     def closeEvent(self, event):
         event.ignore()
         self.hide()
 
+record_startup("import Qypher", MODULE_IMPORT_STARTED)
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(prog="Qypher", description=APP_NAME)
+    parser.add_argument("--make-delta", nargs=3, metavar=("OLD", "NEW", "PATCH"),
+                        help="write a launcher delta patch from OLD to NEW and exit")
+    parser.add_argument("--apply-delta", nargs=3, metavar=("OLD", "PATCH", "OUTPUT"),
+                        help="rebuild OUTPUT from OLD and a delta patch and exit")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--show", action="store_true", help="show the launcher window (default)")
+    parser.add_argument("--install", metavar="APP", help="install or update APP from the manifest")
+    parser.add_argument("--version", dest="app_version", metavar="VERSION", default="latest",
+                        help="version to use with --install")
+    parser.add_argument("--trace", metavar="PATH", help="record a performance trace and write it to PATH on exit")
+    # Unknown arguments are left for Qt
+    return parser.parse_known_args(argv[1:])
+
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    args, qt_args = parse_arguments(sys.argv)
+
+    if args.worker:
+        sys.exit(run_worker())
+
+    if args.make_delta:
+        old_path, new_path, patch_path = args.make_delta
+        patch_size = make_delta_file(old_path, new_path, patch_path)
+        print(f"Wrote {patch_path} ({patch_size} bytes, {os.path.getsize(new_path)} bytes full)")
+        sys.exit(0)
+    if args.apply_delta:
+        old_path, patch_path, output_path = args.apply_delta
+        try:
+            apply_delta_file(old_path, patch_path, output_path)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Wrote {output_path} (sha256 {file_sha256(output_path)})")
+        sys.exit(0)
+
+    if args.install:
+        instance_message = {'command': "install", 'app': args.install, 'version': args.app_version}
+    else:
+        instance_message = {'command': "show"}
+    if send_to_running_instance(instance_message):
+        sys.exit(0)
+
+    if args.trace:
+        TRACER.enable()
+        for name, (start, duration) in STARTUP_TIMES.items():
+            TRACER.add_span(name, "startup", start, duration, {})
+
+    start = time.time_ns() // 1000
+    app = QApplication(sys.argv[:1] + qt_args)
+    record_startup("create QApplication", start)
     app.setQuitOnLastWindowClosed(False)
 
+    # Listen before the slow startup work so a second launch meanwhile still finds this one
+    instance_server = SingleInstanceServer()
+    instance_server.listen()
+
+    settings = QSettings(ORGANIZATION, APP_NAME)
+    if settings.value("diagnostics/stall_watchdog", True, type=bool):
+        WATCHDOG.start(settings.value("diagnostics/stall_threshold_ms", STALL_THRESHOLD_MS, type=int))
+
+    start = time.time_ns() // 1000
     launcher = QypherLauncher()
+    record_startup("build window", start)
+    instance_server.message_received.connect(launcher.handle_instance_message)
     launcher.show()
+    if args.install:
+        launcher.handle_instance_message(instance_message)
 
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    if args.trace:
+        TRACER.export(args.trace)
+    sys.exit(exit_code)
@@ -0,0 +1,426 @@
+"""Reproducible Qypher benchmarks against a local stand-in for GitHub and its CDN
+
+Nothing touches github.com. The launcher runs under the offscreen Qt platform
+with its APPDATA and settings redirected to a temporary directory.
+
+    python benchmarks/bench.py --apps 200 --latency 20 --save-baseline default
+    python benchmarks/bench.py --apps 200 --latency 20 --compare default
+"""
+import os
+import sys
+import io
+import json
+import time
+import random
+import shutil
+import hashlib
+import zipfile
+import argparse
+import tempfile
+import threading
+import statistics
+import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+BENCH_ORGANIZATION = "QKing-Official-Benchmark"
+CHUNK_SIZE = 64 * 1024
+
+# Metric name, unit, whether a larger value is better
+METRICS = [
+    ("cold_start_s", "s", False),
+    ("time_to_window_s", "s", False),
+    ("catalog_population_s", "s", False),
+    ("update_check_s", "s", False),
+    ("install_mb_s", "MB/s", True),
+    ("extraction_s", "s", False),
+]
+
+
+class FakeGitHub:
+    """Serves a manifest repository, the releases API and release assets from memory"""
+
+    def __init__(self, apps=100, latency=0.0, bandwidth_kbps=0, error_rate=0.0, asset_mb=4.0, seed=1):
+        self.apps = apps
+        self.latency = latency
+        self.bandwidth = bandwidth_kbps * 1024
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = {}
+        self.asset = self.build_asset(int(asset_mb * 1024 * 1024), seed)
+        self.asset_sha256 = hashlib.sha256(self.asset).hexdigest()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.handler_class())
+        self.server.daemon_threads = True
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    @staticmethod
+    def build_asset(size, seed):
+        # Half random, half repetitive, so extraction does real inflate work
+        data = random.Random(seed).randbytes(size // 2) + b"Qypher benchmark payload " * (size // 50)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("app.exe", data[:size])
+            for index in range(32):
+                archive.writestr(f"data/file{index}.txt", f"resource {index}\n" * 256)
+        return buffer.getvalue()
+
+    @property
+    def manifest_repo(self):
+        return f"{self.base}/manifest"
+
+    def manifest(self):
+        return {"applications": [{
+            "name": f"BenchApp{index}",
+            "description": f"Benchmark application {index}",
+            "url": f"{self.base}/github.com/bench/app{index}/releases/latest/download/app{index}.zip",
+            "filename": "app.exe"
+        } for index in range(self.apps)]}
+
+    def releases(self, repo):
+        asset_name = f"{repo}.zip"
+        return [{
+            "tag_name": tag,
+            "published_at": published,
+            "assets": [{
+                "name": asset_name,
+                "size": len(self.asset),
+                "browser_download_url": f"{self.base}/github.com/bench/{repo}/releases/download/{tag}/{asset_name}",
+                "digest": f"sha256:{self.asset_sha256}"
+            }]
+        } for tag, published in (("v1.1.0", "2026-02-01T00:00:00Z"), ("v1.0.0", "2026-01-01T00:00:00Z"))]
+
+    def launcher_release(self, launcher_version):
+        return {"tag_name": launcher_version, "assets": []}
+
+    def handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                fake.handle(self)
+
+        return Handler
+
+    def count(self, route):
+        with self.lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+
+    def handle(self, request):
+        path = request.path
+        if self.latency:
+            time.sleep(self.latency)
+        with self.lock:
+            failed = self.error_rate and self.random.random() < self.error_rate
+        if failed:
+            self.count("injected_error")
+            request.send_response(503)
+            request.end_headers()
+            return
+
+        parts = path.strip('/').split('/')
+        if path.endswith("manifest.json"):
+            self.count("manifest")
+            return self.send(request, json.dumps(self.manifest()).encode(), "application/json")
+        if parts[0] == "repos" and len(parts) >= 4 and parts[3] == "releases":
+            self.count("releases_api")
+            if parts[-1] == "latest":
+                return self.send(request, json.dumps(self.launcher_release(LAUNCHER_VERSION)).encode(),
+                                 "application/json")
+            return self.send(request, json.dumps(self.releases(parts[2])).encode(), "application/json")
+        if parts[0] == "github.com" and path.endswith(".zip"):
+            self.count("asset")
+            return self.send(request, self.asset, "application/zip", request.headers.get('Range'))
+
+        self.count("not_found")
+        request.send_response(404)
+        request.end_headers()
+
+    def send(self, request, data, content_type, byte_range=None):
+        status = 200
+        if byte_range:
+            start, end = byte_range.split('=')[1].split('-')
+            start = int(start)
+            end = int(end) if end else len(data) - 1
+            total = len(data)
+            data = data[start:end + 1]
+            status = 206
+        request.send_response(status)
+        request.send_header('Content-Type', content_type)
+        request.send_header('Content-Length', str(len(data)))
+        if status == 206:
+            request.send_header('Content-Range', f"bytes {start}-{end}/{total}")
+        request.end_headers()
+        try:
+            for offset in range(0, len(data), CHUNK_SIZE):
+                chunk = data[offset:offset + CHUNK_SIZE]
+                request.wfile.write(chunk)
+                if self.bandwidth:
+                    time.sleep(len(chunk) / self.bandwidth)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+
+
+LAUNCHER_VERSION = None
+
+
+def prepare_environment(workdir, api_url):
+    """Point the launcher at the fake server and a throwaway APPDATA before it is imported"""
+    os.environ["APPDATA"] = workdir
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    os.environ["QYPHER_GITHUB_API_URL"] = api_url
+    sys.path.insert(0, ROOT)
+
+
+def configure_launcher(qypher, manifest_repo, install_dir, use_workers):
+    # A separate organization keeps the real launcher settings untouched
+    from PySide6.QtCore import QSettings
+    qypher.ORGANIZATION = BENCH_ORGANIZATION
+    settings = QSettings(qypher.ORGANIZATION, qypher.APP_NAME)
+    settings.clear()
+    settings.setValue("manifest_repos", [manifest_repo])
+    settings.setValue("install_dir", install_dir)
+    settings.setValue("jobs/use_worker_process", use_workers)
+    settings.setValue("tray/low_memory", False)
+    settings.sync()
+    return settings
+
+
+def wait_until(app, condition, timeout=600):
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("Benchmark step did not finish in time")
+        app.processEvents()
+        time.sleep(0.002)
+
+
+def cold_start_child(manifest_repo, apps, install_dir):
+    """Import, build and show the launcher, report the first paint and once the catalog is populated"""
+    from PySide6.QtWidgets import QApplication
+    import Qypher
+    app = QApplication(sys.argv)
+    configure_launcher(Qypher, manifest_repo, install_dir, False)
+    launcher = Qypher.QypherLauncher()
+    launcher.show()
+    wait_until(app, lambda: launcher.first_painted)
+    print("window", flush=True)
+    wait_until(app, lambda: launcher.available_list.count() >= apps)
+    print("ready", flush=True)
+    os._exit(0)
+
+
+def measure_cold_start(fake, args, workdir):
+    """Median seconds from process start to the first paint and to a populated catalog"""
+    window_timings = []
+    timings = []
+    for run in range(args.repeat):
+        run_dir = os.path.join(workdir, f"cold{run}")
+        os.makedirs(run_dir)
+        env = dict(os.environ, APPDATA=run_dir)
+        start = time.perf_counter()
+        child = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--cold-start-child",
+                                  fake.manifest_repo, str(args.apps), os.path.join(run_dir, "Apps")],
+                                 stdout=subprocess.PIPE, env=env, text=True)
+        window_line = child.stdout.readline()
+        window_timings.append(time.perf_counter() - start)
+        line = child.stdout.readline()
+        timings.append(time.perf_counter() - start)
+        child.wait()
+        if window_line.strip() != "window" or line.strip() != "ready":
+            raise RuntimeError("Cold start child did not finish")
+    return statistics.median(window_timings), statistics.median(timings)
+
+
+def install_fake_apps(install_dir, apps, version):
+    for app in apps:
+        app_dir = os.path.join(install_dir, app.name)
+        os.makedirs(app_dir, exist_ok=True)
+        with open(os.path.join(app_dir, "app_info.json"), 'w') as f:
+            json.dump({'name': app.name, 'version': version, 'installed_path': app_dir,
+                       'executable': app.filename}, f)
+
+
+def run_benchmarks(args):
+    global LAUNCHER_VERSION
+    workdir = tempfile.mkdtemp(prefix="qypher-bench-")
+    fake = FakeGitHub(args.apps, args.latency / 1000.0, args.bandwidth, args.error_rate, args.asset_mb, args.seed)
+    prepare_environment(workdir, fake.base)
+    from PySide6.QtWidgets import QApplication
+    import Qypher
+    LAUNCHER_VERSION = Qypher.LAUNCHER_VERSION
+    fake.start()
+
+    results = {}
+    try:
+        results['time_to_window_s'], results['cold_start_s'] = measure_cold_start(fake, args, workdir)
+
+        app = QApplication.instance() or QApplication(sys.argv)
+        install_dir = os.path.join(workdir, "Apps")
+        configure_launcher(Qypher, fake.manifest_repo, install_dir, not args.in_process)
+        launcher = Qypher.QypherLauncher()
+        wait_until(app, lambda: launcher.available_list.count() >= args.apps)
+        wait_until(app, lambda: not launcher.manifest_update_thread.isRunning())
+        applications = launcher.catalog.applications
+
+        install_fake_apps(install_dir, applications, "v1.0.0")
+        launcher.scan_installed_apps()
+        timings = []
+        for _ in range(args.repeat):
+            # Every run starts without cached release data
+            Qypher.GITHUB.entries.clear()
+            shutil.rmtree(Qypher.GITHUB_CACHE, ignore_errors=True)
+            os.makedirs(Qypher.GITHUB_CACHE)
+            start = time.perf_counter()
+            launcher.check_manifest_updates()
+            wait_until(app, lambda: not launcher.manifest_update_thread.isRunning() and
+                       launcher.refresh_btn.isEnabled())
+            timings.append(time.perf_counter() - start)
+        results['update_check_s'] = statistics.median(timings)
+        results['updates_found'] = len(launcher.pending_updates)
+
+        # With every app installed each row also resolves its update marker from the release cache
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            launcher.populate_available_apps()
+            timings.append(time.perf_counter() - start)
+        results['catalog_population_s'] = statistics.median(timings)
+
+        for app_data in applications:
+            shutil.rmtree(os.path.join(install_dir, app_data.name), ignore_errors=True)
+        launcher.scan_installed_apps()
+
+        targets = applications[:args.installs]
+        start = time.perf_counter()
+        jobs = [launcher.job_scheduler.submit(
+            f"Benchmark install {app_data.name}",
+            lambda job, app_data=app_data: Qypher.run_job_action(
+                job, "install", app_data=app_data, version="v1.1.0", install_dir=install_dir),
+            kind="benchmark", app_name=app_data.name) for app_data in targets]
+        wait_until(app, lambda: all(not job.is_active for job in jobs))
+        elapsed = time.perf_counter() - start
+        failed = [job.message for job in jobs if job.state != Qypher.JOB_FINISHED]
+        results['install_mb_s'] = (len(jobs) - len(failed)) * len(fake.asset) / (1024 * 1024) / elapsed
+        results['install_failures'] = len(failed)
+
+        timings = []
+        for run in range(args.repeat):
+            app_data = applications[0].replace(name=f"ExtractBench{run}")
+            download = launcher.job_scheduler.submit(
+                "Benchmark download", lambda job, app_data=app_data: Qypher.run_job_action(
+                    job, "download", app_data=app_data, version="v1.1.0", install_dir=install_dir),
+                kind="benchmark", app_name=app_data.name)
+            wait_until(app, lambda: not download.is_active)
+            if download.state != Qypher.JOB_FINISHED:
+                continue
+            extract = launcher.job_scheduler.submit(
+                "Benchmark extract", lambda job, artifact=download.result: Qypher.run_job_action(
+                    job, "extract", artifact=artifact),
+                kind="benchmark", app_name=app_data.name)
+            wait_until(app, lambda: not extract.is_active)
+            if extract.state == Qypher.JOB_FINISHED:
+                timings.append(extract.elapsed)
+        results['extraction_s'] = statistics.median(timings) if timings else None
+
+        launcher.quit_application()
+        configure_launcher(Qypher, fake.manifest_repo, install_dir, False).clear()
+    finally:
+        fake.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    results['requests'] = dict(sorted(fake.requests.items()))
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print each metric next to the baseline, returns the names of regressed metrics"""
+    regressions = []
+    print(f"{'metric':<24}{'current':>12}{'baseline':>12}{'change':>10}")
+    for name, unit, higher_is_better in METRICS:
+        current = results.get(name)
+        previous = baseline.get('results', {}).get(name)
+        if current is None or not previous:
+            print(f"{name:<24}{format_value(current, unit):>12}{format_value(previous, unit):>12}")
+            continue
+        change = (current - previous) / previous
+        worse = -change if higher_is_better else change
+        flag = "  REGRESSION" if worse > tolerance else ""
+        print(f"{name:<24}{format_value(current, unit):>12}{format_value(previous, unit):>12}{change:>+10.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def format_value(value, unit):
+    if value is None:
+        return "-"
+    return f"{value:.3f} {unit}"
+
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(description="Benchmark the Qypher launcher against a local fake GitHub")
+    parser.add_argument("--apps", type=int, default=100, help="catalog size")
+    parser.add_argument("--installs", type=int, default=4, help="apps installed for the throughput run")
+    parser.add_argument("--asset-mb", type=float, default=4.0, help="uncompressed size of each release asset")
+    parser.add_argument("--latency", type=float, default=0.0, help="added latency per request in milliseconds")
+    parser.add_argument("--bandwidth", type=int, default=0, help="per-connection bandwidth in KB/s, 0 for unlimited")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per timing, the median is reported")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--in-process", action="store_true", help="run jobs in the GUI process instead of workers")
+    parser.add_argument("--save-baseline", metavar="NAME", help="store the results as a named baseline")
+    parser.add_argument("--compare", metavar="NAME", help="compare against a stored baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before flagging a regression")
+    parser.add_argument("--json", action="store_true", help="print the raw results as JSON")
+    parser.add_argument("--cold-start-child", nargs=3, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    if args.cold_start_child:
+        sys.path.insert(0, ROOT)
+        manifest_repo, apps, install_dir = args.cold_start_child
+        cold_start_child(manifest_repo, int(apps), install_dir)
+        return 0
+
+    results = run_benchmarks(args)
+    config = {key: getattr(args, key) for key in
+              ("apps", "installs", "asset_mb", "latency", "bandwidth", "error_rate", "repeat", "seed", "in_process")}
+    report = {'config': config, 'python': sys.version.split()[0], 'platform': sys.platform, 'results': results}
+
+    if args.json:
+        print(json.dumps(report, indent=4))
+
+    exit_code = 0
+    if args.compare:
+        with open(os.path.join(BASELINE_DIR, f"{args.compare}.json"), 'r') as f:
+            baseline = json.load(f)
+        if baseline.get('config') != config:
+            print("Warning: baseline was recorded with a different configuration")
+        exit_code = 1 if compare(results, baseline, args.tolerance) else 0
+    else:
+        compare(results, {}, args.tolerance)
+    print(f"requests: {results['requests']}")
+
+    if args.save_baseline:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        with open(os.path.join(BASELINE_DIR, f"{args.save_baseline}.json"), 'w') as f:
+            json.dump(report, f, indent=4)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+import time
+
+import pytest
+
+import Qypher
+from Qypher import BandwidthShaper, parse_bandwidth_schedule
+
+
+def limit_at(monkeypatch, schedule, weekday, hour, minute):
+    # 2024-01-01 was a Monday
+    when = time.struct_time((2024, 1, 1 + weekday, hour, minute, 0, weekday, 1 + weekday, -1))
+    monkeypatch.setattr(Qypher.time, "localtime", lambda *args: when)
+    shaper = BandwidthShaper()
+    shaper.configure(0, 0, parse_bandwidth_schedule(schedule))
+    return shaper.current_limit(Qypher.TRAFFIC_BACKGROUND) // 1024
+
+
+def test_parse_rules():
+    rules = parse_bandwidth_schedule("Mon-Fri 08:00-18:00 foreground=4096 background=256; "
+                                     "sat,sun 00:00-23:59 background=64")
+    assert rules == [({0, 1, 2, 3, 4}, 480, 1080, {'foreground': 4096, 'background': 256}),
+                     ({5, 6}, 0, 1439, {'background': 64})]
+    assert parse_bandwidth_schedule("Fri-Mon 22:00-06:00 background=1")[0][:3] == ({4, 5, 6, 0}, 1320, 360)
+
+
+@pytest.mark.parametrize("text", [
+    "Mon 25:00-06:00 background=1",
+    "Mon 08:99-18:00 background=1",
+    "Mon 25:99 background=1",
+    "Mon 08:00-18:00-19:00 background=1",
+    "Mon 08:00-08:00 background=1",
+    "Mon 8-18 background=1",
+    "Mon 08:00-18:00 sideways=1",
+    "Funday 08:00-18:00 background=1",
+])
+def test_parse_rejects_invalid_rules(text):
+    with pytest.raises(ValueError):
+        parse_bandwidth_schedule(text)
+
+
+def test_daytime_rule(monkeypatch):
+    schedule = "Mon-Fri 08:00-18:00 background=256"
+    assert limit_at(monkeypatch, schedule, 0, 8, 0) == 256
+    assert limit_at(monkeypatch, schedule, 0, 18, 0) == 0
+    assert limit_at(monkeypatch, schedule, 5, 12, 0) == 0
+
+
+def test_overnight_rule_runs_into_the_next_morning(monkeypatch):
+    schedule = "Mon-Fri 22:00-06:00 background=512"
+    assert limit_at(monkeypatch, schedule, 0, 23, 30) == 512
+    assert limit_at(monkeypatch, schedule, 1, 5, 59) == 512
+    assert limit_at(monkeypatch, schedule, 5, 3, 0) == 512
+    assert limit_at(monkeypatch, schedule, 0, 3, 0) == 0
+    assert limit_at(monkeypatch, schedule, 1, 6, 0) == 0
+    assert limit_at(monkeypatch, schedule, 5, 23, 0) == 0
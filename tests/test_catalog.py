@@ -0,0 +1,63 @@
+import pytest
+
+from Qypher import CatalogApp, mirror_urls, parse_manifest, resolve_download_url
+
+REPO = "someone/manifest"
+LATEST_URL = "https://github.com/someone/tool/releases/latest/download/tool.exe"
+
+
+def catalog_app(**entry):
+    entry.setdefault("name", "Tool")
+    entry.setdefault("url", LATEST_URL)
+    apps, problems = parse_manifest(REPO, {"applications": [entry]})
+    assert problems == []
+    return apps[entry["name"]]
+
+
+def test_resolve_download_url_pins_version():
+    assert resolve_download_url(LATEST_URL, "latest") == LATEST_URL
+    assert (resolve_download_url(LATEST_URL, "v1.2.0") ==
+            "https://github.com/someone/tool/releases/download/v1.2.0/tool.exe")
+    assert resolve_download_url("https://example.com/tool.exe", "v1.2.0") == "https://example.com/tool.exe"
+
+
+def test_mirror_urls_without_version_placeholder():
+    app = catalog_app(mirrors=[
+        "https://mirror.example.com/tool.exe",
+        "https://github.com/mirror/tool/releases/latest/download/tool.exe",
+    ])
+    assert mirror_urls(app, "latest", "v1.0.0") == [
+        "https://mirror.example.com/tool.exe",
+        "https://github.com/mirror/tool/releases/latest/download/tool.exe",
+    ]
+    assert mirror_urls(app, "v1.0.0", "v1.0.0") == [
+        "https://mirror.example.com/tool.exe",
+        "https://github.com/mirror/tool/releases/download/v1.0.0/tool.exe",
+    ]
+
+
+def test_mirror_urls_with_version_placeholder():
+    app = catalog_app(mirrors=["https://mirror.example.com/{version}/tool.exe"])
+    assert mirror_urls(app, "latest", "v2.0.0") == ["https://mirror.example.com/v2.0.0/tool.exe"]
+    assert mirror_urls(app, "latest", "latest") == []
+
+
+def test_parse_manifest_reports_bad_entries():
+    apps, problems = parse_manifest(REPO, {"applications": [
+        {"name": "Tool", "url": LATEST_URL},
+        {"name": "Tool", "url": LATEST_URL},
+        {"url": LATEST_URL},
+        "not an entry",
+    ]})
+    assert list(apps) == ["Tool"]
+    assert len(problems) == 3
+
+
+def test_catalog_app_is_immutable():
+    app = catalog_app()
+    with pytest.raises(AttributeError):
+        app.url = "https://example.com/other.exe"
+    changed = app.replace(url="https://example.com/other.exe")
+    assert changed.url == "https://example.com/other.exe"
+    assert app.url == LATEST_URL
+    assert CatalogApp.from_dict(app.to_dict()) == app
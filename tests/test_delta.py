@@ -0,0 +1,106 @@
+import os
+import random
+import struct
+import zlib
+
+import pytest
+
+import Qypher
+from Qypher import DELTA_MAGIC, apply_delta, apply_delta_file, make_delta, make_delta_file
+
+
+def sample(size, seed=0):
+    return random.Random(seed).randbytes(size)
+
+
+@pytest.mark.parametrize("old, new", [
+    (sample(4096), sample(4096)),
+    (sample(4096), sample(4096) + sample(1000, seed=1)),
+    (sample(4096), sample(37, seed=2) + sample(4096)),
+    (sample(4096), sample(2048) + sample(100, seed=3) + sample(4096)[2048:]),
+    (b"", sample(500)),
+    (sample(500), b""),
+    (b"", b""),
+])
+def test_round_trip(old, new):
+    assert apply_delta(old, make_delta(old, new)) == new
+
+
+def test_identical_data_is_mostly_copies():
+    data = sample(64 * 1024)
+    assert len(make_delta(data, data)) < 200
+
+
+def test_shifted_data_reuses_old_blocks():
+    old = sample(64 * 1024)
+    new = b"header" + old
+    assert len(make_delta(old, new)) < 1024
+
+
+def test_wrong_source_file_is_rejected():
+    old = sample(4096)
+    patch = make_delta(old, old + b"tail")
+    with pytest.raises(ValueError, match="does not apply"):
+        apply_delta(sample(4096, seed=9), patch)
+
+
+def test_not_a_patch():
+    with pytest.raises(ValueError, match="Not a Qypher delta patch"):
+        apply_delta(b"old", b"garbage")
+    with pytest.raises(ValueError, match="Not a Qypher delta patch"):
+        apply_delta(b"old", DELTA_MAGIC + b"short")
+
+
+def test_truncated_patch_is_rejected():
+    old = sample(4096)
+    patch = make_delta(old, old[:1000] + sample(300, seed=4) + old[1000:])
+    with pytest.raises(ValueError):
+        apply_delta(old, patch[:-5])
+
+
+def test_corrupt_compressed_data_is_rejected():
+    old = sample(4096)
+    patch = make_delta(old, old + b"tail")
+    header_size = len(DELTA_MAGIC) + 72
+    with pytest.raises(ValueError, match="Corrupt patch data"):
+        apply_delta(old, patch[:header_size] + b"\x00not zlib")
+
+
+def test_unknown_operation_is_rejected():
+    old = sample(1024)
+    patch = make_delta(old, old)
+    header_size = len(DELTA_MAGIC) + 72
+    with pytest.raises(ValueError, match="Corrupt patch operation"):
+        apply_delta(old, patch[:header_size] + zlib.compress(b"X"))
+
+
+def test_truncated_operation_is_rejected():
+    old = sample(1024)
+    patch = make_delta(old, old)
+    header_size = len(DELTA_MAGIC) + 72
+    ops = b"C" + struct.pack("<Q", 0)
+    with pytest.raises(ValueError, match="Truncated patch operation"):
+        apply_delta(old, patch[:header_size] + zlib.compress(ops))
+
+
+def test_tampered_output_is_rejected():
+    old = sample(1024)
+    new = old + b"appended"
+    patch = bytearray(make_delta(old, new))
+    patch[len(DELTA_MAGIC) + 32] ^= 0xFF
+    with pytest.raises(ValueError, match="target hash"):
+        apply_delta(old, bytes(patch))
+
+
+def test_file_helpers(tmp_path):
+    old_path = tmp_path / "old.bin"
+    new_path = tmp_path / "new.bin"
+    patch_path = tmp_path / "update.qdelta"
+    out_path = tmp_path / "out.bin"
+    old_path.write_bytes(sample(8192))
+    new_path.write_bytes(sample(8192)[:4000] + sample(50, seed=5) + sample(8192)[4000:])
+
+    assert make_delta_file(old_path, new_path, patch_path) == os.path.getsize(patch_path)
+    apply_delta_file(old_path, patch_path, out_path)
+    assert out_path.read_bytes() == new_path.read_bytes()
+    assert Qypher.file_sha256(str(out_path)) == Qypher.file_sha256(str(new_path))
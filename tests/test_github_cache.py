@@ -0,0 +1,27 @@
+import time
+
+import pytest
+
+from Qypher import GitHubClient
+
+API_URL = "https://api.github.com/repos/someone/tool/releases"
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    def no_network(*args, **kwargs):
+        raise AssertionError("unexpected request")
+    monkeypatch.setattr("requests.get", no_network)
+    github = GitHubClient(str(tmp_path))
+    github.set_token("")
+    return github
+
+
+def test_cached_only_without_entry_makes_no_request(client):
+    assert client.get_json(API_URL, cached_only=True) is None
+
+
+def test_cached_only_returns_stale_entry(client):
+    client.store_entry(API_URL, {'etag': None, 'fetched_at': time.time() - 10 ** 6, 'data': [{'tag_name': "v1"}]})
+    client.entries.clear()
+    assert client.get_json(API_URL, cached_only=True) == [{'tag_name': "v1"}]
@@ -0,0 +1,44 @@
+from Qypher import apply_manifest_delta, changed_manifest_entries
+
+
+def manifest(sequence, *entries):
+    return {'sequence': sequence, 'applications': [dict(entry) for entry in entries]}
+
+
+def test_apply_delta_adds_replaces_and_removes():
+    data = manifest(1, {'name': "A", 'revision': 1}, {'name': "B", 'revision': 1})
+    changed = apply_manifest_delta(data, {'sequence': 4, 'since': 1, 'changes': [
+        {'sequence': 2, 'name': "A", 'entry': {'name': "A", 'revision': 2}},
+        {'sequence': 3, 'name': "B", 'removed': True},
+        {'sequence': 4, 'name': "C", 'entry': {'name': "C", 'revision': 1}},
+    ]})
+    assert changed == ["A", "B", "C"]
+    assert data == manifest(4, {'name': "A", 'revision': 2}, {'name': "C", 'revision': 1})
+
+
+def test_apply_delta_skips_changes_without_a_name():
+    data = manifest(1, {'name': "A", 'revision': 1})
+    problems = []
+    changed = apply_manifest_delta(data, {'sequence': 5, 'since': 1, 'changes': [
+        {'sequence': 2, 'name': ["A"], 'entry': {'name': "A", 'revision': 9}},
+        {'sequence': 3, 'name': {'x': 1}, 'removed': True},
+        "not a change",
+        {'sequence': 5, 'name': "A", 'entry': {'name': "A", 'revision': 2}},
+    ]}, problems)
+    assert changed == ["A"]
+    assert data == manifest(5, {'name': "A", 'revision': 2})
+    assert problems == ["delta change 1 skipped, missing name", "delta change 2 skipped, missing name",
+                        "delta change 3 skipped, missing name"]
+
+
+def test_apply_delta_needs_the_whole_history():
+    data = manifest(1, {'name': "A"})
+    assert apply_manifest_delta(data, {'sequence': 9, 'since': 3, 'changes': []}) is None
+    assert apply_manifest_delta(data, {'sequence': 1, 'since': 0, 'changes': []}) == []
+
+
+def test_changed_entries_ignore_unhashable_names():
+    old = manifest(1, {'name': "A", 'revision': 1}, {'name': ["bad"], 'revision': 1})
+    new = {'sequence': 2, 'applications': [{'name': "A", 'revision': 2}, {'name': {'bad': 1}}, "not an entry"]}
+    assert changed_manifest_entries(old, new) == ["A"]
+    assert changed_manifest_entries({'applications': []}, new) is None
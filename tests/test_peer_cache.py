@@ -0,0 +1,69 @@
+import hashlib
+
+import pytest
+import requests
+
+import Qypher
+
+DATA = b"artifact bytes" * 1000
+SHA256 = hashlib.sha256(DATA).hexdigest()
+
+
+class FakeResponse:
+    def __init__(self, chunks, error=None):
+        self.headers = {'content-length': str(len(DATA))}
+        self.chunks = chunks
+        self.error = error
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        yield from self.chunks
+        if self.error:
+            raise self.error
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+@pytest.fixture
+def peers(monkeypatch):
+    responses = {}
+    monkeypatch.setattr(Qypher, "peer_urls", lambda: list(responses))
+    monkeypatch.setattr(Qypher, "request_from_peer", lambda peer, *args: responses[peer])
+    return responses
+
+
+def test_failed_peer_response_is_closed_before_the_next_peer(peers, tmp_path):
+    broken = FakeResponse([DATA[:100]], requests.ConnectionError("reset"))
+    working = FakeResponse([DATA])
+    peers.update({"http://peer-a": broken, "http://peer-b": working})
+    path = tmp_path / "artifact.zip"
+    assert Qypher.fetch_from_peers(SHA256, "zip", "https://github.com/o/r", str(path))
+    assert broken.closed and working.closed
+    assert path.read_bytes() == DATA
+
+
+def test_wrong_bytes_from_every_peer(peers, tmp_path):
+    response = FakeResponse([b"not the artifact"])
+    peers["http://peer-a"] = response
+    path = tmp_path / "artifact.zip"
+    assert not Qypher.fetch_from_peers(SHA256, "zip", "https://github.com/o/r", str(path))
+    assert response.closed
+    assert not path.exists()
+
+
+def test_cancelled_download_closes_the_response(peers, tmp_path):
+    response = FakeResponse([DATA])
+    peers["http://peer-a"] = response
+
+    def cancel():
+        raise Qypher.JobCancelled()
+    with pytest.raises(Qypher.JobCancelled):
+        Qypher.fetch_from_peers(SHA256, "zip", "https://github.com/o/r", str(tmp_path / "a.zip"), check=cancel)
+    assert response.closed
@@ -0,0 +1,54 @@
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+import Qypher
+from Qypher import ReleaseWatcher, latest_release
+
+RELEASES = [
+    {'tag_name': "v3.0.0-rc1", 'prerelease': True},
+    {'tag_name': "v3.0.0", 'draft': True},
+    {'tag_name': "v2.1.0"},
+    {'tag_name': "v2.0.0"},
+]
+
+
+def test_latest_release_skips_drafts_and_prereleases():
+    assert latest_release(RELEASES)['tag_name'] == "v2.1.0"
+    assert latest_release(RELEASES[:2]) is None
+    assert latest_release(None) is None
+    assert latest_release(["not a release", {'tag_name': "v1"}])['tag_name'] == "v1"
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def watcher(qt_app):
+    release_watcher = ReleaseWatcher()
+    release_watcher.checking = True
+    yield release_watcher
+    release_watcher.shutdown()
+
+
+def run_check(watcher, monkeypatch, releases):
+    results = []
+    monkeypatch.setattr(Qypher, "get_github_releases", lambda *args, **kwargs: releases)
+    watcher.release_checked.connect(lambda name, version: results.append((name, version)))
+    app_data = Qypher.CatalogApp.from_manifest(
+        {'name': "Tool", 'url': "https://github.com/someone/tool/releases/latest/download/tool.exe"}, "repo")
+    watcher.watch({"Tool": app_data})
+    watcher.check("Tool", app_data)
+    return results
+
+
+def test_check_reports_latest_stable_release(watcher, monkeypatch):
+    assert run_check(watcher, monkeypatch, RELEASES) == [("Tool", "v2.1.0")]
+    assert not watcher.checking
+
+
+@pytest.mark.parametrize("releases", [[], {'message': "Not Found"}, [None], [{'published_at': 5}]])
+def test_check_survives_bad_payloads(watcher, monkeypatch, releases):
+    assert run_check(watcher, monkeypatch, releases) == []
+    assert not watcher.checking
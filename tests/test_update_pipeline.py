@@ -0,0 +1,73 @@
+import json
+import os
+import sys
+
+import pytest
+
+import Qypher
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+from bench import FakeGitHub  # noqa: E402
+
+
+@pytest.fixture
+def fake_github(tmp_path, monkeypatch):
+    """A local GitHub stand-in that fresh worker processes talk to, with their data under tmp_path"""
+    fake = FakeGitHub(apps=2, asset_mb=0.1).start()
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    monkeypatch.setenv("QYPHER_GITHUB_API_URL", fake.base)
+    Qypher.WORKER_POOL.shutdown()
+    monkeypatch.setattr(Qypher.WORKER_POOL, "enabled", True)
+    yield fake
+    Qypher.WORKER_POOL.shutdown()
+    fake.stop()
+
+
+def catalog(fake):
+    apps, problems = Qypher.parse_manifest(fake.manifest_repo, fake.manifest())
+    assert problems == []
+    return list(apps.values())
+
+
+def run_job(func):
+    scheduler = Qypher.JobScheduler()
+    job = scheduler.submit("Test job", func, kind="update")
+    assert job.done_event.wait(120)
+    assert job.state == Qypher.JOB_FINISHED, job.message
+    return job.result
+
+
+def update_all(fake, install_dir):
+    updates = [(app_data, "v1.1.0") for app_data in catalog(fake)]
+    return run_job(lambda job: Qypher.update_all_applications(job, updates, str(install_dir)))
+
+
+def test_update_all_through_worker_processes_records_file_index(fake_github, tmp_path):
+    install_dir = tmp_path / "Apps"
+    results = update_all(fake_github, install_dir)
+    assert [result['status'] for result in results] == ["updated", "updated"]
+
+    for app_data in catalog(fake_github):
+        with open(install_dir / app_data.name / "app_info.json") as f:
+            app_info = json.load(f)
+        assert app_info['version'] == "v1.1.0"
+        assert len(app_info['files']) == 33
+        assert "app.exe" in app_info['files']
+
+
+def test_update_all_through_worker_processes_records_executable(fake_github, tmp_path):
+    install_dir = tmp_path / "Apps"
+    update_all(fake_github, install_dir)
+    for app_data in catalog(fake_github):
+        with open(install_dir / app_data.name / "app_info.json") as f:
+            app_info = json.load(f)
+        assert app_info['executable_path'] == "app.exe"
+        assert os.path.isfile(install_dir / app_data.name / app_info['executable_path'])
+
+
+def test_resolve_executable_finds_nested_programs():
+    files = {"README.txt": None, "bin/tool.exe": None, "bin/helper/updater.exe": None}
+    assert Qypher.resolve_executable(files, "tool.exe") == "bin/tool.exe"
+    assert Qypher.resolve_executable(files, "missing.exe") == "bin/tool.exe"
+    assert Qypher.resolve_executable({"Tool_v1.exe": None}, "tool.exe") == "Tool_v1.exe"
+    assert Qypher.resolve_executable({}, "tool.exe") is None
@@ -0,0 +1,57 @@
+import json
+import os
+
+import pytest
+
+import Qypher
+
+
+def verify(app_info, deep=False):
+    scheduler = Qypher.JobScheduler()
+    job = scheduler.submit("Verify", lambda job: Qypher.verify_application(job, app_info, deep), kind="verify")
+    assert job.done_event.wait(30)
+    assert job.state == Qypher.JOB_FINISHED, job.message
+    return job.result
+
+
+def install(tmp_path, files):
+    app_dir = tmp_path / "Tool"
+    (app_dir / "bin").mkdir(parents=True)
+    index = {}
+    for name, data in files.items():
+        path = app_dir / name
+        path.write_bytes(data)
+        index[name] = [len(data), os.stat(path).st_mtime_ns, Qypher.file_sha256(str(path))]
+    app_info = {'name': "Tool", 'version': "v1", 'installed_path': str(app_dir), 'executable': "app.exe",
+                'executable_path': "bin/app.exe", 'files': index}
+    (app_dir / "app_info.json").write_text(json.dumps(app_info))
+    return app_info
+
+
+@pytest.fixture
+def app_info(tmp_path):
+    return install(tmp_path, {"bin/app.exe": b"program", "data.txt": b"data"})
+
+
+def test_indexed_app_reports_damaged_files(app_info):
+    assert verify(app_info)['ok']
+    os.remove(os.path.join(app_info['installed_path'], "data.txt"))
+    report = verify(app_info)
+    assert not report['ok']
+    assert report['indexed']
+    assert report['damaged'] == ["data.txt"]
+
+
+@pytest.mark.parametrize("files", [{}, None])
+def test_empty_index_is_unindexed_and_checks_the_executable(tmp_path, files):
+    app_info = install(tmp_path, {"bin/app.exe": b"program"})
+    app_info['files'] = files
+    with open(os.path.join(app_info['installed_path'], "app_info.json"), 'w') as f:
+        json.dump(app_info, f)
+    report = verify(app_info)
+    assert report['ok'] and not report['indexed']
+
+    os.remove(os.path.join(app_info['installed_path'], "bin", "app.exe"))
+    report = verify(app_info)
+    assert not report['ok'] and not report['indexed']
+    assert report['problems'] == ["Executable bin/app.exe is missing"]